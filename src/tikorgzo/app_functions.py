@@ -1,32 +1,79 @@
+import gzip
 import pathlib
+import sys
+from collections.abc import Iterable, Iterator
+from typing import TextIO
 
+import aiohttp
 import requests
 
 from tikorgzo.cli.text_printer import console
-from tikorgzo.constants import DIRECT_EXTRACTOR_NAME, STATUS_OK, TIKWM_EXTRACTOR_NAME, DownloadStatus
+from tikorgzo.config.model import ConfigKey
+from tikorgzo.config.provider import ConfigProvider
+from tikorgzo.constants import DIRECT_EXTRACTOR_NAME, GZIP_MAGIC_NUMBER, STATUS_OK, STDIN_FILE_PATH, TIKWM_EXTRACTOR_NAME, DownloadStatus
+from tikorgzo.core.extractors.base import BaseExtractor
+from tikorgzo.core.extractors.chain import ExtractorChain
 from tikorgzo.core.extractors.direct.extractor import DirectExtractor
 from tikorgzo.core.extractors.tikwm.extractor import TikWMExtractor
+from tikorgzo.core.extractors.tikwm.sharded import ShardedTikWMExtractor, WorkerOptions, get_worker_profile_dir, split_extraction_delay
+from tikorgzo.core.rate_limiter.model import RateLimiter
 from tikorgzo.core.session.model import ClientSessionManager
+from tikorgzo.core.video.dedup import VideoLinkDeduplicator
 from tikorgzo.core.video.model import Video
 from tikorgzo.exceptions import ExtractorCreationError, InvalidProxyError, InvalidVideoLinkExtractionError
 
 
-def extract_video_links(file_path: str | None, links: list[str]) -> set[str]:
-    """Extracts the video links based from a list of strings or from a file."""
+def extract_video_links(file_path: str | None, links: list[str]) -> Iterator[str]:
+    """Extracts the video links lazily based from a list of strings or from a file.
+
+    The file is read line by line instead of all at once, so it can be arbitrarily large.
+    It can also be `-` to read the links from stdin, and gzip-compressed files are
+    decompressed on the fly.
+    """
 
     if file_path:
         try:
-            with pathlib.Path(file_path).open("r", encoding="utf-8") as f:
-                return {line.strip() for line in f if line.strip()}
+            return _read_video_links(_open_links_file(file_path))
         except FileNotFoundError as e:
             raise FileNotFoundError from e
 
     elif links:
-        return set(links)
+        return iter(links)
 
     raise InvalidVideoLinkExtractionError
 
 
+def deduplicate_video_links(video_links: Iterable[str], deduplicator: VideoLinkDeduplicator) -> Iterator[str]:
+    """Lazily filters out the video links that point to an already seen video."""
+
+    return (video_link for video_link in video_links if deduplicator.is_new(video_link))
+
+
+def _open_links_file(file_path: str) -> TextIO:
+    if file_path == STDIN_FILE_PATH:
+        return sys.stdin
+
+    path = pathlib.Path(file_path)
+
+    with path.open("rb") as f:
+        is_gzipped = f.read(len(GZIP_MAGIC_NUMBER)) == GZIP_MAGIC_NUMBER
+
+    if is_gzipped:
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open("r", encoding="utf-8")
+
+
+def _read_video_links(f: TextIO) -> Iterator[str]:
+    try:
+        for line in f:
+            video_link = line.strip()
+            if video_link:
+                yield video_link
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
 def is_proxy_valid(value: str) -> None:
     proxies = {
         "http": value,
@@ -46,19 +93,75 @@ def is_proxy_valid(value: str) -> None:
         raise InvalidProxyError(value) from e
 
 
-def get_extractor(
-        extractor: str,
-        extraction_delay: float,
-        proxy: str | None,
-        session: ClientSessionManager,
-) -> "TikWMExtractor | DirectExtractor":
+def get_extractor(config: ConfigProvider, session: ClientSessionManager) -> BaseExtractor:
+    """Creates the extractor set in the config, chained with the fallback extractor if one
+    is set as well.
+    """
+
+    extractor_name = config.get_value(ConfigKey.EXTRACTOR)
+    fallback_extractor_name = config.get_value(ConfigKey.FALLBACK_EXTRACTOR)
+    extractor = _create_extractor(extractor_name, config, session)
+
+    if fallback_extractor_name is None or fallback_extractor_name == extractor_name:
+        return extractor
+
+    return ExtractorChain(
+        extractor,
+        _create_extractor(fallback_extractor_name, config, session),
+        hedge=bool(config.get_value(ConfigKey.HEDGED_EXTRACTION)),
+    )
+
+
+def _create_extractor(extractor: str, config: ConfigProvider, session: ClientSessionManager) -> "TikWMExtractor | DirectExtractor":
+    # The extraction delay is the pace that the extractor's rate limiter starts at and never goes over
+    rate_limiter = session.rate_limiters.get(extractor, interval=config.get_value(ConfigKey.EXTRACTION_DELAY))
+
+    if extractor == TIKWM_EXTRACTOR_NAME and config.get_value(ConfigKey.EXTRACTION_WORKERS) > 1:
+        return _create_sharded_tikwm_extractor(config, rate_limiter)
     if extractor == TIKWM_EXTRACTOR_NAME:
-        return TikWMExtractor(extraction_delay, proxy=proxy)
-    if extractor == DIRECT_EXTRACTOR_NAME and isinstance(session.client_session, requests.Session):
-        return DirectExtractor(extraction_delay, session.client_session)
+        hybrid_session = None
+
+        if config.get_value(ConfigKey.HYBRID_EXTRACTION) and isinstance(session.client_session, aiohttp.ClientSession):
+            # The same session is used for downloading so the API requests go through the same
+            # proxy as the browser, which the bot check clearance is tied to
+            hybrid_session = session.client_session
+
+        return TikWMExtractor(
+            rate_limiter,
+            proxy=config.get_value(ConfigKey.PROXY),
+            hybrid_session=hybrid_session,
+            load_all_resources=config.get_value(ConfigKey.LOAD_ALL_RESOURCES),
+        )
+    if extractor == DIRECT_EXTRACTOR_NAME:
+        return DirectExtractor(rate_limiter, session.client_session)
     raise ExtractorCreationError
 
 
+def _create_sharded_tikwm_extractor(config: ConfigProvider, rate_limiter: RateLimiter) -> ShardedTikWMExtractor:
+    """Creates the TikWM extractor whose links are spread over the extraction workers, where
+    the worker proxies are handed out to the workers in turn, and the workers that share a
+    proxy split the pace of the extraction delay.
+    """
+
+    worker_proxies = [proxy.strip() for proxy in (config.get_value(ConfigKey.WORKER_PROXIES) or "").split(",") if proxy.strip()]
+    proxies: list[str | None] = [*worker_proxies] or [config.get_value(ConfigKey.PROXY)]
+    proxy_of_workers = [proxies[worker_index % len(proxies)] for worker_index in range(config.get_value(ConfigKey.EXTRACTION_WORKERS))]
+    extraction_delays = split_extraction_delay(proxy_of_workers, config.get_value(ConfigKey.EXTRACTION_DELAY))
+
+    worker_options = [
+        WorkerOptions(
+            user_data_dir=get_worker_profile_dir(worker_index),
+            proxy=proxy,
+            extraction_delay=extraction_delay,
+            hybrid_extraction=bool(config.get_value(ConfigKey.HYBRID_EXTRACTION)),
+            load_all_resources=bool(config.get_value(ConfigKey.LOAD_ALL_RESOURCES)),
+        )
+        for worker_index, (proxy, extraction_delay) in enumerate(zip(proxy_of_workers, extraction_delays, strict=True))
+    ]
+
+    return ShardedTikWMExtractor(rate_limiter, worker_options)
+
+
 def print_download_results(videos: list[Video]) -> None:
     unstarted_downloads = 0
     failed_downloads = 0
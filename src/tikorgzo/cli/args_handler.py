@@ -2,6 +2,7 @@ import argparse
 
 from rich_argparse import RichHelpFormatter
 
+from tikorgzo.constants import BROWSER_DAEMON_COMMAND
 from tikorgzo.utils import display_version
 
 
@@ -27,13 +28,34 @@ class ArgsHandler:
         )
         self._parser.add_argument(
             "-f", "--file",
-            help="A text file containing links",
+            help="A text file containing links (can be gzip-compressed, or '-' to read from stdin)",
         )
         self._parser.add_argument(
             "--extractor",
             help="Set the extractor to use for downloading videos (default: tikwm)",
             type=str,
         )
+        self._parser.add_argument(
+            "--fallback-extractor",
+            help="Set the extractor to retry a video with if the main extractor fails on it (default: none)",
+            type=str,
+        )
+        self._parser.add_argument(
+            "--hedged-extraction",
+            help="Also start the fallback extractor on a video once the main extractor takes longer than usual on it",
+            action="store_true",
+            default=None,
+        )
+        self._parser.add_argument(
+            "--extraction-workers",
+            help="Set the number of browser processes that share the extraction, each with its own Chrome profile (tikwm extractor only, default: 1)",
+            type=int,
+        )
+        self._parser.add_argument(
+            "--worker-proxies",
+            help="Set a comma-separated list of proxies, one for each extraction worker (default: the --proxy value)",
+            type=str,
+        )
         self._parser.add_argument(
             "--download-dir",
             help="Set the download directory (default: Downloads folder)",
@@ -44,6 +66,11 @@ class ArgsHandler:
             type=int,
             help="Set the maximum number of concurrent downloads (default: 4)",
         )
+        self._parser.add_argument(
+            "--download-segments",
+            type=int,
+            help="Download large videos over this many connections at once, each fetching its own part of the file (default: 1, i.e., off)",
+        )
         self._parser.add_argument(
             "--extraction-delay",
             help="Set the extraction delay (in seconds) between downloads to avoid rate limiting",
@@ -64,9 +91,55 @@ class ArgsHandler:
             help="Set a proxy for link extraction and video downloading",
             type=str,
         )
+        self._parser.add_argument(
+            "--pipeline",
+            help="Validate, extract, and download each video as soon as it's ready instead of stage by stage",
+            action="store_true",
+            default=None,
+        )
+        self._parser.add_argument(
+            "--hybrid-extraction",
+            help="Use the browser only to pass TikWM's bot check, then extract the links over plain HTTP (tikwm extractor only)",
+            action="store_true",
+            default=None,
+        )
+        self._parser.add_argument(
+            "--load-all-resources",
+            help="Let the browser load everything on the TikWM website (e.g., images and ads) instead of only what's needed (tikwm extractor only)",
+            action="store_true",
+            default=None,
+        )
+        self._parser.add_argument(
+            "--use-requests",
+            help="Use the older requests-based HTTP client instead of aiohttp, for compatibility",
+            action="store_true",
+            default=None,
+        )
+        self._parser.add_argument(
+            "--short-link-cache-ttl",
+            help="Set how long (in days) resolved vt.tiktok.com links are cached (default: 30)",
+            type=int,
+        )
+        self._parser.add_argument(
+            "--since",
+            help="Only download videos uploaded on or after this date (e.g., 2025-01-31, or 7d for 7 days ago)",
+            type=str,
+        )
+        self._parser.add_argument(
+            "--until",
+            help="Only download videos uploaded on or before this date (e.g., 2025-01-31, or 7d for 7 days ago)",
+            type=str,
+        )
         self._parser.add_argument(
             "-v",
             help="Show the app's version",
             action="version",
             version=display_version(),
         )
+
+        subparsers = self._parser.add_subparsers(dest="command", metavar="command")
+        subparsers.add_parser(
+            BROWSER_DAEMON_COMMAND,
+            help="Keep a browser running for the tikwm extractor, which the next runs attach to instead of launching their own",
+            formatter_class=RichHelpFormatter,
+        )
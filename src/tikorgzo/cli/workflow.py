@@ -1,6 +1,8 @@
 import asyncio
+import itertools
 import sys
 from argparse import Namespace
+from collections.abc import AsyncGenerator, Iterable, Iterator
 
 from playwright.async_api import Error as PlaywrightAsyncError
 from playwright.sync_api import Error as PlaywrightError
@@ -12,18 +14,32 @@ from tikorgzo.cli.text_printer import console
 from tikorgzo.config.constants import CONFIG_PATH_LOCATIONS
 from tikorgzo.config.model import ConfigKey
 from tikorgzo.config.provider import ConfigProvider
-from tikorgzo.constants import DownloadStatus
-from tikorgzo.core.download_manager.downloader import Downloader
+from tikorgzo.constants import BROWSER_DAEMON_COMMAND, PIPELINE_QUEUE_SIZE, DownloadStatus
+from tikorgzo.core.download_manager.downloader import Downloader, DownloadOptions
 from tikorgzo.core.download_manager.queue import DownloadQueueManager
 from tikorgzo.core.extractors.context_manager import ExtractorHandler
+from tikorgzo.core.extractors.result_cache import ExtractionResultCache
+from tikorgzo.core.extractors.tikwm.daemon import BrowserDaemon
 from tikorgzo.core.session.model import ClientSessionManager
-from tikorgzo.core.video.model import Video
+from tikorgzo.core.video.constants import RESOLUTION_BATCH_SIZE
+from tikorgzo.core.video.date_filter import UploadDateFilter
+from tikorgzo.core.video.dedup import VideoLinkDeduplicator
+from tikorgzo.core.video.index import DownloadIndex
+from tikorgzo.core.video.link_cache import ShortLinkCache
+from tikorgzo.core.video.model import Video, VideoOptions
+from tikorgzo.core.video.resolver import ShortLinkResolver
 
 
 async def main() -> None:
     ah = ArgsHandler()
     args = ah.parse_args()
 
+    if args.command == BROWSER_DAEMON_COMMAND:
+        config = _load_config(args)
+        _validate_proxy(config.get_value(ConfigKey.PROXY))
+        await _run_browser_daemon(config)
+        return
+
     # Show help/CLI welcome msg if no link or file argument is provided, then exit
     if not args.file and not args.link:
         ah.show_help()
@@ -33,15 +49,23 @@ async def main() -> None:
     video_links = _get_video_links(args.file, args.link)
     _validate_proxy(config.get_value(ConfigKey.PROXY))
 
+    if config.get_value(ConfigKey.PIPELINE):
+        await _run_pipeline(video_links, config)
+        return
+
     # Stage 1
-    download_queue = _validate_video_links(video_links, config)
+    download_queue = await _validate_video_links(video_links, config)
 
     if download_queue.is_empty():
         console.print("\nProgram will now stopped as there is nothing to process.")
         sys.exit(0)
 
+    # Links extracted in a previous run (e.g., one that failed midway the download) are reused
+    # from this cache while they're still fresh
+    result_cache = ExtractionResultCache(config.get_value(ConfigKey.EXTRACTOR), config.get_value(ConfigKey.FALLBACK_EXTRACTOR))
+
     # Stage 2
-    download_queue, session = await _extract_download_links(download_queue, config)
+    download_queue, session = await _extract_download_links(download_queue, config, result_cache)
 
     if download_queue.is_empty():
         console.print("\nThe program will now exit as no links were extracted.")
@@ -49,7 +73,7 @@ async def main() -> None:
         sys.exit(1)
 
     # Stage 3
-    await _download_videos(download_queue, config, session)
+    await _download_videos(download_queue, config, session, result_cache)
 
 
 def _load_config(args: Namespace) -> ConfigProvider:
@@ -69,7 +93,32 @@ def _load_config(args: Namespace) -> ConfigProvider:
     return config
 
 
-def _get_video_links(file_path: str, links: list[str]) -> set[str]:
+async def _run_browser_daemon(config: ConfigProvider) -> None:
+    """Keeps a browser running for the tikwm extractor until it's stopped with Ctrl+C or
+    its window is closed.
+    """
+
+    daemon = BrowserDaemon(proxy=config.get_value(ConfigKey.PROXY))
+
+    try:
+        with console.status("Starting browser daemon..."):
+            await daemon.initialize()
+    except exc.MissingChromeBrowserError:
+        console.print("[red]error:[/red] Google Chrome is not installed in your system. Please install it to proceed.")
+        sys.exit(1)
+    except exc.BrowserDaemonRunningError as e:
+        console.print(f"[red]error:[/red] {e}")
+        sys.exit(1)
+
+    try:
+        console.print("Browser daemon is running. The next runs of the app will use its browser. Press Ctrl+C to stop it.")
+        await daemon.serve()
+    finally:
+        await daemon.cleanup()
+        console.print("Browser daemon has been stopped.")
+
+
+def _get_video_links(file_path: str, links: list[str]) -> Iterator[str]:
     try:
         return fn.extract_video_links(file_path, links)
     except FileNotFoundError:
@@ -97,8 +146,8 @@ def _validate_proxy(proxy: str | None) -> None:
             sys.exit(1)
 
 
-def _validate_video_links(
-    video_links: set[str],
+async def _validate_video_links(
+    video_links: Iterable[str],
     config: ConfigProvider,
 ) -> DownloadQueueManager:
     """Stage 1 - validate each link and populate the download queue."""
@@ -106,59 +155,138 @@ def _validate_video_links(
 
     download_queue = DownloadQueueManager()
 
-    for idx, video_link in enumerate(video_links):
-        curr_pos = idx + 1
-        with console.status(f"Checking video {curr_pos} if already exist..."):
-            try:
-                video = Video(video_link=video_link, config=config)
-                video.download_status = DownloadStatus.QUEUED
+    with console.status("Indexing download directory..."):
+        options = _create_video_options(config)
+
+    with console.status("Resolving shortened video links...") as status:
+        async for curr_pos, video_link in _iter_unique_video_links(video_links, config, options.date_filter):
+            status.update(f"Checking video {curr_pos} if already exist...")
+            video = _create_video(curr_pos, video_link, options)
+
+            if video is not None:
                 download_queue.add(video)
-                console.print(f"Added video {curr_pos} ({video.video_id}) to download queue.")
-            except (
-                exc.InvalidVideoLinkError,
-                exc.VideoFileAlreadyExistsError,
-                exc.VideoIDExtractionError,
-            ) as e:
-                console.print(f"[gray50]Skipping video {curr_pos} due to: [orange1]{type(e).__name__}: {e}[/orange1][/gray50]")
-            except PlaywrightError:
-                sys.exit(1)
-            except Exception as e:
-                console.print(f"[gray50]Skipping video {curr_pos} due to: [orange1]{type(e).__name__}: {e}[/orange1][/gray50]")
 
+    _print_skipped_by_date(options.date_filter)
     return download_queue
 
 
+def _create_video_options(config: ConfigProvider) -> VideoOptions:
+    """Create the options shared by the videos of the run, along with their download index.
+
+    The download directory is indexed only once here so that checking each link for
+    duplicates doesn't need to walk the whole directory again. With `--lazy-duplicate-check`,
+    links aren't checked by video ID, so the index is only built once a lookup needs it.
+    """
+    options = VideoOptions.from_config(config, DownloadIndex(config.get_value(ConfigKey.DOWNLOAD_DIR)))
+
+    if not options.lazy_duplicate_check:
+        options.download_index.build()
+
+    return options
+
+
+def _print_skipped_by_date(date_filter: UploadDateFilter | None) -> None:
+    if date_filter is not None and date_filter.skipped_count > 0:
+        console.print(f"[gray50]Skipped {date_filter.skipped_count} videos uploaded outside of the set date range.[/gray50]")
+
+
+def _create_video(
+    curr_pos: int,
+    video_link: str,
+    options: VideoOptions,
+) -> Video | None:
+    """Create a queued `Video` from the link, or return None if it has to be skipped."""
+    try:
+        video = Video(video_link=video_link, options=options)
+        video.download_status = DownloadStatus.QUEUED
+        console.print(f"Added video {curr_pos} ({video.video_id if video.is_resolved else video.video_link}) to download queue.")
+        return video
+    except (
+        exc.InvalidVideoLinkError,
+        exc.UploadDateOutOfRangeError,
+        exc.VideoFileAlreadyExistsError,
+        exc.VideoIDExtractionError,
+    ) as e:
+        console.print(f"[gray50]Skipping video {curr_pos} due to: [orange1]{type(e).__name__}: {e}[/orange1][/gray50]")
+    except PlaywrightError:
+        sys.exit(1)
+    except Exception as e:
+        console.print(f"[gray50]Skipping video {curr_pos} due to: [orange1]{type(e).__name__}: {e}[/orange1][/gray50]")
+
+    return None
+
+
+async def _iter_unique_video_links(
+    video_links: Iterable[str],
+    config: ConfigProvider,
+    date_filter: UploadDateFilter | None,
+) -> AsyncGenerator[tuple[int, str]]:
+    """Lazily deduplicate the links by video ID and resolve the shortened ones a batch at a
+    time (using the short link cache from previous runs first), so that the links never have
+    to be held in memory all at once. Links that fail to resolve here are resolved again
+    (and reported) once their `Video` reaches extraction.
+
+    If a date range is set, links whose video ID shows that they are outside of it are
+    dropped before the batch is resolved, and resolved short links right after.
+
+    Yields:
+        tuple[int, str]: The position of each unique link and the link itself, resolved if possible.
+
+    """
+    deduplicator = VideoLinkDeduplicator()
+    cache = ShortLinkCache(ttl_days=config.get_value(ConfigKey.SHORT_LINK_CACHE_TTL))
+    resolver = ShortLinkResolver(proxy=config.get_value(ConfigKey.PROXY), cache=cache)
+    curr_pos = 0
+
+    try:
+        for unfiltered_batch in itertools.batched(fn.deduplicate_video_links(video_links, deduplicator), RESOLUTION_BATCH_SIZE):
+            batch = date_filter.filter_video_links(unfiltered_batch) if date_filter is not None else unfiltered_batch
+            resolved_links = await resolver.resolve_all(batch)
+            in_range_links = set(date_filter.filter_video_links(list(resolved_links.values()))) if date_filter is not None else None
+
+            for video_link in batch:
+                resolved_link = resolved_links.get(video_link)
+
+                # Different short links, or a short link and a normal link, may still point to
+                # the same video, which can only be known after they are resolved
+                if resolved_link is not None and not deduplicator.is_new(resolved_link):
+                    continue
+
+                if resolved_link is not None and in_range_links is not None and resolved_link not in in_range_links:
+                    continue
+
+                curr_pos += 1
+                yield curr_pos, resolved_link or video_link
+    finally:
+        cache.close()
+
+
 async def _extract_download_links(
     download_queue: DownloadQueueManager,
     config: ConfigProvider,
+    result_cache: ExtractionResultCache,
 ) -> tuple[DownloadQueueManager, ClientSessionManager]:
-    """Stage 2 - extract direct download URLs for every queued video."""
+    """Stage 2 - extract direct download URLs for every queued video. The extractor is only
+    initialized if some of the videos aren't in the result cache.
+    """
     console.print("\n[b]Stage 2/3[/b]: Download Link Extraction")
 
     session = ClientSessionManager(
-        extractor=config.get_value(ConfigKey.EXTRACTOR),
+        use_requests=config.get_value(ConfigKey.USE_REQUESTS),
         proxy=config.get_value(ConfigKey.PROXY),
     )
 
     try:
-        extractor = fn.get_extractor(
-            extractor=config.get_value(ConfigKey.EXTRACTOR),
-            extraction_delay=config.get_value(ConfigKey.EXTRACTION_DELAY),
-            proxy=config.get_value(ConfigKey.PROXY),
-            session=session,
-        )
-        await extractor.initialize()
+        extractor = fn.get_extractor(config, session)
 
         disallow_cleanup = bool(config.get_value(ConfigKey.EXTRACTOR) == 2)  # noqa: PLR2004
-        async with ExtractorHandler(extractor, disallow_cleanup=disallow_cleanup) as eh:
+        async with ExtractorHandler(extractor, disallow_cleanup=disallow_cleanup, result_cache=result_cache) as eh:
             with console.status(f"Extracting links from {download_queue.total()} videos..."):
-                results = await eh.process_video_links(download_queue.get_queue())
+                successful: list[Video] = []
 
-                successful = [
-                    video
-                    for video, result in zip(download_queue.get_queue(), results, strict=True)
-                    if not isinstance(result, BaseException)
-                ]
+                async for _, result in eh.process_video_links(download_queue.get_queue()):
+                    if not isinstance(result, Exception):
+                        successful.append(result)
 
             download_queue.replace_queue(successful)
     except exc.MissingChromeBrowserError:
@@ -184,6 +312,7 @@ async def _download_videos(
     download_queue: DownloadQueueManager,
     config: ConfigProvider,
     session: ClientSessionManager,
+    result_cache: ExtractionResultCache,
 ) -> None:
     """Stage 3 - download all successfully extracted videos."""
     console.print("\n[b]Stage 3/3[/b]: Download")
@@ -192,11 +321,141 @@ async def _download_videos(
     downloader = Downloader(
         session=session,
         videos=download_queue.get_queue(),
-        max_concurrent_downloads=config.get_value(ConfigKey.MAX_CONCURRENT_DOWNLOADS),
+        options=DownloadOptions.from_config(config),
+        result_cache=result_cache,
     )
 
     await downloader.process_videos()
 
+    try:
+        extractor = fn.get_extractor(config, session)
+        disallow_cleanup = bool(config.get_value(ConfigKey.EXTRACTOR) == 2)  # noqa: PLR2004
+
+        async with ExtractorHandler(extractor, disallow_cleanup=disallow_cleanup, result_cache=result_cache) as eh:
+            await _redownload_dead_link_videos(eh, downloader, result_cache)
+    except asyncio.CancelledError:
+        pass
+    except (Exception, PlaywrightAsyncError) as e:
+        console.print(f"[red]error:[/red] An unexpected error occurred while extracting dead download links again: {type(e).__name__}: {e}")
+
     downloader.cleanup_interrupted_downloads()
     fn.print_download_results(downloader.videos)
+    result_cache.close()
     await session.close()
+
+
+async def _run_pipeline(video_links: Iterable[str], config: ConfigProvider) -> None:
+    """Pipeline mode - run all three stages at once, where each video moves on to the next
+    stage as soon as it's done with the previous one instead of waiting for the whole batch.
+    Bounded queues between the stages keep the number of in-flight videos in check.
+    """
+    console.print("\n[b]Pipeline[/b]: Video Link/ID Validation, Download Link Extraction, and Download")
+
+    session = ClientSessionManager(
+        use_requests=config.get_value(ConfigKey.USE_REQUESTS),
+        proxy=config.get_value(ConfigKey.PROXY),
+    )
+
+    result_cache = ExtractionResultCache(config.get_value(ConfigKey.EXTRACTOR), config.get_value(ConfigKey.FALLBACK_EXTRACTOR))
+
+    # The extractor is only started once the first video that isn't in the result cache
+    # reaches it, which is where it fails if it can't be started
+    try:
+        eh = ExtractorHandler(fn.get_extractor(config, session), result_cache=result_cache)
+    except exc.ExtractorCreationError:
+        console.print("[red]error:[/red] Invalid extractor/extraction delay/session value provided for extractor creation.")
+        await session.close()
+        sys.exit(1)
+
+    downloader = Downloader(
+        session=session,
+        videos=[],
+        options=DownloadOptions.from_config(config),
+        result_cache=result_cache,
+    )
+    validated_queue: asyncio.Queue[Video | None] = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    extracted_queue: asyncio.Queue[Video | None] = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    pipeline_error: BaseException | None = None
+
+    async with eh:
+        downloader.progress_displayer.start()
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(_queue_video_links(video_links, config, validated_queue))
+                tg.create_task(eh.process_queue(validated_queue, extracted_queue))
+                tg.create_task(downloader.process_queue(extracted_queue))
+        except asyncio.CancelledError:
+            # Same as in `Downloader.process_videos()`, interrupted videos already have
+            # their status set, so we just proceed to the cleanup below
+            pass
+        except ExceptionGroup as e:
+            pipeline_error = e.exceptions[0]
+        finally:
+            downloader.progress_displayer.stop()
+
+        if pipeline_error is None:
+            try:
+                await _redownload_dead_link_videos(eh, downloader, result_cache)
+            except asyncio.CancelledError:
+                pass
+            except (Exception, PlaywrightAsyncError) as e:
+                pipeline_error = e
+
+    downloader.cleanup_interrupted_downloads()
+    fn.print_download_results(downloader.videos)
+    result_cache.close()
+    await session.close()
+
+    if pipeline_error is not None:
+        _print_pipeline_error(pipeline_error)
+        sys.exit(1)
+
+
+def _print_pipeline_error(e: BaseException) -> None:
+    if isinstance(e, exc.MissingChromeBrowserError):
+        console.print("[red]error:[/red] Google Chrome is not installed in your system. Please install it to proceed.")
+    else:
+        console.print(f"[red]error:[/red] An unexpected error occurred in the pipeline: {type(e).__name__}: {e}")
+
+
+async def _redownload_dead_link_videos(eh: ExtractorHandler, downloader: Downloader, result_cache: ExtractionResultCache) -> None:
+    """Extracts the videos whose cached download link turned out to be dead again, then
+    downloads them with their new link. Their cache entries are gone by now, and the new
+    links aren't taken from the cache, so this is only done once for each video.
+    """
+    videos = result_cache.take_dead_link_videos()
+
+    if not videos:
+        return
+
+    console.print(f"Extracting {len(videos)} videos again as their cached download links are dead...")
+    successful: list[Video] = []
+
+    async for _, result in eh.process_video_links(videos):
+        if not isinstance(result, Exception):
+            successful.append(result)
+
+    await downloader.process_videos(successful)
+
+
+async def _queue_video_links(
+    video_links: Iterable[str],
+    config: ConfigProvider,
+    validated_queue: "asyncio.Queue[Video | None]",
+) -> None:
+    """Validate the links and put each valid video into the queue right away, followed by a
+    `None` sentinel once all links are done.
+    """
+    options = _create_video_options(config)
+
+    # Short links are resolved a batch at a time so that the first videos can already
+    # be extracted and downloaded while the rest are still being resolved
+    async for curr_pos, video_link in _iter_unique_video_links(video_links, config, options.date_filter):
+        video = _create_video(curr_pos, video_link, options)
+
+        if video is not None:
+            await validated_queue.put(video)
+
+    _print_skipped_by_date(options.date_filter)
+    await validated_queue.put(None)
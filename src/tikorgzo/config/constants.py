@@ -32,6 +32,14 @@ CONFIG_VARIABLES: dict[str, dict[str, Any]] = {
             "max": 16,
         },
     },
+    "download_segments": {
+        "default": 1,
+        "type": int,
+        "constraints": {
+            "min": 1,
+            "max": 16,
+        },
+    },
     "filename_template": {
         "default": None,
         "type": str,
@@ -44,6 +52,59 @@ CONFIG_VARIABLES: dict[str, dict[str, Any]] = {
         "default": None,
         "type": str,
     },
+    "pipeline": {
+        "default": False,
+        "type": bool,
+    },
+    "hybrid_extraction": {
+        "default": False,
+        "type": bool,
+    },
+    "load_all_resources": {
+        "default": False,
+        "type": bool,
+    },
+    "fallback_extractor": {
+        "default": None,
+        "type": str,
+        "allowed_values": [TIKWM_EXTRACTOR_NAME, DIRECT_EXTRACTOR_NAME],
+    },
+    "hedged_extraction": {
+        "default": False,
+        "type": bool,
+    },
+    "extraction_workers": {
+        "default": 1,
+        "type": int,
+        "constraints": {
+            "min": 1,
+            "max": 8,
+        },
+    },
+    "worker_proxies": {
+        "default": None,
+        "type": str,
+    },
+    "use_requests": {
+        "default": False,
+        "type": bool,
+    },
+    "short_link_cache_ttl": {
+        "default": 30,
+        "type": int,
+        "constraints": {
+            "min": 1,
+            "max": 365,
+        },
+    },
+    "since": {
+        "default": None,
+        "type": str,
+    },
+    "until": {
+        "default": None,
+        "type": str,
+    },
 }
 
 DEFAULT_CONFIG_OPTS = {key: value["default"] for key, value in CONFIG_VARIABLES.items()}
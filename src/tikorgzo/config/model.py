@@ -8,6 +8,18 @@ class ConfigKey(StrEnum):
     DOWNLOAD_DIR = "download_dir"
     EXTRACTION_DELAY = "extraction_delay"
     MAX_CONCURRENT_DOWNLOADS = "max_concurrent_downloads"
+    DOWNLOAD_SEGMENTS = "download_segments"
     FILENAME_TEMPLATE = "filename_template"
     LAZY_DUPLICATE_CHECK = "lazy_duplicate_check"
     PROXY = "proxy"
+    PIPELINE = "pipeline"
+    HYBRID_EXTRACTION = "hybrid_extraction"
+    LOAD_ALL_RESOURCES = "load_all_resources"
+    USE_REQUESTS = "use_requests"
+    FALLBACK_EXTRACTOR = "fallback_extractor"
+    HEDGED_EXTRACTION = "hedged_extraction"
+    EXTRACTION_WORKERS = "extraction_workers"
+    WORKER_PROXIES = "worker_proxies"
+    SHORT_LINK_CACHE_TTL = "short_link_cache_ttl"
+    SINCE = "since"
+    UNTIL = "until"
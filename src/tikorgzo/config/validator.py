@@ -1,8 +1,10 @@
-import re
 from datetime import UTC, datetime
 
 from tikorgzo.config.constants import CONFIG_VARIABLES, MapSource
 from tikorgzo.config.model import ConfigKey
+from tikorgzo.core.video.constants import VIDEO_ID_PLACEHOLDER
+from tikorgzo.core.video.date_filter import parse_upload_date_bound
+from tikorgzo.core.video.filename_template import FilenameTemplate
 from tikorgzo.exceptions import InvalidConfigDataError
 
 
@@ -20,12 +22,27 @@ def validate_config(config_key: str, value: str | float | bool | None, source: M
     if config_key == ConfigKey.EXTRACTOR:
         assert isinstance(value, str)
         error_msg = is_invalid_extractor(value)
+    elif config_key == ConfigKey.FALLBACK_EXTRACTOR:
+        assert isinstance(value, str)
+        error_msg = is_invalid_fallback_extractor(value)
     elif config_key == ConfigKey.EXTRACTION_DELAY:
         assert isinstance(value, (int, float))
         error_msg = is_invalid_extraction_delay(value)
+    elif config_key == ConfigKey.EXTRACTION_WORKERS:
+        assert isinstance(value, int)
+        error_msg = is_invalid_extraction_workers(value)
     elif config_key == ConfigKey.MAX_CONCURRENT_DOWNLOADS:
         assert isinstance(value, int)
         error_msg = is_invalid_max_concurrent_downloads(value)
+    elif config_key == ConfigKey.DOWNLOAD_SEGMENTS:
+        assert isinstance(value, int)
+        error_msg = is_invalid_download_segments(value)
+    elif config_key == ConfigKey.SHORT_LINK_CACHE_TTL:
+        assert isinstance(value, int)
+        error_msg = is_invalid_short_link_cache_ttl(value)
+    elif config_key in {ConfigKey.SINCE, ConfigKey.UNTIL}:
+        assert isinstance(value, str)
+        error_msg = is_invalid_upload_date_bound(config_key, value)
     elif config_key == ConfigKey.FILENAME_TEMPLATE:
         assert isinstance(value, str) or value is None
         error_msg = is_invalid_filename_string(value)
@@ -59,6 +76,15 @@ def is_invalid_extractor(value: str) -> str | None:
     return None
 
 
+def is_invalid_fallback_extractor(value: str) -> str | None:
+    allowed_values = CONFIG_VARIABLES["fallback_extractor"]["allowed_values"]
+
+    if value not in allowed_values:
+        return f"[blue]'fallback_extractor'[/blue] must be one of the allowed values: {allowed_values}."
+
+    return None
+
+
 def is_invalid_extraction_delay(value: float) -> str | None:
     max_val = CONFIG_VARIABLES["extraction_delay"]["constraints"]["max"]
     min_val = CONFIG_VARIABLES["extraction_delay"]["constraints"]["min"]
@@ -69,6 +95,16 @@ def is_invalid_extraction_delay(value: float) -> str | None:
     return None
 
 
+def is_invalid_extraction_workers(value: int) -> str | None:
+    max_val = CONFIG_VARIABLES["extraction_workers"]["constraints"]["max"]
+    min_val = CONFIG_VARIABLES["extraction_workers"]["constraints"]["min"]
+
+    if value is not None and (value > max_val or value < min_val):
+        return f"[blue]'extraction_workers'[/blue] must be in the range of [green]{min_val} to {max_val}[/green]."
+
+    return None
+
+
 def is_invalid_max_concurrent_downloads(value: int) -> str | None:
     max_val = CONFIG_VARIABLES["max_concurrent_downloads"]["constraints"]["max"]
     min_val = CONFIG_VARIABLES["max_concurrent_downloads"]["constraints"]["min"]
@@ -79,32 +115,57 @@ def is_invalid_max_concurrent_downloads(value: int) -> str | None:
     return None
 
 
+def is_invalid_download_segments(value: int) -> str | None:
+    max_val = CONFIG_VARIABLES["download_segments"]["constraints"]["max"]
+    min_val = CONFIG_VARIABLES["download_segments"]["constraints"]["min"]
+
+    if value is not None and (value > max_val or value < min_val):
+        return f"[blue]'download_segments'[/blue] must be in the range of [green]{min_val} to {max_val}[/green]."
+
+    return None
+
+
+def is_invalid_short_link_cache_ttl(value: int) -> str | None:
+    max_val = CONFIG_VARIABLES["short_link_cache_ttl"]["constraints"]["max"]
+    min_val = CONFIG_VARIABLES["short_link_cache_ttl"]["constraints"]["min"]
+
+    if value is not None and (value > max_val or value < min_val):
+        return f"[blue]'short_link_cache_ttl'[/blue] must be in the range of [green]{min_val} to {max_val}[/green] days."
+
+    return None
+
+
+def is_invalid_upload_date_bound(config_key: str, value: str) -> str | None:
+    try:
+        parse_upload_date_bound(value)
+    except ValueError:
+        return f"[blue]'{config_key}'[/blue] must be a date ([green]YYYY-MM-DD[/green]), a date and time ([green]YYYY-MM-DDTHH:MM[/green]), or a number of days ago ([green]7d[/green])."
+
+    return None
+
+
 def is_invalid_filename_string(value: str | None) -> str | None:
     """If user uses `--filename-template` arg, this function checks if one of the necessary
-    placeholders is included. We iterate through the necessary placeholders
-    to check that arg (currently, there is only one required placeholder, but the loop
-    allows for easy extension if more are added in the future.).
+    placeholders is included and if every `{date:...}` placeholder has a usable format. The
+    template is checked in its compiled form, which is the same one used later to name the
+    downloaded videos.
     """
 
     if value is None:
         return None
 
-    placeholders = {
-        "necessary": ["{video_id}"],
-        "optional": ["{username}", r"({date:(.*?)})"],
-        # Do not use `r"{date:(.+?)}` as this accidentally spans across the filename_template
-        # string and might cause issues with how file is named. `*?` in this date regex ensures
-        # that it only captures the value inside the {date:...} and not outside of it
-    }
-
-    for placeholder in placeholders["necessary"]:
-        if placeholder not in value:
-            return f"'[blue]--filename-template[/blue]' does not contain one of the needed placeholders: [green]{placeholders['necessary']}[/green]'."
-
-    # Check if there is a `{date:...}` placeholder
-    matched_date = re.search(placeholders["optional"][1], value)
-    if matched_date:
-        date_fmt = matched_date.group(2)
+    necessary_placeholders = [VIDEO_ID_PLACEHOLDER]
+    template = FilenameTemplate.compile(value)
+
+    for placeholder in necessary_placeholders:
+        if not template.has_placeholder(placeholder):
+            needed = [f"{{{placeholder}}}" for placeholder in necessary_placeholders]
+            return f"'[blue]--filename-template[/blue]' does not contain one of the needed placeholders: [green]{needed}[/green]'."
+
+    # A plain `{date}` placeholder has no format (None) and uses the default date format
+    for date_fmt in template.date_formats:
+        if date_fmt is None:
+            continue
 
         if not date_fmt:
             return f"'[blue]--filename-template[/blue]' contains nothing in your '[green]{{date:{date_fmt}}}[/green]' placeholder."
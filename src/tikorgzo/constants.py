@@ -7,17 +7,41 @@ from platformdirs import user_data_path, user_downloads_path
 APP_NAME = "Tikorgzo"
 DOWNLOAD_PATH = Path(user_downloads_path()) / APP_NAME
 CHROME_USER_DATA_DIR = Path(user_data_path()) / APP_NAME / "chrome_user_data"
+SHORT_LINK_CACHE_PATH = Path(user_data_path()) / APP_NAME / "short_link_cache.db"
+EXTRACTION_RESULT_CACHE_PATH = Path(user_data_path()) / APP_NAME / "extraction_result_cache.db"
 DEFAULT_DATE_FORMAT = r"%Y%m%d_%H%M%S"
 
+# Link file related constants
+STDIN_FILE_PATH = "-"
+GZIP_MAGIC_NUMBER = b"\x1f\x8b"
+
 # TikTok constants
 TIKTOK_ID_LENGTH = 19
+# Video IDs are 64-bit, but the catalogs store them as signed 64-bit SQLite integers
+MAX_VIDEO_ID = 2**63 - 1
 
 # Extractor related constants
 TIKWM_EXTRACTOR_NAME = "tikwm"
 DIRECT_EXTRACTOR_NAME = "direct"
 
+# Subcommands
+BROWSER_DAEMON_COMMAND = "browser-daemon"
+
+# Pipeline related constants
+PIPELINE_QUEUE_SIZE = 32
 
 STATUS_OK = 200
+STATUS_PARTIAL_CONTENT = 206
+STATUS_FORBIDDEN = 403
+STATUS_NOT_FOUND = 404
+STATUS_GONE = 410
+STATUS_TOO_MANY_REQUESTS = 429
+STATUS_RANGE_NOT_SATISFIABLE = 416
+
+# Downloads are written to a part file next to the output file, along with a resume file
+# that tells how to continue it, until the download is complete
+PART_FILE_SUFFIX = ".part"
+RESUME_FILE_SUFFIX = ".resume"
 
 
 class DownloadStatus(Enum):
@@ -0,0 +1,46 @@
+CATALOG_FILE_NAME = ".tikorgzo_catalog.db"
+CATALOG_DB_TIMEOUT = 30
+SEEDED_AT_KEY = "seeded_at"
+SCANNED_AT_KEY = "scanned_at"
+
+CATALOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    video_id INTEGER NOT NULL,
+    output_path TEXT NOT NULL,
+    username TEXT,
+    upload_date TEXT,
+    file_size INTEGER,
+    width INTEGER,
+    height INTEGER,
+    bitrate INTEGER,
+    completed_at TEXT,
+    PRIMARY KEY (video_id, output_path)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_videos_output_path ON videos (output_path);
+CREATE INDEX IF NOT EXISTS idx_videos_username ON videos (username);
+CREATE INDEX IF NOT EXISTS idx_videos_upload_date ON videos (upload_date);
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+INSERT_VIDEO_QUERY = """
+INSERT OR REPLACE INTO videos
+    (video_id, output_path, username, upload_date, file_size, width, height, bitrate, completed_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# Files found by a scan don't replace what a download recorded about the same file
+INSERT_FOUND_VIDEO_QUERY = """
+INSERT OR IGNORE INTO videos
+    (video_id, output_path, username, upload_date, file_size, width, height, bitrate, completed_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+SELECT_BY_VIDEO_ID_QUERY = """
+SELECT video_id, output_path, username, upload_date, file_size, width, height, bitrate, completed_at
+FROM videos WHERE video_id = ?
+"""
+SELECT_BY_OUTPUT_PATH_QUERY = """
+SELECT video_id, output_path, username, upload_date, file_size, width, height, bitrate, completed_at
+FROM videos WHERE output_path = ?
+"""
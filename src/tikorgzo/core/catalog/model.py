@@ -0,0 +1,161 @@
+import sqlite3
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+from tikorgzo.core.catalog.constants import (
+    CATALOG_DB_TIMEOUT,
+    CATALOG_FILE_NAME,
+    CATALOG_SCHEMA,
+    INSERT_FOUND_VIDEO_QUERY,
+    INSERT_VIDEO_QUERY,
+    SCANNED_AT_KEY,
+    SEEDED_AT_KEY,
+    SELECT_BY_OUTPUT_PATH_QUERY,
+    SELECT_BY_VIDEO_ID_QUERY,
+)
+
+
+@dataclass
+class CatalogEntry:
+    # pylint: disable=too-many-instance-attributes
+    """A downloaded video as recorded in the download catalog.
+
+    `output_path` is relative to the download directory so that the catalog stays
+    valid even if the whole download directory is moved somewhere else.
+    """
+
+    video_id: int
+    output_path: Path
+    username: str | None = None
+    upload_date: datetime | None = None
+    file_size: int | None = None
+    width: int | None = None
+    height: int | None = None
+    bitrate: int | None = None
+    completed_at: datetime | None = None
+
+
+class DownloadCatalog:
+    """A persistent SQLite catalog of downloaded videos, stored inside the download directory.
+
+    This serves as the record of what has been downloaded so that duplicate checks are indexed
+    lookups instead of walking the whole download directory on every run.
+    """
+
+    def __init__(self, download_dir: Path) -> None:
+        self.download_dir = download_dir
+        self.catalog_path = download_dir / CATALOG_FILE_NAME
+        self._connection: sqlite3.Connection | None = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.catalog_path, timeout=CATALOG_DB_TIMEOUT)
+            self._connection.executescript(CATALOG_SCHEMA)
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def is_seeded(self) -> bool:
+        """Checks if the catalog has already been populated from a scan of the download directory."""
+
+        row = self.connection.execute("SELECT value FROM metadata WHERE key = ?", (SEEDED_AT_KEY,)).fetchone()
+        return row is not None
+
+    def mark_seeded(self) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+            (SEEDED_AT_KEY, datetime.now(tz=UTC).isoformat()),
+        )
+        self.connection.commit()
+
+    def get_scanned_at(self) -> float:
+        """Returns the Unix timestamp of when the download directory was last scanned, or 0
+        if it's never been recorded.
+        """
+
+        row = self.connection.execute("SELECT value FROM metadata WHERE key = ?", (SCANNED_AT_KEY,)).fetchone()
+        return float(row[0]) if row is not None else 0.0
+
+    def mark_scanned(self, scanned_at: float) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+            (SCANNED_AT_KEY, str(scanned_at)),
+        )
+        self.connection.commit()
+
+    def add(self, entry: CatalogEntry) -> None:
+        self.add_entries([entry])
+
+    def add_entries(self, entries: Iterable[CatalogEntry]) -> None:
+        self.connection.executemany(
+            INSERT_VIDEO_QUERY,
+            (self._to_row(entry) for entry in entries),
+        )
+        self.connection.commit()
+
+    def add_found_entries(self, entries: Iterable[CatalogEntry]) -> None:
+        """Records the files found by a scan of the download directory, keeping the entries
+        that are already recorded as they are.
+        """
+
+        self.connection.executemany(
+            INSERT_FOUND_VIDEO_QUERY,
+            (self._to_row(entry) for entry in entries),
+        )
+        self.connection.commit()
+
+    def find_by_video_id(self, video_id: int) -> list[CatalogEntry]:
+        rows = self.connection.execute(SELECT_BY_VIDEO_ID_QUERY, (video_id,)).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def find_by_output_path(self, output_path: Path) -> list[CatalogEntry]:
+        rows = self.connection.execute(SELECT_BY_OUTPUT_PATH_QUERY, (self._relative_path(output_path),)).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def remove(self, entry: CatalogEntry) -> None:
+        self.connection.execute(
+            "DELETE FROM videos WHERE video_id = ? AND output_path = ?",
+            (entry.video_id, self._relative_path(entry.output_path)),
+        )
+        self.connection.commit()
+
+    def get_absolute_path(self, entry: CatalogEntry) -> Path:
+        return self.download_dir / entry.output_path
+
+    def _relative_path(self, output_path: Path) -> str:
+        if output_path.is_relative_to(self.download_dir):
+            return output_path.relative_to(self.download_dir).as_posix()
+        return output_path.as_posix()
+
+    def _to_row(self, entry: CatalogEntry) -> tuple[int, str, str | None, str | None, int | None, int | None, int | None, int | None, str | None]:
+        return (
+            entry.video_id,
+            self._relative_path(entry.output_path),
+            entry.username,
+            entry.upload_date.isoformat() if entry.upload_date else None,
+            entry.file_size,
+            entry.width,
+            entry.height,
+            entry.bitrate,
+            entry.completed_at.isoformat() if entry.completed_at else None,
+        )
+
+    def _from_row(self, row: tuple[int, str, str | None, str | None, int | None, int | None, int | None, int | None, str | None]) -> CatalogEntry:
+        video_id, output_path, username, upload_date, file_size, width, height, bitrate, completed_at = row
+        return CatalogEntry(
+            video_id=video_id,
+            output_path=Path(output_path),
+            username=username,
+            upload_date=datetime.fromisoformat(upload_date) if upload_date else None,
+            file_size=file_size,
+            width=width,
+            height=height,
+            bitrate=bitrate,
+            completed_at=datetime.fromisoformat(completed_at) if completed_at else None,
+        )
@@ -1 +1,17 @@
 CHUNK_SIZE = 8192
+
+# How many times in a row a download is sent when it keeps getting rate limited or failing
+# without receiving anything, where the delay between the failed attempts grows with each one
+MAX_DOWNLOAD_ATTEMPTS = 5
+DOWNLOAD_RETRY_DELAY = 1.0
+
+# The `Content-Range` header of a response to a `Range` request, e.g., `bytes 1000-4999/5000`
+CONTENT_RANGE_REGEX = r"bytes (\d+)-\d+/(\d+|\*)"
+
+# Only videos of at least this size are split into segments, as smaller ones are done before
+# the extra connections pay off
+SEGMENTED_DOWNLOAD_MIN_SIZE = 16 * 1024 * 1024
+
+# How many segment connections all the segmented downloads may have open at once, so that
+# raising both the concurrent downloads and the segments doesn't flood the host
+MAX_SEGMENT_CONNECTIONS = 32
@@ -1,14 +1,41 @@
 import asyncio
-import os
+from dataclasses import dataclass
 
 import aiohttp
 from rich.progress import BarColumn, DownloadColumn, Progress, TextColumn, TimeRemainingColumn, TransferSpeedColumn
 
 from tikorgzo.cli.text_printer import console
+from tikorgzo.config.model import ConfigKey
+from tikorgzo.config.provider import ConfigProvider
 from tikorgzo.constants import DownloadStatus
+from tikorgzo.core.download_manager.partial import PartialDownload
 from tikorgzo.core.download_manager.strategies import AioHTTPDownloadStrategy, RequestsDownloadStrategy
+from tikorgzo.core.extractors.result_cache import ExtractionResultCache
 from tikorgzo.core.session.model import ClientSessionManager
 from tikorgzo.core.video.model import Video
+from tikorgzo.core.worker_pool.model import WorkerPool
+
+
+@dataclass(frozen=True, slots=True)
+class DownloadOptions:
+    """The options of how the videos of a run are downloaded.
+
+    Attributes:
+        max_concurrent_downloads (int): How many videos are downloaded at once.
+        download_segments (int): How many connections a large video is downloaded over,
+            where `1` downloads every video over a single connection.
+
+    """
+
+    max_concurrent_downloads: int = 4
+    download_segments: int = 1
+
+    @classmethod
+    def from_config(cls, config: ConfigProvider) -> "DownloadOptions":
+        return cls(
+            max_concurrent_downloads=config.get_value(ConfigKey.MAX_CONCURRENT_DOWNLOADS),
+            download_segments=config.get_value(ConfigKey.DOWNLOAD_SEGMENTS),
+        )
 
 
 class Downloader:
@@ -16,11 +43,14 @@ class Downloader:
         self,
         session: ClientSessionManager,
         videos: list[Video],
-        max_concurrent_downloads: int | None = None,
+        options: DownloadOptions | None = None,
+        result_cache: ExtractionResultCache | None = None,
     ) -> None:
         self.session = session
         self.videos = videos
-        self.semaphore = asyncio.Semaphore(4) if max_concurrent_downloads is None else asyncio.Semaphore(max_concurrent_downloads)
+        self.result_cache = result_cache
+        self.options = DownloadOptions() if options is None else options
+        self.semaphore = asyncio.Semaphore(self.options.max_concurrent_downloads)
         self.download_strategy = self._get_download_strategy()
         self.progress_displayer = Progress(
             TextColumn("{task.description}"),
@@ -31,12 +61,18 @@ class Downloader:
             console=console,
         )
 
-    async def process_videos(self) -> None:
+    async def process_videos(self, videos: list[Video] | None = None) -> None:
+        """Downloads the given videos, which are expected to be tracked already, or all the
+        tracked videos if none are given.
+        """
+
         self.progress_displayer.start()
-        download_tasks = [self.download(video) for video in self.videos]
+        pool = WorkerPool(self.download, self.options.max_concurrent_downloads)
 
         try:
-            await asyncio.gather(*download_tasks)
+            async for video, result in pool.imap(self.videos if videos is None else videos):
+                if isinstance(result, Exception):
+                    self._print_failed_download(video, result)
         except asyncio.CancelledError:
             # This is needed to capture KeyboardInterrupt or the Ctrl+C thing as we all know.
             # However, there is nothing need to do here since the handle of this exception
@@ -46,22 +82,58 @@ class Downloader:
         finally:
             self.progress_displayer.stop()
 
+    async def process_queue(self, queue: "asyncio.Queue[Video | None]") -> None:
+        """Downloads the videos from the queue as soon as they arrive until a `None` sentinel
+        is received. The progress display is expected to be started by the caller.
+        """
+
+        async def track_and_download(video: Video) -> None:
+            # Videos are tracked as soon as they start so that they can be cleaned up
+            # even if they get interrupted midway
+            self.videos.append(video)
+            await self.download(video)
+
+        pool = WorkerPool(track_and_download, self.options.max_concurrent_downloads)
+
+        async for video, result in pool.imap_queue(queue):
+            if isinstance(result, Exception):
+                self._print_failed_download(video, result)
+
     async def download(self, video: Video) -> None:
         async with self.semaphore:
             try:
-                await self.download_strategy.download(video, self.progress_displayer)
+                status_code = await self.download_strategy.download(video, self.progress_displayer)
+
+                if video.download_status == DownloadStatus.COMPLETED:
+                    video.download_index.add(video)
+
+                # A download that failed without an error got a bad status code, which is how
+                # an expired download link shows up
+                if self.result_cache is not None:
+                    self.result_cache.report_download(video, status_code)
             except (asyncio.CancelledError, Exception):
                 video.download_status = DownloadStatus.INTERRUPTED
                 raise
 
     def cleanup_interrupted_downloads(self) -> None:
+        """Removes what's left of the interrupted downloads that can't be continued. The others
+        are kept in their part files, so that the next run continues them instead of starting over.
+        """
+
         for video in self.videos:
-            if video.download_status == DownloadStatus.INTERRUPTED and os.path.exists(video.output_file_path):
-                os.remove(video.output_file_path)
+            if video.download_status == DownloadStatus.INTERRUPTED:
+                partial_download = PartialDownload(video.output_file_path)
+
+                if not partial_download.is_resumable():
+                    partial_download.discard()
+
+    def _print_failed_download(self, video: Video, e: Exception) -> None:
+        msg = f"[gray50]Failed to download {video.video_id} due to[/gray50]: [orange1]{type(e).__name__}: {e}[/orange1]"
+        self.progress_displayer.console.print(msg)
 
     def _get_download_strategy(self) -> AioHTTPDownloadStrategy | RequestsDownloadStrategy:
         """Return the appropriate download strategy based on the session type."""
 
         if isinstance(self.session.client_session, aiohttp.ClientSession):
-            return AioHTTPDownloadStrategy(self.session.client_session)
-        return RequestsDownloadStrategy(self.session.client_session)
+            return AioHTTPDownloadStrategy(self.session.client_session, self.session.rate_limiters, self.options.download_segments)
+        return RequestsDownloadStrategy(self.session.client_session, self.session.rate_limiters)
@@ -0,0 +1,227 @@
+import json
+import re
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from tikorgzo.constants import PART_FILE_SUFFIX, RESUME_FILE_SUFFIX, STATUS_PARTIAL_CONTENT
+from tikorgzo.core.download_manager.constants import CONTENT_RANGE_REGEX
+from tikorgzo.exceptions import IncompleteDownloadError
+
+
+@dataclass
+class ResumeState:
+    """What is needed to tell if the part file can be continued, as kept in the resume file.
+
+    Attributes:
+        total_size (int | None): The size of the whole file, if the server told it.
+        validator (str | None): The `ETag` (or `Last-Modified`) of the file, which the server
+            uses to send the whole file again instead of the rest if it has changed since.
+        segments (list[list[int]] | None): The `[start, end, position]` of each segment if the
+            file is downloaded in segments, where the end is exclusive and the position is
+            where the segment continues from.
+
+    """
+
+    total_size: int | None = None
+    validator: str | None = None
+    segments: list[list[int]] | None = None
+
+
+def get_segment_bounds(total_size: int, segment_count: int) -> list[tuple[int, int]]:
+    """Splits the file into byte ranges of about the same size, as `(start, end)` where the
+    end is exclusive.
+    """
+
+    segment_size = -(-total_size // segment_count)
+    return [(start, min(start + segment_size, total_size)) for start in range(0, total_size, segment_size)]
+
+
+def _get_validator(headers: Mapping[str, str]) -> str | None:
+    etag = headers.get("ETag")
+
+    # Weak ETags can't be used to continue a download
+    if etag and not etag.startswith("W/"):
+        return etag
+
+    return headers.get("Last-Modified")
+
+
+def _get_content_length(headers: Mapping[str, str]) -> int | None:
+    content_length = headers.get("Content-Length")
+    return int(content_length) if content_length and content_length.isdigit() else None
+
+
+class PartialDownload:
+    """A download that is written to a part file next to the output file, and only moved to
+    the output file once it's complete. A resume file is kept next to it so that an
+    interrupted download (even from a previous run) is continued with a `Range` request
+    instead of starting over.
+
+    Attributes:
+        output_file_path (Path): Where the video ends up once it's complete.
+        part_file_path (Path): Where the video is written while it's being downloaded.
+        resume_file_path (Path): Where the resume state of the part file is kept.
+        _state (ResumeState | None): The resume state of the part file, if there's one.
+
+    Args:
+        output_file_path (Path): The output file path of the video.
+
+    """
+
+    def __init__(self, output_file_path: Path) -> None:
+        self.output_file_path = output_file_path
+        self.part_file_path = output_file_path.with_name(output_file_path.name + PART_FILE_SUFFIX)
+        self.resume_file_path = self.part_file_path.with_name(self.part_file_path.name + RESUME_FILE_SUFFIX)
+        self._state = self._load_state()
+
+    def get_offset(self) -> int:
+        """Returns how much of the video has been written to the part file."""
+
+        try:
+            size = self.part_file_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+        # The part file of a segmented download is preallocated, so its size tells nothing
+        if self._state is not None and self._state.segments is not None:
+            return sum(position - start for start, _, position in self._state.segments)
+
+        return size
+
+    def is_resumable(self) -> bool:
+        return self._state is not None and self.get_offset() > 0
+
+    def get_range_headers(self, expected_size: float | None) -> dict[str, str]:
+        """Returns the headers that ask for the rest of the video, or no headers if the
+        download has to start over. The part file is dropped if its size doesn't match the
+        expected file size of the video, as it's of another version of the video then.
+        """
+
+        if self._state is None or not self.is_resumable():
+            return {}
+
+        # A segmented part file can't be continued as a single range
+        if self._state.segments is not None:
+            self.discard()
+            return {}
+
+        if expected_size is not None and self._state.total_size is not None and expected_size != self._state.total_size:
+            self.discard()
+            return {}
+
+        headers = {"Range": f"bytes={self.get_offset()}-"}
+
+        if self._state.validator:
+            headers["If-Range"] = self._state.validator
+
+        return headers
+
+    def start(self, status_code: int, headers: Mapping[str, str]) -> int:
+        """Starts writing the response, returning the offset that it starts from. If the
+        server sent the whole video instead of the rest of it, the part file starts over.
+
+        Raises:
+            IncompleteDownloadError: If the server sent a different part of the video than asked for.
+
+        """
+
+        if status_code == STATUS_PARTIAL_CONTENT:
+            offset = self.get_offset()
+
+            if not self.is_range_from(headers, offset):
+                self.discard()
+                raise IncompleteDownloadError(offset, None)
+
+            return offset
+
+        self._state = ResumeState(total_size=_get_content_length(headers), validator=_get_validator(headers))
+        self.part_file_path.write_bytes(b"")
+        self.save_state()
+        return 0
+
+    def start_segments(self, total_size: int, segment_count: int) -> list[list[int]]:
+        """Returns the `[start, end, position]` of each segment of the video, continuing the
+        segments of the part file if it has been split before, or preallocating a new part
+        file otherwise.
+        """
+
+        if self._state is not None and self._state.segments is not None and self._state.total_size == total_size and self.part_file_path.exists() and self.part_file_path.stat().st_size == total_size:
+            return self._state.segments
+
+        with Path.open(self.part_file_path, "wb") as part_file:
+            part_file.truncate(total_size)
+
+        segments = [[start, end, start] for start, end in get_segment_bounds(total_size, segment_count)]
+        self._state = ResumeState(total_size=total_size, segments=segments)
+        self.save_state()
+        return segments
+
+    def get_segment_headers(self, segment: list[int]) -> dict[str, str]:
+        """Returns the headers that ask for the rest of the segment."""
+
+        _, end, position = segment
+        headers = {"Range": f"bytes={position}-{end - 1}"}
+
+        if self._state is not None and self._state.validator:
+            headers["If-Range"] = self._state.validator
+
+        return headers
+
+    def set_validator(self, headers: Mapping[str, str]) -> None:
+        """Keeps the validator of the file from the first response of a segmented download."""
+
+        if self._state is not None and self._state.validator is None:
+            self._state.validator = _get_validator(headers)
+
+    @staticmethod
+    def is_range_from(headers: Mapping[str, str], position: int) -> bool:
+        """Checks if the `Content-Range` of a partial response starts at the position."""
+
+        matched_range = re.fullmatch(CONTENT_RANGE_REGEX, headers.get("Content-Range", ""))
+        return matched_range is not None and int(matched_range.group(1)) == position
+
+    @staticmethod
+    def get_range_total(headers: Mapping[str, str]) -> int | None:
+        """Returns the size of the whole file that the `Content-Range` of a partial response
+        tells, if it tells one.
+        """
+
+        matched_range = re.fullmatch(CONTENT_RANGE_REGEX, headers.get("Content-Range", ""))
+        return int(matched_range.group(2)) if matched_range is not None and matched_range.group(2).isdigit() else None
+
+    def save_state(self) -> None:
+        if self._state is not None:
+            self.resume_file_path.write_text(json.dumps(asdict(self._state)), encoding="utf-8")
+
+    def complete(self) -> None:
+        """Moves the part file to the output file once the whole video has been written.
+
+        Raises:
+            IncompleteDownloadError: If the part file is still missing some of the video.
+
+        """
+
+        offset = self.get_offset()
+        total_size = self._state.total_size if self._state is not None else None
+
+        if total_size is not None and offset != total_size:
+            if offset > total_size:
+                self.discard()
+            raise IncompleteDownloadError(offset, total_size)
+
+        self.part_file_path.replace(self.output_file_path)
+        self.resume_file_path.unlink(missing_ok=True)
+
+    def discard(self) -> None:
+        self.part_file_path.unlink(missing_ok=True)
+        self.resume_file_path.unlink(missing_ok=True)
+        self._state = None
+
+    def _load_state(self) -> ResumeState | None:
+        try:
+            with Path.open(self.resume_file_path, encoding="utf-8") as resume_file:
+                return ResumeState(**json.load(resume_file))
+        except (OSError, ValueError, TypeError):
+            # The resume file is missing or unreadable, so the download starts over
+            return None
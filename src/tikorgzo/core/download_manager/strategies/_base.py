@@ -1,16 +1,152 @@
+import asyncio
 from abc import ABC, abstractmethod
+from urllib.parse import urlsplit
 
-from rich.progress import Progress
+from rich.progress import Progress, TaskID
 
+from tikorgzo.constants import STATUS_OK, STATUS_PARTIAL_CONTENT, STATUS_RANGE_NOT_SATISFIABLE, STATUS_TOO_MANY_REQUESTS, DownloadStatus
+from tikorgzo.core.download_manager.constants import DOWNLOAD_RETRY_DELAY, MAX_DOWNLOAD_ATTEMPTS
+from tikorgzo.core.download_manager.partial import PartialDownload
+from tikorgzo.core.rate_limiter.helpers import parse_retry_after
+from tikorgzo.core.rate_limiter.model import RateLimiter, RateLimiterRegistry
 from tikorgzo.core.video.model import Video
+from tikorgzo.exceptions import IncompleteDownloadError
+
+DOWNLOADED_STATUSES = (STATUS_OK, STATUS_PARTIAL_CONTENT)
 
 
 class BaseDownloadStrategy(ABC):
-    """Abstract base model for download strategies."""
+    """Abstract base model for download strategies.
+
+    The downloads are paced by the rate limiter of their host, which only starts pacing
+    them once the host rate limits a download.
+
+    Each video is written to a part file that is only moved to the output file once it's
+    complete. If the download fails midway due to a network error, it's sent again for the
+    rest of the video, where only the attempts in a row that don't get any further count
+    towards the limit. An interrupted download is also continued by the next run.
+    """
+
+    # The errors that may go away if the download is sent again
+    transient_errors: tuple[type[Exception], ...] = (IncompleteDownloadError,)
+    retry_delay: float = DOWNLOAD_RETRY_DELAY
+
+    def __init__(self, rate_limiters: RateLimiterRegistry) -> None:
+        self.rate_limiters = rate_limiters
+        self._progress_tasks: dict[int, TaskID] = {}
+
+    async def download(self, video: Video, progress: Progress) -> int:
+        """Download the video and update the progress display. Returns the status code that
+        the download ended with.
+        """
+
+        rate_limiter = self._get_rate_limiter(video)
+        partial_download = PartialDownload(video.output_file_path)
+        failed_attempts = 0
+
+        try:
+            while True:
+                await rate_limiter.acquire()
+                offset = partial_download.get_offset()
+
+                try:
+                    status_code, retry_after = await self._download_once(video, partial_download, progress)
+                    if status_code in DOWNLOADED_STATUSES:
+                        partial_download.complete()
+                except self.transient_errors:
+                    failed_attempts = 0 if partial_download.get_offset() > offset else failed_attempts + 1
+                    if failed_attempts >= MAX_DOWNLOAD_ATTEMPTS:
+                        raise
+                    await asyncio.sleep(self.retry_delay * failed_attempts)
+                    continue
+
+                if not self._should_send_again(partial_download, rate_limiter, (status_code, retry_after), failed_attempts):
+                    break
+
+                failed_attempts += 1
+        finally:
+            self._progress_tasks.pop(video.video_id, None)
+
+        if status_code in DOWNLOADED_STATUSES:
+            video.download_status = DownloadStatus.COMPLETED
+        else:
+            video.download_status = DownloadStatus.INTERRUPTED
+            self._print_failed_status(video, status_code, progress)
+
+        return status_code
 
     @abstractmethod
-    async def download(self, video: Video, progress: Progress) -> None:
-        """Download the video and update the progress display."""
+    async def _download_once(self, video: Video, partial_download: PartialDownload, progress: Progress) -> tuple[int, str | None]:
+        """Sends the download request for the rest of the video, writing the response to the
+        part file if it's a successful one. Returns the status code and the `Retry-After`
+        header of the response.
+        """
+
+    def _should_send_again(
+        self,
+        partial_download: PartialDownload,
+        rate_limiter: RateLimiter,
+        response: tuple[int, str | None],
+        attempt: int,
+    ) -> bool:
+        """Tells the rate limiter how the download request went, returning True if the
+        download has to be sent again.
+        """
+
+        status_code, retry_after = response
+
+        if status_code in DOWNLOADED_STATUSES:
+            rate_limiter.on_success()
+            return False
+
+        if status_code == STATUS_RANGE_NOT_SATISFIABLE:
+            # The part file doesn't fit the video anymore, so the download starts over
+            partial_download.discard()
+            return attempt + 1 < MAX_DOWNLOAD_ATTEMPTS
+
+        return self._should_retry(rate_limiter, status_code, retry_after, attempt)
+
+    def _start_progress(self, video: Video, progress: Progress, total_size: float | None, offset: int) -> TaskID:
+        """Returns the progress display task of the video, which is kept between the attempts
+        so that a continued download picks up where its progress bar left off.
+        """
+
+        task = self._progress_tasks.get(video.video_id)
+
+        if task is None:
+            task = progress.add_task(str(video.video_id), total=total_size, completed=offset)
+            self._progress_tasks[video.video_id] = task
+        else:
+            progress.update(task, total=total_size, completed=offset)
+
+        return task
+
+    def _get_rate_limiter(self, video: Video) -> RateLimiter:
+        return self.rate_limiters.get(urlsplit(video.download_link).netloc)
+
+    @staticmethod
+    def _should_retry(rate_limiter: RateLimiter, status_code: int, retry_after: str | None, attempt: int) -> bool:
+        """Tells the rate limiter how the download request went, returning True if it got rate
+        limited and can still be sent again.
+        """
+
+        if status_code == STATUS_TOO_MANY_REQUESTS:
+            rate_limiter.on_rate_limited(parse_retry_after(retry_after))
+            return attempt + 1 < MAX_DOWNLOAD_ATTEMPTS
+
+        return False
+
+    @staticmethod
+    def _get_total_size(video: Video, content_length: int | None) -> float | None:
+        """Returns the file size of the video to show in the progress display. If the extractor
+        didn't know the file size, the `Content-Length` of the download response is used (and
+        kept), so the file size never needs its own request.
+        """
+
+        if video.file_size.size_in_bytes is None and content_length is not None:
+            video.file_size = float(content_length)
+
+        return video.file_size.size_in_bytes
 
     @staticmethod
     def _print_failed_status(video: Video, status_code: int, progress: Progress) -> None:
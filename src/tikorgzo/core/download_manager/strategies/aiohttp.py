@@ -1,34 +1,167 @@
+import asyncio
+from dataclasses import dataclass
+
 import aiofiles
 import aiohttp
-from rich.progress import Progress
+from rich.progress import Progress, TaskID
 
-from tikorgzo.constants import STATUS_OK, DownloadStatus
-from tikorgzo.core.download_manager.constants import CHUNK_SIZE
-from tikorgzo.core.download_manager.strategies._base import BaseDownloadStrategy
+from tikorgzo.constants import STATUS_OK, STATUS_PARTIAL_CONTENT
+from tikorgzo.core.download_manager.constants import CHUNK_SIZE, MAX_SEGMENT_CONNECTIONS, SEGMENTED_DOWNLOAD_MIN_SIZE
+from tikorgzo.core.download_manager.partial import PartialDownload
+from tikorgzo.core.download_manager.strategies._base import DOWNLOADED_STATUSES, BaseDownloadStrategy
+from tikorgzo.core.rate_limiter.model import RateLimiterRegistry
 from tikorgzo.core.video.model import Video
+from tikorgzo.exceptions import IncompleteDownloadError
+
+
+@dataclass(frozen=True, slots=True)
+class SegmentedTransfer:
+    """What the segments of a segmented download share while they're being written.
+
+    Attributes:
+        partial_download (PartialDownload): The part file that the segments are written to.
+        total_size (int): The size of the whole video.
+        progress (Progress): The progress display.
+        task (TaskID): The progress display task of the video, which every segment advances.
+
+    """
+
+    partial_download: PartialDownload
+    total_size: int
+    progress: Progress
+    task: TaskID
 
 
 class AioHTTPDownloadStrategy(BaseDownloadStrategy):
-    """Downloads a video using an aiohttp session."""
+    """Downloads a video using an aiohttp session.
+
+    If segments are set, the videos of at least `SEGMENTED_DOWNLOAD_MIN_SIZE` are split into
+    byte ranges that are downloaded over their own connections at once, each written at its
+    offset in a preallocated part file. The segment connections of all the downloads are
+    capped by `MAX_SEGMENT_CONNECTIONS`. A server that doesn't support ranges sends the whole
+    video to the first segment's request, which is then downloaded over that connection alone.
+    """
+
+    transient_errors = (*BaseDownloadStrategy.transient_errors, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, TimeoutError)
 
-    def __init__(self, session: aiohttp.ClientSession) -> None:
+    def __init__(self, session: aiohttp.ClientSession, rate_limiters: RateLimiterRegistry, segments: int = 1) -> None:
         self.session = session
+        self.segments = segments
+        self._segment_connections = asyncio.Semaphore(MAX_SEGMENT_CONNECTIONS)
+        super().__init__(rate_limiters)
+
+    async def _download_once(self, video: Video, partial_download: PartialDownload, progress: Progress) -> tuple[int, str | None]:
+        file_size = video.file_size.size_in_bytes
+
+        if self.segments > 1 and file_size is not None and file_size >= SEGMENTED_DOWNLOAD_MIN_SIZE:
+            return await self._download_segments(video, partial_download, progress, int(file_size))
+
+        headers = partial_download.get_range_headers(file_size)
+
+        async with self.session.get(video.download_link, headers=headers) as response:
+            if response.status in DOWNLOADED_STATUSES:
+                await self._write_response(video, response, partial_download, progress)
+
+            return response.status, response.headers.get("Retry-After")
+
+    async def _write_response(self, video: Video, response: aiohttp.ClientResponse, partial_download: PartialDownload, progress: Progress) -> None:
+        offset = partial_download.start(response.status, response.headers)
+        total_size = self._get_total_size(video, offset + response.content_length if response.content_length is not None else None)
+
+        task = self._start_progress(video, progress, total_size, offset)
+        async with aiofiles.open(partial_download.part_file_path, "ab") as output_file:
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                if chunk:
+                    await output_file.write(chunk)
+                    progress.update(task, advance=len(chunk))
+
+    async def _download_segments(self, video: Video, partial_download: PartialDownload, progress: Progress, total_size: int) -> tuple[int, str | None]:
+        """Downloads the unfinished segments of the video at once. The first one is requested
+        on its own, so that the other connections are only opened once the server has shown
+        that it supports ranges and told the real size of the video. If that size isn't the
+        expected one, the video is downloaded again by its real size.
+        """
+
+        segments = [segment for segment in partial_download.start_segments(total_size, self.segments) if segment[2] < segment[1]]
+
+        if not segments:
+            return STATUS_PARTIAL_CONTENT, None
+
+        async with self._segment_connections, self.session.get(video.download_link, headers=partial_download.get_segment_headers(segments[0])) as response:
+            if response.status == STATUS_OK:
+                # The server ignored the range, so the whole video comes over this connection
+                await self._write_response(video, response, partial_download, progress)
+
+            if response.status != STATUS_PARTIAL_CONTENT:
+                return response.status, response.headers.get("Retry-After")
+
+            real_size = PartialDownload.get_range_total(response.headers)
+
+            if real_size is None or real_size == total_size:
+                partial_download.set_validator(response.headers)
+                task = self._start_progress(video, progress, total_size, partial_download.get_offset())
+                transfer = SegmentedTransfer(partial_download, total_size, progress, task)
+
+                await self._write_segments(video, transfer, response, segments)
+                return STATUS_PARTIAL_CONTENT, None
+
+        # The segments were split by a wrong size, so they're split again by the real size
+        # (or the video is downloaded over one connection if it turns out to be small)
+        partial_download.discard()
+        video.file_size = float(real_size)
+        return await self._download_once(video, partial_download, progress)
+
+    async def _write_segments(self, video: Video, transfer: SegmentedTransfer, response: aiohttp.ClientResponse, segments: list[list[int]]) -> None:
+        """Writes the response of the first segment while the other segments are downloaded
+        over their own connections.
+        """
+
+        first_segment, *other_segments = segments
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                task_group.create_task(self._write_segment(transfer, first_segment, response))
+                for segment in other_segments:
+                    task_group.create_task(self._download_segment(video, transfer, segment))
+        except ExceptionGroup as e:
+            # The first error is raised on its own, so that it's retried like the errors
+            # of a download over a single connection
+            raise e.exceptions[0] from None
+        finally:
+            transfer.partial_download.save_state()
+
+    async def _download_segment(self, video: Video, transfer: SegmentedTransfer, segment: list[int]) -> None:
+        headers = transfer.partial_download.get_segment_headers(segment)
+
+        async with self._segment_connections, self.session.get(video.download_link, headers=headers) as response:
+            # Anything but the asked range (e.g., the file changed since the first segment's
+            # request) fails the attempt, and the next one finds out what the server sends
+            if response.status != STATUS_PARTIAL_CONTENT:
+                raise IncompleteDownloadError(transfer.partial_download.get_offset(), transfer.total_size)
+
+            await self._write_segment(transfer, segment, response)
+
+    @staticmethod
+    async def _write_segment(transfer: SegmentedTransfer, segment: list[int], response: aiohttp.ClientResponse) -> None:
+        """Writes the response at the segment's position in the part file, advancing the
+        position as it goes so that an interrupted segment continues where it stopped.
+        """
+
+        if not PartialDownload.is_range_from(response.headers, segment[2]):
+            raise IncompleteDownloadError(transfer.partial_download.get_offset(), transfer.total_size)
 
-    async def download(self, video: Video, progress: Progress) -> None:
-        async with self.session.get(video.download_link) as response:
-            if response.status != STATUS_OK:
-                video.download_status = DownloadStatus.INTERRUPTED
-                self._print_failed_status(video, response.status, progress)
-                return
+        async with aiofiles.open(transfer.partial_download.part_file_path, "r+b") as output_file:
+            await output_file.seek(segment[2])
 
-            total_size = video.file_size.get()
-            assert isinstance(total_size, float)
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                # Anything past the end of the segment belongs to the next one
+                data = chunk[: segment[1] - segment[2]]
+                if data:
+                    await output_file.write(data)
+                    segment[2] += len(data)
+                    transfer.progress.update(transfer.task, advance=len(data))
 
-            task = progress.add_task(str(video.video_id), total=total_size)
-            async with aiofiles.open(video.output_file_path, "wb") as output_file:
-                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
-                    if chunk:
-                        await output_file.write(chunk)
-                        progress.update(task, advance=len(chunk))
+        if segment[2] < segment[1]:
+            raise IncompleteDownloadError(transfer.partial_download.get_offset(), transfer.total_size)
 
-            video.download_status = DownloadStatus.COMPLETED
+        transfer.partial_download.save_state()
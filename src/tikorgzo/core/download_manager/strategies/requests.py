@@ -2,44 +2,42 @@ import asyncio
 from pathlib import Path
 
 import requests
-from requests import HTTPError
 from rich.progress import Progress
 
-from tikorgzo.constants import STATUS_OK, DownloadStatus
 from tikorgzo.core.download_manager.constants import CHUNK_SIZE
-from tikorgzo.core.download_manager.strategies._base import BaseDownloadStrategy
+from tikorgzo.core.download_manager.partial import PartialDownload
+from tikorgzo.core.download_manager.strategies._base import DOWNLOADED_STATUSES, BaseDownloadStrategy
+from tikorgzo.core.rate_limiter.model import RateLimiterRegistry
 from tikorgzo.core.video.model import Video
 
 
 class RequestsDownloadStrategy(BaseDownloadStrategy):
     """Downloads a video using a requests session."""
 
-    def __init__(self, session: requests.Session) -> None:
-        self.session = session
+    transient_errors = (*BaseDownloadStrategy.transient_errors, requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)
 
-    async def download(self, video: Video, progress: Progress) -> None:
-        def start() -> None:
-            try:
-                response = self.session.get(video.download_link, stream=True)
+    def __init__(self, session: requests.Session, rate_limiters: RateLimiterRegistry) -> None:
+        self.session = session
+        super().__init__(rate_limiters)
 
-                if response.status_code != STATUS_OK:
-                    video.download_status = DownloadStatus.INTERRUPTED
-                    self._print_failed_status(video, response.status_code, progress)
-                    return
+    async def _download_once(self, video: Video, partial_download: PartialDownload, progress: Progress) -> tuple[int, str | None]:
+        headers = partial_download.get_range_headers(video.file_size.size_in_bytes)
+        response = await asyncio.to_thread(self.session.get, video.download_link, headers=headers, stream=True)
 
-                total_size = video.file_size.get()
-                assert isinstance(total_size, float)
+        with response:
+            if response.status_code in DOWNLOADED_STATUSES:
+                await asyncio.to_thread(self._write_response, video, response, partial_download, progress)
 
-                task = progress.add_task(str(video.video_id), total=total_size)
-                with Path.open(video.output_file_path, "wb", encoding=None) as output_file:  # pylint: disable=unspecified-encoding
-                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
-                        if chunk:
-                            output_file.write(chunk)
-                            progress.update(task, advance=len(chunk))
+            return response.status_code, response.headers.get("Retry-After")
 
-                video.download_status = DownloadStatus.COMPLETED
-            except (HTTPError, Exception):
-                video.download_status = DownloadStatus.INTERRUPTED
-                raise
+    def _write_response(self, video: Video, response: requests.Response, partial_download: PartialDownload, progress: Progress) -> None:
+        offset = partial_download.start(response.status_code, response.headers)
+        content_length = response.headers.get("content-length")
+        total_size = self._get_total_size(video, offset + int(content_length) if content_length else None)
 
-        await asyncio.to_thread(start)
+        task = self._start_progress(video, progress, total_size, offset)
+        with Path.open(partial_download.part_file_path, "ab", encoding=None) as output_file:  # pylint: disable=unspecified-encoding
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                if chunk:
+                    output_file.write(chunk)
+                    progress.update(task, advance=len(chunk))
@@ -1,22 +1,86 @@
 import asyncio
 from abc import abstractmethod
+from collections.abc import AsyncGenerator, Iterable
 
+from tikorgzo.cli.text_printer import console
 from tikorgzo.core.extractors.constants import MAX_CONCURRENT_EXTRACTION_TASKS
+from tikorgzo.core.rate_limiter.model import RateLimiter
 from tikorgzo.core.video.model import Video
+from tikorgzo.core.worker_pool.model import WorkerPool
 
 
 class BaseExtractor:
-    """An interface to define extractor methods."""
+    """An interface to define extractor methods.
 
-    def __init__(self, extraction_delay: float) -> None:
-        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_EXTRACTION_TASKS)
-        self._extraction_delay = extraction_delay
-        self._delay_lock = asyncio.Lock()
-        self._done_first_task = False
+    The rate limiter paces the requests sent to the extractor's service and has to be
+    told whether each of them got rate limited or not, while `concurrency` is how many
+    videos are extracted at a time.
+
+    Each video is marked with the `name` of the extractor that got its download link.
+    Extractors that only hand the videos over to other extractors have no name, so that
+    the videos are marked by the extractor that actually got them.
+    """
+
+    name: str | None = None
+
+    def __init__(self, rate_limiter: RateLimiter, concurrency: int = MAX_CONCURRENT_EXTRACTION_TASKS) -> None:
+        self.concurrency = concurrency
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.rate_limiter = rate_limiter
+
+    def process_video_links(self, videos: Iterable[Video]) -> AsyncGenerator[tuple[Video, Video | Exception]]:
+        """Processes the video links with a bounded pool of workers, emitting each
+        `(video, result)` pair as soon as its extraction completes.
+        """
+
+        pool = WorkerPool(self.extract, self.concurrency)
+        return pool.imap(videos)
+
+    def process_queue(self, queue: "asyncio.Queue[Video | None]") -> AsyncGenerator[tuple[Video, Video | Exception]]:
+        """Same as `process_video_links()`, but for videos put into a queue by someone else
+        until a `None` sentinel is received.
+        """
+
+        pool = WorkerPool(self.extract, self.concurrency)
+        return pool.imap_queue(queue)
+
+    async def extract(self, video: Video) -> Video:
+        """Extracts the download link of a single video, preparing it first as videos
+        only resolve their link and output paths once they reach extraction.
+        """
+
+        try:
+            video.prepare()
+        except Exception as e:
+            console.print(f"Skipping {video.video_link} due to: [red]{type(e).__name__}: {e}[/red]")
+            raise
+
+        # The exceptions are re-raised so that the failed videos are told apart from the
+        # successful ones by whoever processes the results
+        try:
+            return await self.extract_prepared(video)
+        except asyncio.CancelledError:
+            console.print(f"Skipping {video.video_id} due to: [red]UserCancelledAction[/red]")
+            raise
+        except Exception as e:
+            console.print(f"Skipping {video.video_id} due to: [red]{type(e).__name__}: {e}[/red]")
+            raise
+
+    async def extract_prepared(self, video: Video) -> Video:
+        """Same as `extract()`, but for a video that has already been prepared, and without
+        reporting the failures, so that other extractors can retry the video first.
+        """
+
+        result = await self._extract(video)
+
+        if self.name is not None:
+            result.extractor = self.name
+
+        return result
 
     @abstractmethod
-    async def process_video_links(self, videos: list[Video]) -> list[Video | BaseException]:
-        """Processes a list of video links and returns the results."""
+    async def _extract(self, video: Video) -> Video:
+        """Extracts the download link of a single video and assigns it to the video."""
 
     @abstractmethod
     async def cleanup(self) -> None:
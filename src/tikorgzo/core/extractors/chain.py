@@ -0,0 +1,183 @@
+import asyncio
+import copy
+import statistics
+import time
+from collections import deque
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from tikorgzo.cli.text_printer import console
+from tikorgzo.core.extractors.base import BaseExtractor
+from tikorgzo.core.extractors.constants import HEDGE_LATENCY_PERCENTILE, LATENCY_WINDOW_SIZE, MIN_LATENCY_SAMPLES
+from tikorgzo.core.extractors.result_cache import ExtractionResult
+from tikorgzo.core.video.model import Video
+from tikorgzo.exceptions import APIStructureMismatchError, ExtractionTimeoutError, MissingSourceDataError, URLParsingError
+
+# The errors where the other extractor may still succeed, as they're about how the preferred
+# extractor got the video rather than the video itself
+FALLBACK_ERRORS = (
+    APIStructureMismatchError,
+    ExtractionTimeoutError,
+    MissingSourceDataError,
+    PlaywrightTimeoutError,
+    TimeoutError,
+    URLParsingError,
+)
+
+
+class LatencyTracker:
+    """Keeps the most recent extraction times to know how long an extraction usually takes."""
+
+    def __init__(self, window_size: int = LATENCY_WINDOW_SIZE) -> None:
+        self._latencies: deque[float] = deque(maxlen=window_size)
+
+    def add(self, latency: float) -> None:
+        self._latencies.append(latency)
+
+    def get_percentile(self, percentile: int = HEDGE_LATENCY_PERCENTILE) -> float | None:
+        """Returns the percentile of the recent extraction times in seconds, or None if there
+        aren't enough of them yet to tell.
+        """
+
+        if len(self._latencies) < MIN_LATENCY_SAMPLES:
+            return None
+
+        return statistics.quantiles(self._latencies, n=100)[percentile - 1]
+
+
+async def _get_first_successful(tasks: list["asyncio.Task[Video]"]) -> Video:
+    """Returns the result of whichever task succeeds first and cancels the others. If all
+    of them fail, the error of the first task is raised.
+    """
+
+    pending = set(tasks)
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in done:
+                if not task.cancelled() and task.exception() is None:
+                    return task.result()
+
+        return tasks[0].result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+class ExtractorChain(BaseExtractor):
+    """Extracts each video with the preferred extractor, and retries it with the fallback
+    extractor if the preferred one fails in a way that the fallback may not.
+
+    With hedging, the fallback extractor is also started alongside the preferred one once
+    the preferred one takes longer than it usually does (its p95 extraction time), and
+    whichever finishes first is used. This cuts the long tail of slow extractions on big
+    batches, at the cost of some extra requests. Both extractors work on their own copy of
+    the video then, and only the details that the winner got are set on the video.
+
+    The fallback extractor is only initialized once it's first needed.
+
+    Attributes:
+        extractor (BaseExtractor): The preferred extractor.
+        fallback_extractor (BaseExtractor): The extractor to fall back to.
+        hedge (bool): Whether the fallback extractor is started early for slow extractions.
+        _latencies (LatencyTracker): The recent extraction times of the preferred extractor.
+        _fallback_lock (asyncio.Lock): Makes sure that the fallback extractor is initialized only once.
+        _is_fallback_initialized (bool): Whether the fallback extractor has been initialized.
+        _fallback_error (Exception | None): Why the fallback extractor failed to initialize, if it did.
+
+    Args:
+        extractor (BaseExtractor): The preferred extractor.
+        fallback_extractor (BaseExtractor): The extractor to fall back to.
+        hedge (bool): Whether the fallback extractor is started early for slow extractions.
+
+    """
+
+    def __init__(self, extractor: BaseExtractor, fallback_extractor: BaseExtractor, hedge: bool = False) -> None:
+        self.extractor = extractor
+        self.fallback_extractor = fallback_extractor
+        self.hedge = hedge
+        self._latencies = LatencyTracker()
+        self._fallback_lock = asyncio.Lock()
+        self._is_fallback_initialized = False
+        self._fallback_error: Exception | None = None
+        super().__init__(extractor.rate_limiter, extractor.concurrency)
+
+    async def initialize(self) -> None:
+        await self.extractor.initialize()
+
+    async def cleanup(self) -> None:
+        await self.extractor.cleanup()
+
+        if self._is_fallback_initialized:
+            await self.fallback_extractor.cleanup()
+
+    async def _extract(self, video: Video) -> Video:
+        hedge_delay = self._latencies.get_percentile() if self.hedge else None
+
+        if hedge_delay is not None:
+            return await self._extract_hedged(video, hedge_delay)
+
+        try:
+            return await self._extract_timed(video)
+        except FALLBACK_ERRORS as e:
+            self._print_fallback(video, e)
+
+        return await self._extract_with_fallback(video)
+
+    async def _extract_hedged(self, video: Video, hedge_delay: float) -> Video:
+        tasks = [asyncio.create_task(self._extract_timed(copy.copy(video)))]
+
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+
+            if done:
+                try:
+                    result = tasks[0].result()
+                except FALLBACK_ERRORS as e:
+                    self._print_fallback(video, e)
+                    return await self._extract_with_fallback(video)
+            else:
+                console.print(f"[gray50]Extraction of {video.video_id} is slow, also trying it with the fallback extractor...[/gray50]")
+                tasks.append(asyncio.create_task(self._extract_with_fallback(copy.copy(video))))
+
+                result = await _get_first_successful(tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        ExtractionResult.from_video(result, fetched_at=time.time()).apply_to(video)
+        return video
+
+    async def _extract_timed(self, video: Video) -> Video:
+        """Extracts the video with the preferred extractor, keeping track of how long it took."""
+
+        start_time = time.monotonic()
+
+        try:
+            return await self.extractor.extract_prepared(video)
+        finally:
+            # Failed attempts and the ones cancelled after losing to the fallback extractor
+            # (as long as they ran until then) count too. Leaving out the slowest attempts
+            # would lower the percentile and make hedging start earlier and earlier.
+            self._latencies.add(time.monotonic() - start_time)
+
+    async def _extract_with_fallback(self, video: Video) -> Video:
+        async with self._fallback_lock:
+            # The initialization isn't tried again for every video if it has already failed once
+            if self._fallback_error is not None:
+                raise self._fallback_error
+
+            if not self._is_fallback_initialized:
+                try:
+                    await self.fallback_extractor.initialize()
+                except Exception as e:
+                    self._fallback_error = e
+                    raise
+                self._is_fallback_initialized = True
+
+        return await self.fallback_extractor.extract_prepared(video)
+
+    def _print_fallback(self, video: Video, e: Exception) -> None:
+        console.print(f"[gray50]Retrying {video.video_id} with the fallback extractor due to: {type(e).__name__}: {e}[/gray50]")
@@ -1 +1,26 @@
+from tikorgzo.constants import STATUS_FORBIDDEN, STATUS_GONE, STATUS_NOT_FOUND
+
 MAX_CONCURRENT_EXTRACTION_TASKS = 5
+
+# Extraction result cache related constants. The lifetime of the cached download links starts
+# at the default and is learned for each extractor from the cached links that stop working
+# (lowered to half of their age) and the ones that still work (raised by the increase).
+DEFAULT_EXTRACTION_RESULT_TTL = 3600.0
+MIN_EXTRACTION_RESULT_TTL = 300.0
+MAX_EXTRACTION_RESULT_TTL = 86400.0
+EXTRACTION_RESULT_TTL_INCREASE = 600.0
+MAX_EXTRACTION_RESULT_ENTRIES = 100_000
+# The status codes that an expired download link is answered with. Downloads that fail with
+# any other status code (e.g., rate limiting or server errors) don't tell that the link is dead.
+DEAD_LINK_STATUSES = (STATUS_FORBIDDEN, STATUS_NOT_FOUND, STATUS_GONE)
+
+# Query parameters that download links use to tell when they expire, as a Unix timestamp
+LINK_EXPIRY_PARAMS = ("x-expires", "expires", "expire")
+# Cached links are dropped this long before their own expiry, so they don't expire midway the download
+LINK_EXPIRY_MARGIN = 300.0
+
+# Hedged extraction related constants. The fallback extractor is started alongside the
+# preferred one once it takes longer than this percentile of its recent extraction times.
+HEDGE_LATENCY_PERCENTILE = 95
+LATENCY_WINDOW_SIZE = 200
+MIN_LATENCY_SAMPLES = 20
@@ -1,16 +1,32 @@
+import asyncio
+from collections.abc import AsyncGenerator, Iterable
 from types import TracebackType
 from typing import Self
 
+from tikorgzo.cli.text_printer import console
 from tikorgzo.core.extractors.base import BaseExtractor
+from tikorgzo.core.extractors.result_cache import ExtractionResultCache
 from tikorgzo.core.video.model import Video
 
 
 class ExtractorHandler:
-    """A context manager to handle usage and cleanup of extractor."""
+    """A context manager to handle usage and cleanup of extractor.
 
-    def __init__(self, extractor: BaseExtractor, disallow_cleanup: bool = False) -> None:
+    If a result cache is given, videos with a fresh result from a previous run are taken
+    from it instead of being extracted again, and the extractor is only initialized once
+    there's a video that isn't in the cache.
+    """
+
+    def __init__(
+        self,
+        extractor: BaseExtractor,
+        disallow_cleanup: bool = False,
+        result_cache: ExtractionResultCache | None = None,
+    ) -> None:
         self.extractor: BaseExtractor = extractor
         self.disallow_cleanup = disallow_cleanup
+        self.result_cache = result_cache
+        self._is_initialized = False
 
     async def __aenter__(self) -> Self:
         return self
@@ -19,5 +35,117 @@ class ExtractorHandler:
         if not self.disallow_cleanup:
             await self.extractor.cleanup()
 
-    async def process_video_links(self, videos: list[Video]) -> list[Video | BaseException]:
-        return await self.extractor.process_video_links(videos)
+    async def initialize(self) -> None:
+        """Initializes the extractor, unless it has already been initialized."""
+
+        if not self._is_initialized:
+            await self.extractor.initialize()
+            self._is_initialized = True
+
+    async def process_video_links(self, videos: Iterable[Video]) -> AsyncGenerator[tuple[Video, Video | Exception]]:
+        """Emits the videos that are in the result cache right away, then extracts the rest.
+
+        Yields:
+            tuple[Video, Video | Exception]: Each video and its result, in order of completion.
+
+        """
+
+        uncached_videos: list[Video] = []
+
+        for video in videos:
+            if self._load_cached_result(video):
+                yield video, video
+            else:
+                uncached_videos.append(video)
+
+        if not uncached_videos:
+            return
+
+        await self.initialize()
+
+        async for video, result in self.extractor.process_video_links(uncached_videos):
+            self._cache_result(result)
+            yield video, result
+
+    async def process_queue(
+        self,
+        input_queue: "asyncio.Queue[Video | None]",
+        output_queue: "asyncio.Queue[Video | None]",
+    ) -> None:
+        """Extracts the videos from `input_queue` as soon as they arrive and puts the successful
+        ones into `output_queue`, until a `None` sentinel is received. A `None` sentinel is then
+        put into `output_queue` once every video has been processed. As with
+        `process_video_links()`, the extractor is only initialized once there's a video that
+        isn't in the cache.
+        """
+
+        if self.result_cache is None:
+            await self.initialize()
+            await self._extract_queue(input_queue, output_queue)
+        else:
+            uncached_queue: asyncio.Queue[Video | None] = asyncio.Queue(maxsize=input_queue.maxsize)
+
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._route_cached_videos(input_queue, uncached_queue, output_queue))
+                tg.create_task(self._extract_queue(uncached_queue, output_queue))
+
+        await output_queue.put(None)
+
+    async def _extract_queue(
+        self,
+        input_queue: "asyncio.Queue[Video | None]",
+        output_queue: "asyncio.Queue[Video | None]",
+    ) -> None:
+        async for _, result in self.extractor.process_queue(input_queue):
+            # Failed videos are skipped here as the extractor already reports why
+            if not isinstance(result, Exception):
+                self._cache_result(result)
+                await output_queue.put(result)
+
+    async def _route_cached_videos(
+        self,
+        input_queue: "asyncio.Queue[Video | None]",
+        uncached_queue: "asyncio.Queue[Video | None]",
+        output_queue: "asyncio.Queue[Video | None]",
+    ) -> None:
+        """Passes the videos that are in the result cache straight to `output_queue`, and the
+        rest to `uncached_queue` to be extracted.
+        """
+
+        while (video := await input_queue.get()) is not None:
+            if self._load_cached_result(video):
+                await output_queue.put(video)
+            else:
+                await self.initialize()
+                await uncached_queue.put(video)
+
+        await uncached_queue.put(None)
+
+    def _load_cached_result(self, video: Video) -> bool:
+        """Sets the cached result on the video if there's a fresh one, returning whether it
+        can skip the extraction.
+        """
+
+        # Shortened links have to be resolved by the extractor first to know their video ID
+        if self.result_cache is None or not video.is_resolved:
+            return False
+
+        result = self.result_cache.get(video.video_id)
+
+        if result is None:
+            return False
+
+        result.apply_to(video)
+
+        try:
+            video.prepare()
+        except Exception:
+            # The video is left to the extractor, which reports why it can't be prepared
+            return False
+
+        console.print(f"Download link retrieved for {video.video_id} (@{video.username}) [gray50](cached)[/gray50]")
+        return True
+
+    def _cache_result(self, result: Video | Exception) -> None:
+        if self.result_cache is not None and not isinstance(result, Exception):
+            self.result_cache.put(result)
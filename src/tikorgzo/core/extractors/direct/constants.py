@@ -0,0 +1,8 @@
+REHYDRATION_SCRIPT_ID = "__UNIVERSAL_DATA_FOR_REHYDRATION__"
+
+# Markers for finding the rehydration data in the raw page without parsing the whole HTML.
+# TikTok serves the JSON compact, so the item is always right after these keys.
+REHYDRATION_SCRIPT_MARKER = b'id="__UNIVERSAL_DATA_FOR_REHYDRATION__"'
+SCRIPT_END_MARKER = b"</script>"
+VIDEO_DETAIL_MARKER = b'"webapp.video-detail":'
+ITEM_STRUCT_MARKER = b'"itemInfo":{"itemStruct":'
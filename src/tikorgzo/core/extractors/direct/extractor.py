@@ -1,71 +1,61 @@
 import asyncio
-import json
 from typing import Any
 
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
 
 from tikorgzo.cli.text_printer import console
-from tikorgzo.constants import TIKTOK_ID_LENGTH
+from tikorgzo.constants import DIRECT_EXTRACTOR_NAME, STATUS_TOO_MANY_REQUESTS, TIKTOK_ID_LENGTH
 from tikorgzo.core.extractors.base import BaseExtractor
 from tikorgzo.core.extractors.direct.helpers import (
     get_best_quality,
     get_download_addresses,
     get_initial_url,
+    parse_source_data,
 )
+from tikorgzo.core.rate_limiter.helpers import parse_retry_after
+from tikorgzo.core.rate_limiter.model import RateLimiter
 from tikorgzo.core.video import helpers as fn
 from tikorgzo.core.video.model import Video
-from tikorgzo.exceptions import APIStructureMismatchError, MissingSourceDataError
+from tikorgzo.exceptions import APIStructureMismatchError, RateLimitedError
 
 
 class DirectExtractor(BaseExtractor):
     """Extractor that handles download link extraction directly from TikTok
     site.
+
+    The pages are fetched with the shared aiohttp session, or in worker threads
+    if a requests session is used instead for compatibility.
     """
 
-    def __init__(self, delay: float, session: requests.Session) -> None:
-        self.session = session
-        super().__init__(delay)
+    name = DIRECT_EXTRACTOR_NAME
 
-    async def process_video_links(self, videos: list[Video]) -> list[Video | BaseException]:
-        tasks = [self._extract(video) for video in videos]
-        return await asyncio.gather(*tasks, return_exceptions=True)
+    def __init__(self, rate_limiter: RateLimiter, session: aiohttp.ClientSession | requests.Session) -> None:
+        self.session = session
+        super().__init__(rate_limiter)
 
     async def cleanup(self) -> None:
-        self.session.close()
+        # The session is shared with the downloader, which is the one that closes it
+        pass
 
     async def _extract(self, video: Video) -> Video:
-        # Add delay between link extraction to limit rate of requests
-        # being sent
-        async with self._delay_lock:
-            if self._done_first_task:
-                await asyncio.sleep(self._extraction_delay)
-            else:
-                self._done_first_task = True
-
-        try:
-            url = await self._get_url(video.video_link)
-            source_data = await self._get_source_data(self.session, url)
-            best_quality_details = await self._get_best_quality_details(source_data)
-            download_link = best_quality_details["PlayAddr"]["UrlList"][1]
-            username = await self._get_username(source_data)
-
-            if video.username is None:
-                video.username = username
-                fn.assign_output_paths(video)
-
-            video.download_link = download_link
-            video.file_size = float(best_quality_details["PlayAddr"]["DataSize"])
-
-            console.print(f"Download link retrieved for {video.video_id} (@{video.username})")
-
-            return video
-        except asyncio.CancelledError:
-            console.print(f"Skipping {video.video_id} due to: [red]UserCancelledAction[/red]")
-            raise
-        except Exception as e:
-            console.print(f"Skipping {video.video_id} due to: [red]{type(e).__name__}: {e}[/red]")
-            raise e  # noqa: TRY201
+        url = await self._get_url(video.video_link)
+        source_data = await self._get_rate_limited_source_data(url)
+        best_quality_details = await self._get_best_quality_details(source_data)
+        download_link = best_quality_details["PlayAddr"]["UrlList"][1]
+        username = await self._get_username(source_data)
+
+        if video.username is None:
+            video.username = username
+            fn.assign_output_paths(video)
+
+        video.download_link = download_link
+        video.file_size = float(best_quality_details["PlayAddr"]["DataSize"])
+        self._set_quality_details(video, best_quality_details)
+
+        console.print(f"Download link retrieved for {video.video_id} (@{video.username})")
+
+        return video
 
     async def _get_url(
             self,
@@ -80,23 +70,44 @@ class DirectExtractor(BaseExtractor):
 
         return video_url
 
-    async def _get_source_data(self, session: requests.Session, url: str) -> dict[str, Any]:
-        """Gets the content of the script tag that contains the initial
-        data.
+    async def _get_rate_limited_source_data(self, url: str) -> dict[str, Any]:
+        """Same as `_get_source_data()`, but paced by the rate limiter and sent again for
+        as long as TikTok rate limits it.
         """
 
-        def fetch() -> dict[str, Any]:
-            response = session.get(url)
-            soup = BeautifulSoup(response.text, "html.parser")
-            script_tag = soup.find("script", id="__UNIVERSAL_DATA_FOR_REHYDRATION__")
+        while True:
+            await self.rate_limiter.acquire()
 
-            if script_tag is None or script_tag.string is None:
-                msg = "Script tag with id '__UNIVERSAL_DATA_FOR_REHYDRATION__' not found"
-                raise MissingSourceDataError(msg)
+            try:
+                source_data = await self._get_source_data(url)
+            except RateLimitedError as e:
+                self.rate_limiter.on_rate_limited(e.retry_after)
+                continue
 
-            return json.loads(script_tag.string)
+            self.rate_limiter.on_success()
+            return source_data
 
-        return await asyncio.to_thread(fetch)
+    async def _get_source_data(self, url: str) -> dict[str, Any]:
+        """Gets the content of the script tag that contains the initial
+        data. The parsing runs in a worker thread so that it doesn't hold
+        up the event loop.
+        """
+
+        if isinstance(self.session, aiohttp.ClientSession):
+            async with self.session.get(url) as response:
+                status_code = response.status
+                retry_after = response.headers.get("Retry-After")
+                page = await response.read()
+        else:
+            sync_response = await asyncio.to_thread(self.session.get, url)
+            status_code = sync_response.status_code
+            retry_after = sync_response.headers.get("Retry-After")
+            page = sync_response.content
+
+        if status_code == STATUS_TOO_MANY_REQUESTS:
+            raise RateLimitedError(parse_retry_after(retry_after))
+
+        return await asyncio.to_thread(parse_source_data, page)
 
     async def _get_best_quality_details(
             self,
@@ -105,6 +116,20 @@ class DirectExtractor(BaseExtractor):
         download_addresses = await get_download_addresses(data)
         return await get_best_quality(download_addresses)
 
+    def _set_quality_details(self, video: Video, best_quality_details: dict[str, Any]) -> None:
+        """Sets the resolution and bitrate of the video so that they can be recorded into the
+        download catalog, if the source data has them.
+        """
+
+        width = best_quality_details["PlayAddr"].get("Width")
+        height = best_quality_details["PlayAddr"].get("Height")
+        bitrate = best_quality_details.get("Bitrate")
+
+        if width and height:
+            video.resolution = (int(width), int(height))
+        if bitrate:
+            video.bitrate = int(bitrate)
+
     async def _get_username(self, data: dict[str, Any]) -> str:
         path_to_username = [
             "__DEFAULT_SCOPE__",
@@ -1,6 +1,16 @@
-from typing import Any
+import json
+from typing import Any, cast
 
-from tikorgzo.exceptions import APIStructureMismatchError
+from bs4 import BeautifulSoup
+
+from tikorgzo.core.extractors.direct.constants import (
+    ITEM_STRUCT_MARKER,
+    REHYDRATION_SCRIPT_ID,
+    REHYDRATION_SCRIPT_MARKER,
+    SCRIPT_END_MARKER,
+    VIDEO_DETAIL_MARKER,
+)
+from tikorgzo.exceptions import APIStructureMismatchError, MissingSourceDataError
 
 URL_TEMPLATE = "https://m.tiktok.com/v/{}.html"
 
@@ -57,3 +67,72 @@ async def get_best_quality(download_addresses: list[dict[str, Any]]) -> dict[str
         return (resolution, bitrate)
 
     return max(download_addresses, key=quality_score)
+
+
+def parse_source_data(page: bytes) -> dict[str, Any]:
+    """Gets the rehydration data from the page, parsing only the video item out of it if
+    possible, or else the whole page and data.
+    """
+
+    source_data = find_item_struct(page)
+
+    if source_data is not None:
+        return source_data
+
+    # The page isn't laid out the way the fast path expects, so it's parsed as a whole instead
+    soup = BeautifulSoup(page, "html.parser")
+    script_tag = soup.find("script", id=REHYDRATION_SCRIPT_ID)
+
+    if script_tag is None or script_tag.string is None:
+        msg = f"Script tag with id '{REHYDRATION_SCRIPT_ID}' not found"
+        raise MissingSourceDataError(msg)
+
+    return json.loads(script_tag.string)
+
+
+def find_item_struct(page: bytes) -> dict[str, Any] | None:
+    """Finds the rehydration data of the page by scanning its raw bytes, and parses only the
+    `webapp.video-detail -> itemInfo -> itemStruct` object out of it instead of the whole
+    page and JSON. The result is nested the same way as the full rehydration data.
+
+    Returns None if the data can't be found this way, in which case the page has to be
+    parsed as a whole instead.
+    """
+
+    item_struct_bounds = _find_item_struct_bounds(page)
+    if item_struct_bounds is None:
+        return None
+
+    start, end = item_struct_bounds
+
+    try:
+        # raw_decode() stops right after the end of the item, so the rest of the JSON is never parsed
+        item_struct, _ = json.JSONDecoder().raw_decode(page[start:end].decode())
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+
+    if not isinstance(item_struct, dict):
+        return None
+
+    return {"__DEFAULT_SCOPE__": {"webapp.video-detail": {"itemInfo": {"itemStruct": cast("dict[str, Any]", item_struct)}}}}
+
+
+def _find_item_struct_bounds(page: bytes) -> tuple[int, int] | None:
+    """Returns where the item starts and where the script that contains it ends."""
+
+    script_start = page.find(REHYDRATION_SCRIPT_MARKER)
+    content_start = page.find(b">", script_start) + 1 if script_start != -1 else 0
+    content_end = page.find(SCRIPT_END_MARKER, content_start) if content_start else -1
+
+    if content_end == -1:
+        return None
+
+    video_detail_start = page.find(VIDEO_DETAIL_MARKER, content_start, content_end)
+    if video_detail_start == -1:
+        return None
+
+    item_struct_start = page.find(ITEM_STRUCT_MARKER, video_detail_start, content_end)
+    if item_struct_start == -1:
+        return None
+
+    return item_struct_start + len(ITEM_STRUCT_MARKER), content_end
@@ -0,0 +1,285 @@
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from tikorgzo.constants import EXTRACTION_RESULT_CACHE_PATH, DownloadStatus
+from tikorgzo.core.extractors.constants import (
+    DEAD_LINK_STATUSES,
+    DEFAULT_EXTRACTION_RESULT_TTL,
+    EXTRACTION_RESULT_TTL_INCREASE,
+    LINK_EXPIRY_MARGIN,
+    LINK_EXPIRY_PARAMS,
+    MAX_EXTRACTION_RESULT_ENTRIES,
+    MAX_EXTRACTION_RESULT_TTL,
+    MIN_EXTRACTION_RESULT_TTL,
+)
+from tikorgzo.core.video.model import Video
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS extraction_results (
+    video_id INTEGER NOT NULL,
+    extractor TEXT NOT NULL,
+    download_link TEXT NOT NULL,
+    username TEXT,
+    file_size REAL,
+    width INTEGER,
+    height INTEGER,
+    bitrate INTEGER,
+    fetched_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (video_id, extractor)
+);
+CREATE INDEX IF NOT EXISTS idx_extraction_results_expires_at ON extraction_results (expires_at);
+CREATE TABLE IF NOT EXISTS extractor_ttls (
+    extractor TEXT PRIMARY KEY,
+    ttl REAL NOT NULL
+);
+"""
+
+
+def get_link_expiry(download_link: str) -> float | None:
+    """Returns when the download link expires as a Unix timestamp, if the link tells it."""
+
+    query = parse_qs(urlsplit(download_link).query)
+
+    for param in LINK_EXPIRY_PARAMS:
+        values = query.get(param)
+        if values and values[0].isdigit():
+            return float(values[0])
+
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractionResult:
+    """The details that an extractor got for a video, as stored in the cache."""
+
+    download_link: str
+    extractor: str | None = None
+    username: str | None = None
+    file_size: float | None = None
+    resolution: tuple[int, int] | None = None
+    bitrate: int | None = None
+    fetched_at: float = 0.0
+
+    @classmethod
+    def from_video(cls, video: Video, fetched_at: float) -> "ExtractionResult":
+        return cls(
+            download_link=video.download_link,
+            extractor=video.extractor,
+            username=video.username,
+            file_size=video.file_size.size_in_bytes,
+            resolution=video.resolution,
+            bitrate=video.bitrate,
+            fetched_at=fetched_at,
+        )
+
+    def apply_to(self, video: Video) -> None:
+        """Sets the details on the video as if the extractor has just got them."""
+
+        if video.username is None and self.username is not None:
+            video.username = self.username
+
+        video.download_link = self.download_link
+
+        if self.extractor is not None:
+            video.extractor = self.extractor
+        if self.file_size is not None:
+            video.file_size = self.file_size
+        if self.resolution is not None:
+            video.resolution = self.resolution
+        if self.bitrate is not None:
+            video.bitrate = self.bitrate
+
+
+class ExtractionResultCache:
+    """A persistent cache of extraction results by video ID, so that videos whose download
+    link has been extracted recently (e.g., in a run that failed during download) don't
+    need to be extracted again.
+
+    Each result is kept under the extractor that actually got it, which may be the fallback
+    extractor of the run, and the results of both extractors of the run are looked up.
+
+    Download links expire, and how long they last depends on the extractor, so the lifetime
+    of the entries is learned for each extractor: it's lowered whenever a cached link turns
+    out to be dead, and raised whenever an old cached link still works. Entries also never
+    outlive the expiry that the link itself tells, if any. The videos whose cached link
+    turned out to be dead are kept so that they can be extracted again.
+
+    Attributes:
+        extractor (str): The name of the extractor set for the run, which the results that
+            aren't marked with their extractor are kept under.
+        fallback_extractor (str | None): The name of the fallback extractor of the run, if any.
+        cache_path (Path): Where the cache database is stored.
+        _max_entries (int): How many results are kept at most.
+        _connection (sqlite3.Connection | None): The connection to the cache database, once opened.
+        _served (dict[int, tuple[str, float]]): The extractor and the fetch time of the results
+            that were taken from the cache in this run, by video ID.
+        _dead_link_videos (list[Video]): The videos whose cached link turned out to be dead.
+
+    Args:
+        extractor (str): The name of the extractor set for the run.
+        fallback_extractor (str | None): The name of the fallback extractor of the run, if any.
+        cache_path (Path): Where the cache database is stored.
+        max_entries (int): How many results are kept at most.
+
+    """
+
+    def __init__(
+        self,
+        extractor: str,
+        fallback_extractor: str | None = None,
+        cache_path: Path = EXTRACTION_RESULT_CACHE_PATH,
+        max_entries: int = MAX_EXTRACTION_RESULT_ENTRIES,
+    ) -> None:
+        self.extractor = extractor
+        self.fallback_extractor = fallback_extractor
+        self.cache_path = cache_path
+        self._max_entries = max_entries
+        self._connection: sqlite3.Connection | None = None
+        self._served: dict[int, tuple[str, float]] = {}
+        self._dead_link_videos: list[Video] = []
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.cache_path.parent.mkdir(exist_ok=True, parents=True)
+            connection = sqlite3.connect(self.cache_path)
+            connection.executescript(CACHE_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def get_ttl(self, extractor: str | None = None) -> float:
+        """Returns the learned lifetime of the extractor's results in seconds, which is the
+        extractor set for the run if none is given.
+        """
+
+        row = self.connection.execute("SELECT ttl FROM extractor_ttls WHERE extractor = ?", (extractor or self.extractor,)).fetchone()
+        return float(row[0]) if row is not None else DEFAULT_EXTRACTION_RESULT_TTL
+
+    def get(self, video_id: int) -> ExtractionResult | None:
+        """Returns the most recent cached result of the video from the extractors of the run,
+        if it's still fresh.
+        """
+
+        row = self.connection.execute(
+            """
+            SELECT extractor, download_link, username, file_size, width, height, bitrate, fetched_at FROM extraction_results
+            WHERE video_id = ? AND extractor IN (?, ?) AND expires_at > ?
+            ORDER BY fetched_at DESC LIMIT 1
+            """,
+            (video_id, *self._get_extractors(), time.time()),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        extractor, download_link, username, file_size, width, height, bitrate, fetched_at = row
+        self._served[video_id] = (extractor, fetched_at)
+
+        return ExtractionResult(
+            download_link=download_link,
+            extractor=extractor,
+            username=username,
+            file_size=file_size,
+            resolution=(width, height) if width and height else None,
+            bitrate=bitrate,
+            fetched_at=fetched_at,
+        )
+
+    def put(self, video: Video) -> None:
+        """Stores the result that an extractor has just got for the video under that
+        extractor, then evicts expired entries and the oldest entries beyond the size limit.
+        """
+
+        now = time.time()
+        result = ExtractionResult.from_video(video, fetched_at=now)
+        extractor = result.extractor or self.extractor
+        expires_at = now + self.get_ttl(extractor)
+
+        link_expiry = get_link_expiry(result.download_link)
+        if link_expiry is not None:
+            expires_at = min(expires_at, link_expiry - LINK_EXPIRY_MARGIN)
+
+        if expires_at <= now:
+            return
+
+        width, height = result.resolution or (None, None)
+
+        self.connection.execute(
+            """
+            INSERT OR REPLACE INTO extraction_results
+                (video_id, extractor, download_link, username, file_size, width, height, bitrate, fetched_at, expires_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (video.video_id, extractor, result.download_link, result.username, result.file_size, width, height, result.bitrate, now, expires_at),
+        )
+        self.connection.execute("DELETE FROM extraction_results WHERE expires_at <= ?", (now,))
+        self.connection.execute(
+            """
+            DELETE FROM extraction_results WHERE rowid IN (
+                SELECT rowid FROM extraction_results ORDER BY fetched_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self._max_entries,),
+        )
+        self.connection.commit()
+
+    def report_download(self, video: Video, status_code: int) -> None:
+        """Removes the results of the video as they're no longer needed once its download is
+        done or its link turns out to be dead, learning from it if it was taken from the cache.
+        The results are kept if the download failed with another status code (e.g., rate
+        limiting or a server error), as that doesn't tell that the link is dead.
+        """
+
+        served = self._served.pop(video.video_id, None)
+        is_successful = video.download_status == DownloadStatus.COMPLETED
+
+        if not is_successful and status_code not in DEAD_LINK_STATUSES:
+            return
+
+        if served is not None:
+            extractor, fetched_at = served
+            self._learn_ttl(extractor, time.time() - fetched_at, is_successful)
+
+            if not is_successful:
+                self._dead_link_videos.append(video)
+
+        self.connection.execute(
+            "DELETE FROM extraction_results WHERE video_id = ? AND extractor IN (?, ?)",
+            (video.video_id, *self._get_extractors()),
+        )
+        self.connection.commit()
+
+    def take_dead_link_videos(self) -> list[Video]:
+        """Returns the videos whose cached download link turned out to be dead since the
+        last call, so that they can be extracted again.
+        """
+
+        videos = self._dead_link_videos
+        self._dead_link_videos = []
+        return videos
+
+    def _get_extractors(self) -> tuple[str, str]:
+        return self.extractor, self.fallback_extractor or self.extractor
+
+    def _learn_ttl(self, extractor: str, age: float, is_successful: bool) -> None:
+        ttl = self.get_ttl(extractor)
+
+        if not is_successful:
+            # The link was already dead at this age, so the entries have to expire well before it
+            ttl = max(min(ttl, age / 2), MIN_EXTRACTION_RESULT_TTL)
+        elif age * 2 >= ttl:
+            ttl = min(ttl + EXTRACTION_RESULT_TTL_INCREASE, MAX_EXTRACTION_RESULT_TTL)
+
+        self.connection.execute(
+            "INSERT OR REPLACE INTO extractor_ttls (extractor, ttl) VALUES (?, ?)",
+            (extractor, ttl),
+        )
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
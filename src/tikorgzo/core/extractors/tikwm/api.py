@@ -0,0 +1,172 @@
+import asyncio
+import json
+from typing import Any, Protocol, cast
+
+import aiohttp
+
+from tikorgzo.constants import STATUS_TOO_MANY_REQUESTS
+from tikorgzo.core.extractors.tikwm.browser import TikWMClearance
+from tikorgzo.core.extractors.tikwm.constants import (
+    API_RATE_LIMIT_MESSAGE,
+    API_REQUEST_TIMEOUT,
+    API_URL_PARSING_FAILED_MESSAGE,
+    CLEARANCE_EXPIRED_STATUSES,
+    TIKWM_API_URL,
+)
+from tikorgzo.core.rate_limiter.helpers import parse_retry_after
+from tikorgzo.core.rate_limiter.model import RateLimiter
+from tikorgzo.exceptions import ClearanceExpiredError, RateLimitedError, TikWMAPIError, URLParsingError
+
+
+def get_download_source(data: dict[str, Any]) -> tuple[str, float | None]:
+    """Returns the download path and the file size (if told) of the video from the `data`
+    object of a TikWM API response. `hdplay` is the original quality, which may be missing
+    for some videos, and the file size is always the one of the quality that is chosen.
+    """
+
+    if data.get("hdplay"):
+        download_path, file_size = data["hdplay"], data.get("hd_size")
+    else:
+        download_path, file_size = data["play"], data.get("size")
+
+    return download_path, float(file_size) if file_size else None
+
+
+def get_response_data(response_data: dict[str, Any]) -> dict[str, Any] | None:
+    """Returns the `data` object of a TikWM API response, or None if the request got rate
+    limited and has to be sent again.
+
+    Raises:
+        URLParsingError: If TikWM can't parse the video link.
+        TikWMAPIError: If TikWM responds with any other error.
+
+    """
+
+    data = response_data.get("data")
+
+    if response_data.get("code") == 0 and isinstance(data, dict):
+        return cast("dict[str, Any]", data)
+
+    message = str(response_data.get("msg", ""))
+
+    if API_RATE_LIMIT_MESSAGE in message:
+        return None
+    if API_URL_PARSING_FAILED_MESSAGE in message:
+        raise URLParsingError
+
+    raise TikWMAPIError(message)
+
+
+class ClearanceProvider(Protocol):
+    async def get_clearance(self) -> TikWMClearance: ...
+
+
+class TikWMAPIClient:
+    """Sends the video links straight to the TikWM API (the same backend that the TikWM
+    website uses) over a plain HTTP session, using the clearance that the browser got
+    from passing the website's bot check. The browser is only used again once that
+    clearance expires.
+
+    Attributes:
+        session (aiohttp.ClientSession): The shared session where the requests are sent.
+        browser (ClearanceProvider): The browser where the clearance is taken from.
+        rate_limiter (RateLimiter): Paces the requests sent to the API.
+        api_url (str): The URL of the TikWM API.
+        _clearance (TikWMClearance | None): The current clearance, if it has been taken yet.
+        _clearance_lock (asyncio.Lock): Makes sure that only one task re-enters the browser at a time.
+
+    Args:
+        session (aiohttp.ClientSession): The shared session where the requests are sent.
+        browser (ClearanceProvider): The browser where the clearance is taken from.
+        rate_limiter (RateLimiter): Paces the requests sent to the API.
+        api_url (str): The URL of the TikWM API.
+
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        browser: ClearanceProvider,
+        rate_limiter: RateLimiter,
+        api_url: str = TIKWM_API_URL,
+    ) -> None:
+        self.session = session
+        self.browser = browser
+        self.rate_limiter = rate_limiter
+        self.api_url = api_url
+        self._clearance: TikWMClearance | None = None
+        self._clearance_lock = asyncio.Lock()
+
+    async def get_video_data(self, video_link: str) -> dict[str, Any]:
+        """Returns the `data` object that the TikWM API responds with for the video link,
+        raising the same errors as `get_response_data()` if TikWM responds with an error.
+
+        Raises:
+            ClearanceExpiredError: If the requests are still blocked even after getting a new clearance.
+
+        """
+
+        clearance = await self._get_clearance(None)
+        has_refreshed_clearance = False
+
+        while True:
+            await self.rate_limiter.acquire()
+
+            try:
+                response_data = await self._post(video_link, clearance)
+            except ClearanceExpiredError:
+                if has_refreshed_clearance:
+                    raise
+                clearance = await self._get_clearance(clearance)
+                has_refreshed_clearance = True
+                continue
+            except RateLimitedError as e:
+                self.rate_limiter.on_rate_limited(e.retry_after)
+                continue
+
+            data = get_response_data(response_data)
+
+            if data is not None:
+                self.rate_limiter.on_success()
+                return data
+
+            self.rate_limiter.on_rate_limited()
+
+    async def _get_clearance(self, stale_clearance: TikWMClearance | None) -> TikWMClearance:
+        """Returns the current clearance, or takes a new one from the browser if there's none
+        yet or if it's the same one that has just been found to be expired.
+        """
+
+        async with self._clearance_lock:
+            # Other tasks may have already refreshed the clearance while this one was waiting
+            if self._clearance is None or self._clearance is stale_clearance:
+                self._clearance = await self.browser.get_clearance()
+            return self._clearance
+
+    async def _post(self, video_link: str, clearance: TikWMClearance) -> dict[str, Any]:
+        form_data = {"url": video_link, "count": "12", "cursor": "0", "web": "1", "hd": "1"}
+
+        async with self.session.post(
+            self.api_url,
+            data=form_data,
+            headers=clearance.headers,
+            cookies=clearance.cookies,
+            timeout=aiohttp.ClientTimeout(total=API_REQUEST_TIMEOUT),
+        ) as response:
+            if response.status in CLEARANCE_EXPIRED_STATUSES:
+                raise ClearanceExpiredError
+            if response.status == STATUS_TOO_MANY_REQUESTS:
+                raise RateLimitedError(parse_retry_after(response.headers.get("Retry-After")))
+
+            response.raise_for_status()
+
+            try:
+                response_data = await response.json(content_type=None)
+            except json.JSONDecodeError:
+                # The bot check challenge page is served instead of the API response
+                raise ClearanceExpiredError from None
+
+        if not isinstance(response_data, dict):
+            raise TikWMAPIError(None)
+
+        return response_data
@@ -1,20 +1,109 @@
 
 
 import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
 
 from playwright.async_api import Browser, BrowserContext, Page, Playwright, ProxySettings, async_playwright
 
 from tikorgzo.constants import CHROME_USER_DATA_DIR
-from tikorgzo.exceptions import MissingChromeBrowserError
+from tikorgzo.core.extractors.tikwm.constants import (
+    DAEMON_CONNECT_TIMEOUT,
+    DAEMON_HOST,
+    DAEMON_PROXY_FILE,
+    DEVTOOLS_ACTIVE_PORT_FILE,
+    INPUT_FIELD_SELECTOR,
+    MAX_CONCURRENT_EXTRACTION_TASKS,
+    TIKTOK_DOWNLOADER_URL,
+    TIKWM_BASE_URL,
+    WEBPAGE_LOAD_TIMEOUT,
+)
+from tikorgzo.core.extractors.tikwm.request_filter import RequestFilter
+from tikorgzo.exceptions import ExtractionTimeoutError, MissingChromeBrowserError, MissingPlaywrightBrowserError
+
+
+def get_daemon_endpoint(user_data_dir: Path) -> str | None:
+    """Returns the DevTools endpoint of the browser daemon running on the Chrome profile,
+    or None if there's none. The endpoint may still be stale if the daemon didn't exit
+    cleanly, which is only found out once connecting to it fails.
+    """
+
+    try:
+        port = (user_data_dir / DEVTOOLS_ACTIVE_PORT_FILE).read_text(encoding="utf-8").splitlines()[0].strip()
+    except (OSError, IndexError):
+        return None
+
+    return f"http://{DAEMON_HOST}:{port}" if port.isdigit() else None
+
+
+def get_daemon_proxy(user_data_dir: Path) -> str | None:
+    """Returns the proxy that the browser daemon running on the Chrome profile uses, which
+    is an empty string if it uses none, or None if the daemon didn't tell.
+    """
+
+    try:
+        return (user_data_dir / DAEMON_PROXY_FILE).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+
+@dataclass(frozen=True)
+class TikWMClearance:
+    """What the browser got after passing the TikWM website's bot check, which is needed to
+    send requests to the TikWM API outside of the browser.
+
+    Attributes:
+        user_agent (str): The user agent of the browser, as the clearance cookie is tied to it.
+        cookies (dict[str, str]): The cookies of the TikWM website, including the clearance cookie.
+
+    """
+
+    user_agent: str
+    cookies: dict[str, str]
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {
+            "User-Agent": self.user_agent,
+            "Origin": TIKWM_BASE_URL,
+            "Referer": TIKTOK_DOWNLOADER_URL,
+            "X-Requested-With": "XMLHttpRequest",
+        }
 
 
 class ScrapeBrowser:
+    # pylint: disable=too-many-instance-attributes
     """Manages the initialization and cleanup of a Playwright browser instance that
-    will be used for getting download links from TikWM API.
+    will be used for getting download links from TikWM API, along with a pool of
+    already loaded TikWM downloader pages that are reused across extractions.
+
+    If the browser daemon is running on the same Chrome profile with the same proxy, its
+    browser is attached to instead of launching a new one, which skips the browser startup
+    and, most of the time, the website's bot check. The clearance of the bot check is tied
+    to the proxy, so a daemon with another proxy is never attached to. Only the pages and
+    the request filter of this run are removed on cleanup, so that the daemon's browser
+    stays alive for the other runs attached to it and the next ones.
     """
 
-    def __init__(self, proxy: str | None = None) -> None:
+    launch_args: tuple[str, ...] = ("--disable-blink-features=AutomationControlled",)
+
+    def __init__(
+        self,
+        proxy: str | None = None,
+        page_pool_size: int = MAX_CONCURRENT_EXTRACTION_TASKS,
+        request_filter: RequestFilter | None = None,
+        user_data_dir: Path = CHROME_USER_DATA_DIR,
+    ) -> None:
         self._proxy = proxy
+        self._user_data_dir = user_data_dir
+        self._request_filter = request_filter
+        self._page_pool_size = page_pool_size
+        self._page_slots = asyncio.Semaphore(page_pool_size)
+        self._idle_pages: asyncio.Queue[Page] = asyncio.Queue()
+        self._opened_pages: list[Page] = []
+        self._route_handler = request_filter.handle if request_filter is not None else None
         self._playwright: Playwright | None = None
         self._browser: Browser | None = None
         self.context: BrowserContext | None = None
@@ -35,17 +124,10 @@ class ScrapeBrowser:
 
         try:
             self._playwright = await async_playwright().start()
-            self.context = await self._playwright.chromium.launch_persistent_context(
-                user_data_dir=CHROME_USER_DATA_DIR,
-                channel="chrome",
-                headless=False,
-                accept_downloads=True,
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                ],
-                viewport={"width": 500, "height": 200},
-                proxy=proxy,
-            )
+            self.context = await self._attach_to_daemon(self._playwright) or await self._launch(self._playwright, proxy)
+
+            if self._route_handler is not None:
+                await self.context.route("**/*", self._route_handler)
         except asyncio.CancelledError:
             await asyncio.sleep(1)
             await self.cleanup()
@@ -58,12 +140,146 @@ class ScrapeBrowser:
                 raise MissingChromeBrowserError from None
             raise e  # noqa: TRY201
 
+    async def _launch(self, playwright: Playwright, proxy: ProxySettings | None) -> BrowserContext:
+        return await playwright.chromium.launch_persistent_context(
+            user_data_dir=self._user_data_dir,
+            channel="chrome",
+            headless=False,
+            accept_downloads=True,
+            args=list(self.launch_args),
+            viewport={"width": 500, "height": 200},
+            proxy=proxy,
+        )
+
+    @property
+    def is_attached(self) -> bool:
+        """Whether the browser is the browser daemon's instead of one launched here."""
+        return self._browser is not None
+
+    async def _attach_to_daemon(self, playwright: Playwright) -> BrowserContext | None:
+        """Connects to the browser daemon running on the Chrome profile and returns its
+        browser context, or returns None if there's no daemon with the proxy of this run
+        to connect to.
+        """
+
+        # The browser's requests go out through the daemon's proxy, while the API requests
+        # go out through the proxy of this run, so the clearance would never be valid for
+        # the API if they differed
+        if get_daemon_proxy(self._user_data_dir) != (self._proxy or ""):
+            return None
+
+        return await self._connect_to_daemon(playwright)
+
+    async def _connect_to_daemon(self, playwright: Playwright) -> BrowserContext | None:
+        endpoint = get_daemon_endpoint(self._user_data_dir)
+
+        if endpoint is None:
+            return None
+
+        try:
+            self._browser = await playwright.chromium.connect_over_cdp(endpoint, timeout=DAEMON_CONNECT_TIMEOUT)
+        except Exception:
+            # The daemon isn't running anymore, so a browser is launched as usual
+            return None
+
+        return self._browser.contexts[0]
+
+    async def get_clearance(self) -> TikWMClearance:
+        """Opens the TikWM website so that the browser passes its bot check (if there's any),
+        and returns the cookies and user agent that the browser ended up with.
+        """
+
+        page = await self._open_downloader_page()
+
+        try:
+            user_agent: str = await page.evaluate("() => navigator.userAgent")
+        finally:
+            await page.close()
+
+        assert self.context is not None
+        cookies = await self.context.cookies(TIKWM_BASE_URL)
+        return TikWMClearance(
+            user_agent=user_agent,
+            cookies={cookie["name"]: cookie["value"] for cookie in cookies if "name" in cookie and "value" in cookie},
+        )
+
+    async def fill_page_pool(self) -> None:
+        """Loads all pages of the page pool at once, so that the first extractions don't
+        have to wait for their pages to load.
+        """
+
+        pages = await asyncio.gather(*(self._open_downloader_page() for _ in range(self._page_pool_size - self._idle_pages.qsize())))
+
+        for page in pages:
+            self._idle_pages.put_nowait(page)
+
+    @asynccontextmanager
+    async def pooled_page(self) -> AsyncGenerator[Page]:
+        """Lends an already loaded TikWM downloader page from the page pool (loading a new
+        one if there's no idle page), which goes back to the pool once done so that the next
+        link can be submitted on it without loading the page again.
+
+        If anything goes wrong while the page is in use, the page is closed instead, as it
+        may be stuck in an error state, and a fresh one takes its place when needed.
+
+        Yields:
+            Page: A loaded TikWM downloader page.
+
+        """
+
+        async with self._page_slots:
+            page = None
+
+            while not self._idle_pages.empty():
+                idle_page = self._idle_pages.get_nowait()
+                if not idle_page.is_closed():
+                    page = idle_page
+                    break
+
+            if page is None:
+                page = await self._open_downloader_page()
+
+            try:
+                yield page
+            except BaseException:
+                await page.close()
+                raise
+
+            self._idle_pages.put_nowait(page)
+
+    async def _open_downloader_page(self) -> Page:
+        if self.context is None:
+            raise MissingPlaywrightBrowserError
+
+        page = await self.context.new_page()
+        self._opened_pages.append(page)
+
+        try:
+            # The page is ready once the link can be submitted, which happens way before
+            # everything else on the page (e.g., ads and analytics) has finished loading
+            await page.goto(TIKTOK_DOWNLOADER_URL, timeout=WEBPAGE_LOAD_TIMEOUT, wait_until="domcontentloaded")
+            await page.wait_for_selector(INPUT_FIELD_SELECTOR, state="visible", timeout=WEBPAGE_LOAD_TIMEOUT)
+        except Exception:
+            await page.close()
+            msg = "Cannot load webpage due to timeout; the website may be slow."
+            raise ExtractionTimeoutError(msg) from None
+
+        return page
+
     async def cleanup(self) -> None:
         if self.page:
             await self.page.close()
-        if self.context:
-            await self.context.close()
         if self._browser:
+            # The daemon's browser is only disconnected from, leaving it running without
+            # the pages and request filter of this run (including the pages that are still
+            # in use), while the routes of the other runs attached to it are kept
+            for page in self._opened_pages:
+                if not page.is_closed():
+                    await page.close()
+            if self.context and self._route_handler is not None:
+                await self.context.unroute("**/*", self._route_handler)
             await self._browser.close()
+        elif self.context:
+            await self.context.close()
         if self._playwright:
             await self._playwright.stop()
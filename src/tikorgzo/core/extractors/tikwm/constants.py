@@ -2,3 +2,48 @@ TIKTOK_DOWNLOADER_URL = r"https://www.tikwm.com/originalDownloader.html"
 WEBPAGE_LOAD_TIMEOUT = 10000
 ELEMENT_LOAD_TIMEOUT = 30000
 MAX_CONCURRENT_EXTRACTION_TASKS = 5
+INPUT_FIELD_SELECTOR = "input#params"
+# Marks the results left on a reused page by its previous submission
+STALE_RESULT_ATTRIBUTE = "data-tikorgzo-stale"
+
+# Hybrid extraction constants
+TIKWM_BASE_URL = r"https://www.tikwm.com"
+TIKWM_API_URL = r"https://www.tikwm.com/api/"
+TIKWM_API_PATH = "/api/"
+API_REQUEST_TIMEOUT = 30
+API_RATE_LIMIT_MESSAGE = "Free Api Limit"
+API_URL_PARSING_FAILED_MESSAGE = "Url parsing is failed"
+# Cloudflare answers with these when the clearance cookie is missing or has expired
+CLEARANCE_EXPIRED_STATUSES = (403, 503)
+
+# Request filter constants
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+# Hosts (and their subdomains) that the TikWM website needs, where the Cloudflare ones are
+# for its bot check and the rest are common CDNs where scripts may be loaded from
+ALLOWED_HOSTS = ("tikwm.com", "cloudflare.com", "jsdelivr.net", "unpkg.com", "jquery.com", "googleapis.com")
+
+# Sharded extraction constants. Each worker process runs its own browser with a clone of the
+# main Chrome profile, as a profile can only be used by one browser at a time.
+WORKER_PROFILE_DIR_NAME = "chrome_user_data_worker_{}"
+# Files that mark a profile as in use by a running browser (or the browser daemon), which
+# shouldn't be cloned
+PROFILE_LOCK_FILES = ("Singleton*", "lockfile", "*.lock", "DevToolsActivePort", "DaemonProxy")
+WORKER_START_TIMEOUT = 120
+WORKER_STOP_TIMEOUT = 10
+RESULT_POLL_INTERVAL = 1.0
+# Kinds of the messages that the workers send back to the parent process
+WORKER_READY_MESSAGE = "ready"
+VIDEO_TAKEN_MESSAGE = "taken"
+VIDEO_RESULT_MESSAGE = "result"
+
+# Browser daemon constants. Chrome writes the port of its DevTools endpoint to a file in the
+# profile, where port 0 lets Chrome pick a free one.
+DEVTOOLS_ACTIVE_PORT_FILE = "DevToolsActivePort"
+# The daemon writes the proxy that its browser uses next to the port file, where an empty
+# file means that it uses none
+DAEMON_PROXY_FILE = "DaemonProxy"
+DAEMON_REMOTE_DEBUGGING_ARG = "--remote-debugging-port=0"
+DAEMON_HOST = "127.0.0.1"
+DAEMON_CONNECT_TIMEOUT = 2000
+# How often (in seconds) the daemon reloads its page, so that it keeps passing the bot check
+DAEMON_REFRESH_INTERVAL = 600
@@ -0,0 +1,76 @@
+import asyncio
+
+from playwright.async_api import BrowserContext, Playwright
+
+from tikorgzo.cli.text_printer import console
+from tikorgzo.core.extractors.tikwm.browser import ScrapeBrowser
+from tikorgzo.core.extractors.tikwm.constants import (
+    DAEMON_PROXY_FILE,
+    DAEMON_REFRESH_INTERVAL,
+    DAEMON_REMOTE_DEBUGGING_ARG,
+    DEVTOOLS_ACTIVE_PORT_FILE,
+    WEBPAGE_LOAD_TIMEOUT,
+)
+from tikorgzo.exceptions import BrowserDaemonRunningError
+
+
+class BrowserDaemon(ScrapeBrowser):
+    """A browser that is kept running between the app's runs, so that they attach to it
+    instead of launching their own. Its DevTools endpoint is only reachable from this
+    machine, and its port is written by Chrome into the Chrome profile, which is where the
+    runs look for it. Its proxy is written next to it, as only the runs with the same proxy
+    attach to it.
+
+    The daemon keeps the TikWM website open and reloads it every once in a while, so that
+    the browser keeps passing the website's bot check even when no run is using it.
+    """
+
+    launch_args = (*ScrapeBrowser.launch_args, DAEMON_REMOTE_DEBUGGING_ARG)
+
+    async def initialize(self) -> None:
+        await super().initialize()
+        (self._user_data_dir / DAEMON_PROXY_FILE).write_text(self._proxy or "", encoding="utf-8")
+
+    async def serve(self) -> None:
+        """Keeps the browser warmed until it's closed or the daemon is stopped."""
+
+        assert self.context is not None
+        self.page = await self._open_downloader_page()
+
+        closed = asyncio.Event()
+        self.context.on("close", lambda _: closed.set())
+
+        while True:
+            try:
+                await asyncio.wait_for(closed.wait(), timeout=DAEMON_REFRESH_INTERVAL)
+            except TimeoutError:
+                await self._refresh_page()
+            else:
+                return
+
+    async def cleanup(self) -> None:
+        is_attached = self.is_attached
+        await super().cleanup()
+
+        # Chrome may leave the port file behind, which would make the next runs try to
+        # attach to a browser that isn't there anymore. If this got attached to another
+        # daemon instead, its files are left alone.
+        if not is_attached:
+            (self._user_data_dir / DEVTOOLS_ACTIVE_PORT_FILE).unlink(missing_ok=True)
+            (self._user_data_dir / DAEMON_PROXY_FILE).unlink(missing_ok=True)
+
+    async def _attach_to_daemon(self, playwright: Playwright) -> BrowserContext | None:
+        # The daemon has to own its browser, so it's only checked that there's no other
+        # daemon, whatever its proxy is
+        if await self._connect_to_daemon(playwright) is not None:
+            raise BrowserDaemonRunningError
+        return None
+
+    async def _refresh_page(self) -> None:
+        if self.page is None or self.page.is_closed():
+            return
+
+        try:
+            await self.page.reload(timeout=WEBPAGE_LOAD_TIMEOUT, wait_until="domcontentloaded")
+        except Exception as e:
+            console.print(f"[yellow]warning[/yellow]: Failed to reload the TikWM website due to: {type(e).__name__}: {e}")
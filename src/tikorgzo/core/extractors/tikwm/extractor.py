@@ -1,37 +1,82 @@
 import asyncio
+from pathlib import Path
+from typing import Any, cast
+from urllib.parse import urljoin, urlsplit
 
 import aiohttp
-from playwright.async_api import Page
+from playwright.async_api import Page, Response
 
 from tikorgzo.cli.text_printer import console
+from tikorgzo.constants import CHROME_USER_DATA_DIR, TIKWM_EXTRACTOR_NAME
 from tikorgzo.core.extractors.base import BaseExtractor
+from tikorgzo.core.extractors.tikwm.api import TikWMAPIClient, get_download_source, get_response_data
 from tikorgzo.core.extractors.tikwm.browser import ScrapeBrowser
-from tikorgzo.core.extractors.tikwm.constants import ELEMENT_LOAD_TIMEOUT, TIKTOK_DOWNLOADER_URL, WEBPAGE_LOAD_TIMEOUT
+from tikorgzo.core.extractors.tikwm.constants import ELEMENT_LOAD_TIMEOUT, INPUT_FIELD_SELECTOR, STALE_RESULT_ATTRIBUTE, TIKWM_API_PATH, TIKWM_BASE_URL
+from tikorgzo.core.extractors.tikwm.request_filter import RequestFilter
+from tikorgzo.core.rate_limiter.model import RateLimiter
 from tikorgzo.core.video import helpers as fn
 from tikorgzo.core.video.model import Video
-from tikorgzo.exceptions import ExtractionTimeoutError, HrefLinkMissingError, HtmlElementMissingError, MissingPlaywrightBrowserError, URLParsingError, VagueErrorMessageError
+from tikorgzo.exceptions import (
+    APIStructureMismatchError,
+    HrefLinkMissingError,
+    HtmlElementMissingError,
+    MissingPlaywrightBrowserError,
+    URLParsingError,
+    VagueErrorMessageError,
+)
 
 
-class TikWMExtractor(BaseExtractor):
-    """A link extractor from TikWM API."""
+def _is_api_response(response: Response) -> bool:
+    return response.request.method == "POST" and urlsplit(response.url).path == TIKWM_API_PATH
+
 
-    def __init__(self, extraction_delay: float, proxy: str | None = None) -> None:
+class TikWMExtractor(BaseExtractor):
+    """A link extractor from TikWM API.
+
+    By default, each link is submitted through the TikWM website in its own browser page.
+    If a session is given for hybrid extraction, the browser is only used to pass the
+    website's bot check, and the links are submitted straight to the TikWM API through
+    that session instead.
+
+    The browser uses the Chrome profile in `user_data_dir`, which can only be used by one
+    browser at a time.
+    """
+
+    name = TIKWM_EXTRACTOR_NAME
+    user_data_dir: Path = CHROME_USER_DATA_DIR
+
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        proxy: str | None = None,
+        hybrid_session: aiohttp.ClientSession | None = None,
+        load_all_resources: bool = False,
+    ) -> None:
         self.browser: ScrapeBrowser | None = None
+        self.api_client: TikWMAPIClient | None = None
         self.proxy = proxy
-        super().__init__(extraction_delay)
-
-    async def process_video_links(self, videos: list[Video]) -> list[Video | BaseException]:
-        tasks = [self._extract(video) for video in videos]
-        return await asyncio.gather(*tasks, return_exceptions=True)
+        self._load_all_resources = load_all_resources
+        self._hybrid_session = hybrid_session
+        super().__init__(rate_limiter)
 
     async def cleanup(self) -> None:
         if self.browser:
             await self.browser.cleanup()
 
     async def initialize(self) -> None:
+        self.browser = ScrapeBrowser(
+            proxy=self.proxy,
+            request_filter=None if self._load_all_resources else RequestFilter(),
+            user_data_dir=self.user_data_dir,
+        )
+
         try:
-            self.browser = ScrapeBrowser(proxy=self.proxy)
             await self.browser.initialize()
+
+            if self._hybrid_session is not None:
+                self.api_client = TikWMAPIClient(self._hybrid_session, self.browser, self.rate_limiter)
+            else:
+                await self.browser.fill_page_pool()
         except asyncio.CancelledError:
             if self.browser:
                 await self.browser.cleanup()
@@ -41,81 +86,121 @@ class TikWMExtractor(BaseExtractor):
                 await self.browser.cleanup()
             raise
 
-    async def _extract(self, video: Video) -> Video:
+    async def get_video_data(self, video_link: str) -> dict[str, Any]:
+        """Returns the `data` object of the TikWM API response for the video link. If it had
+        to be scraped from the page instead, only the `play` and `author` fields are set.
+        """
+
         # The code is wrapped inside the semaphore so that a maximum number of tasks will be handled
         # at a time
         async with self.semaphore:
-            try:
-                if self.browser is None or self.browser.context is None:
-                    raise MissingPlaywrightBrowserError  # noqa: TRY301
-
-                page = await self.browser.context.new_page()
-                await self._open_webpage(page)
-                await self._submit_link(page, video.video_link)
-                video = await self._get_download_link(page, video)
-                await page.close()
-
-                return video
-            except (
-                ExtractionTimeoutError,
-                HrefLinkMissingError,
-                HtmlElementMissingError,
-                URLParsingError,
-                VagueErrorMessageError,
-            ) as e:
-                console.print(f"Skipping {video.video_id} due to: [red]{type(e).__name__}: {e}[/red]")
-                # Needs to re-raise so that the mainline script (main.py) will caught this exception
-                # thus, the program can filter tasks that are successful and not these failed tasks
-                # due to these exception
-                raise e  # noqa: TRY201
-            except asyncio.CancelledError as e:
-                console.print(f"Skipping {video.video_id} due to: [red]UserCancelledAction[/red]")
-                # Needs to re-raise so that the mainline script (main.py) will caught this exception
-                # thus, the program can filter tasks that are successful and not these failed tasks
-                # due to these exception
-                raise e  # noqa: TRY201
-            except Exception as e:
-                console.print(f"Skipping {video.video_id} due to: [red]{type(e).__name__}: {e}[/red]")
-                raise e  # noqa: TRY201
-
-    async def _open_webpage(self, page: Page) -> None:
+            if self.api_client is not None:
+                return await self.api_client.get_video_data(video_link)
+            return await self._get_video_data_from_webpage(video_link)
+
+    async def _extract(self, video: Video) -> Video:
+        data = await self.get_video_data(video.video_link)
+        return await self._set_video_details(video, data)
+
+    async def _get_video_data_from_webpage(self, video_link: str) -> dict[str, Any]:
+        if self.browser is None or self.browser.context is None:
+            raise MissingPlaywrightBrowserError
+
+        async with self.browser.pooled_page() as page:
+            data = await self._submit_link(page, video_link)
+
+            if data is not None:
+                return data
+
+            # The API response couldn't be captured, so the result is scraped from the page instead
+            return await self._scrape_video_data(page)
+
+    async def _set_video_details(self, video: Video, data: dict[str, Any]) -> Video:
+        """Sets the download link, username and file size of the video from the `data`
+        object of a TikWM API response.
+        """
+
         try:
-            await page.goto(TIKTOK_DOWNLOADER_URL, timeout=WEBPAGE_LOAD_TIMEOUT)
-            await page.wait_for_load_state("networkidle", timeout=WEBPAGE_LOAD_TIMEOUT)
-        except Exception:
-            msg = "Cannot load webpage due to timeout; the website may be slow."
-            raise ExtractionTimeoutError(msg) from None
+            download_path, file_size = get_download_source(data)
+            username: str = data["author"]["unique_id"]
+        except (KeyError, TypeError):
+            msg = "Data containing the download link or username from TikWM API is missing or may have changed."
+            raise APIStructureMismatchError(msg) from None
+
+        if video.username is None:
+            video.username = username
+            fn.assign_output_paths(video)
+
+        # If the API doesn't tell the file size, it's taken from the download response itself
+        if file_size is not None:
+            video.file_size = file_size
+
+        video.download_link = urljoin(TIKWM_BASE_URL, download_path)
+
+        console.print(f"Download link retrieved for {video.video_id} (@{video.username})")
+
+        return video
+
+    async def _submit_link(self, page: Page, video_link: str) -> dict[str, Any] | None:
+        """Submits the video link on the page and returns the `data` object of the TikWM API
+        response that the page got for it, as soon as it arrives. If the response can't be
+        captured, this returns None and the result has to be scraped from the page instead.
+        """
 
-    async def _submit_link(self, page: Page, video_link: str) -> None:
-        input_field_selector = "input#params"
+        # Pages are reused, so the download links from the previous submission are marked
+        # as stale to not mistake them for the result of this one
+        await page.evaluate(f"() => document.querySelectorAll('a').forEach((a) => a.setAttribute('{STALE_RESULT_ATTRIBUTE}', ''))")
 
         try:
-            await page.locator(input_field_selector).fill(video_link, timeout=ELEMENT_LOAD_TIMEOUT)
+            await page.locator(INPUT_FIELD_SELECTOR).fill(video_link, timeout=ELEMENT_LOAD_TIMEOUT)
         except Exception:
-            raise HtmlElementMissingError(input_field_selector) from None
-
-        submit_button_selector = "button:has-text('Submit')"
+            raise HtmlElementMissingError(INPUT_FIELD_SELECTOR) from None
 
         while True:
-            try:
-                await page.locator(submit_button_selector).click()
-            except Exception:
-                raise HtmlElementMissingError(submit_button_selector) from None
-
-            # Wait for either the limit message or the next step to appear
-            limit_selector = "div:has-text('Free Api Limit: 1 request/second.')"
-            try:
-                # Wait briefly to see if the limit message appears
-                await page.wait_for_selector(limit_selector, state="visible", timeout=2000)
-                # If limit message appears, wait and retry
-                await asyncio.sleep(self._extraction_delay)
+            await self.rate_limiter.acquire()
+            response_data = await self._click_submit(page)
+
+            if response_data is None:
+                return None
+
+            data = get_response_data(response_data)
+
+            if data is None:
+                # The API rate limited us, so submit again once the rate limiter allows it
+                self.rate_limiter.on_rate_limited()
                 continue
-            except Exception:
-                # If limit message does not appear, break loop
-                break
 
-    async def _get_download_link(self, page: Page, video: Video) -> Video:
-        download_link_selector = "a:has-text('Watermark')"
+            self.rate_limiter.on_success()
+            return data
+
+    async def _click_submit(self, page: Page) -> dict[str, Any] | None:
+        """Clicks the submit button and returns the JSON body of the API response that the
+        page got, or None if it couldn't be captured.
+        """
+
+        submit_button_selector = "button:has-text('Submit')"
+
+        try:
+            async with page.expect_response(_is_api_response, timeout=ELEMENT_LOAD_TIMEOUT) as response_info:
+                try:
+                    await page.locator(submit_button_selector).click()
+                except Exception:
+                    raise HtmlElementMissingError(submit_button_selector) from None
+
+            response_data = await (await response_info.value).json()
+        except HtmlElementMissingError:
+            raise
+        except Exception:
+            return None
+
+        return cast("dict[str, Any]", response_data) if isinstance(response_data, dict) else None
+
+    async def _scrape_video_data(self, page: Page) -> dict[str, Any]:
+        """Scrapes the download link and username from the page, in the same shape as the
+        `data` object of the TikWM API response.
+        """
+
+        download_link_selector = f"a:has-text('Watermark'):not([{STALE_RESULT_ATTRIBUTE}])"
         parsing_error_selector = "div:has-text('Url parsing is failed!')"
         vague_error_selector = "div:has-text('error')"
 
@@ -144,19 +229,4 @@ class TikWMExtractor(BaseExtractor):
         h4_elements = page.locator("h4")
         username = await h4_elements.nth(2).inner_text()
 
-        if video.username is None:
-            video.username = username
-            fn.assign_output_paths(video)
-
-        video.file_size = await self._get_file_size(download_url)
-        video.download_link = download_url
-
-        console.print(f"Download link retrieved for {video.video_id} (@{video.username})")
-
-        return video
-
-    async def _get_file_size(self, download_url: str) -> float:
-        async with aiohttp.ClientSession() as session, session.get(download_url) as response:
-            response.raise_for_status()
-            total_size_bytes = float(response.headers.get("content-length", 0))
-            return total_size_bytes  # noqa: RET504
+        return {"play": download_url, "author": {"unique_id": username.removeprefix("@")}}
@@ -0,0 +1,48 @@
+from collections.abc import Iterable
+from urllib.parse import urlsplit
+
+from playwright.async_api import Route
+
+from tikorgzo.core.extractors.tikwm.constants import ALLOWED_HOSTS, BLOCKED_RESOURCE_TYPES
+
+
+class RequestFilter:
+    """Aborts the requests of the browser that aren't needed for extraction (e.g., images,
+    fonts, ads, and analytics), which makes the TikWM website load faster and use less
+    bandwidth.
+
+    Attributes:
+        blocked_resource_types (frozenset[str]): The Playwright resource types to abort.
+        allowed_hosts (tuple[str, ...]): The hosts (including their subdomains) that requests
+            are allowed to go to, where requests to any other host are aborted.
+
+    Args:
+        blocked_resource_types (Iterable[str]): The Playwright resource types to abort.
+        allowed_hosts (Iterable[str]): The hosts that requests are allowed to go to.
+
+    """
+
+    def __init__(
+        self,
+        blocked_resource_types: Iterable[str] = BLOCKED_RESOURCE_TYPES,
+        allowed_hosts: Iterable[str] = ALLOWED_HOSTS,
+    ) -> None:
+        self.blocked_resource_types = frozenset(blocked_resource_types)
+        self.allowed_hosts = tuple(allowed_hosts)
+
+    def is_allowed(self, url: str, resource_type: str) -> bool:
+        if resource_type in self.blocked_resource_types:
+            return False
+
+        host = urlsplit(url).hostname or ""
+        return any(host == allowed_host or host.endswith("." + allowed_host) for allowed_host in self.allowed_hosts)
+
+    async def handle(self, route: Route) -> None:
+        """Route handler to be registered on the browser context."""
+
+        request = route.request
+
+        if self.is_allowed(request.url, request.resource_type):
+            await route.continue_()
+        else:
+            await route.abort()
@@ -0,0 +1,363 @@
+import asyncio
+import itertools
+import multiprocessing
+import queue
+import shutil
+import signal
+import sys
+from collections import Counter
+from collections.abc import Sequence
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from tikorgzo import exceptions
+from tikorgzo.constants import CHROME_USER_DATA_DIR
+from tikorgzo.core.extractors.tikwm.constants import (
+    MAX_CONCURRENT_EXTRACTION_TASKS,
+    PROFILE_LOCK_FILES,
+    RESULT_POLL_INTERVAL,
+    VIDEO_RESULT_MESSAGE,
+    VIDEO_TAKEN_MESSAGE,
+    WORKER_PROFILE_DIR_NAME,
+    WORKER_READY_MESSAGE,
+    WORKER_START_TIMEOUT,
+    WORKER_STOP_TIMEOUT,
+)
+from tikorgzo.core.extractors.tikwm.extractor import TikWMExtractor
+from tikorgzo.core.rate_limiter.model import RateLimiter
+from tikorgzo.core.session.model import ClientSessionManager
+from tikorgzo.exceptions import ExtractionWorkerError
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+    from multiprocessing.queues import Queue
+
+
+@dataclass(frozen=True)
+class WorkerOptions:
+    """The options of a single extraction worker, which are sent to its process.
+
+    Attributes:
+        user_data_dir (Path): The Chrome profile that only this worker uses.
+        proxy (str | None): The proxy of this worker's browser and API requests.
+        extraction_delay (float): The pace that this worker's rate limiter starts at.
+        hybrid_extraction (bool): Whether the worker sends the links straight to the TikWM API.
+        load_all_resources (bool): Whether the worker's browser loads everything on the website.
+
+    """
+
+    user_data_dir: Path
+    proxy: str | None = None
+    extraction_delay: float = 0
+    hybrid_extraction: bool = False
+    load_all_resources: bool = False
+
+
+def get_worker_profile_dir(worker_index: int) -> Path:
+    return CHROME_USER_DATA_DIR.with_name(WORKER_PROFILE_DIR_NAME.format(worker_index))
+
+
+def split_extraction_delay(worker_proxies: Sequence[str | None], extraction_delay: float) -> list[float]:
+    """Returns the extraction delay of each worker from the proxy of each worker. The workers
+    that go through the same proxy share its IP, and so the rate limit of the TikWM website,
+    so the pace of the extraction delay is split between them.
+    """
+
+    workers_per_proxy = Counter(worker_proxies)
+    return [extraction_delay * workers_per_proxy[proxy] for proxy in worker_proxies]
+
+
+def clone_profile(source: Path, destination: Path) -> None:
+    """Clones the Chrome profile to the destination if it isn't there yet, so that the
+    worker starts with the cookies that the main profile got from the bot check. The
+    files that mark the profile as in use are left out.
+    """
+
+    if destination.exists():
+        return
+
+    if source.is_dir():
+        shutil.copytree(source, destination, ignore=shutil.ignore_patterns(*PROFILE_LOCK_FILES))
+    else:
+        destination.mkdir(parents=True)
+
+
+def describe_error(error: BaseException) -> tuple[str, str]:
+    """Returns the qualified name of the error's type and its message, which is how the
+    errors are sent between the processes.
+    """
+
+    return f"{type(error).__module__}.{type(error).__qualname__}", str(error)
+
+
+def rebuild_error(error_name: str, message: str) -> Exception:
+    """Rebuilds an error sent by `describe_error()` as the same type, so that it's handled
+    the same as if it was raised in this process. Errors whose type can't be found here
+    are rebuilt as an `ExtractionWorkerError` instead.
+    """
+
+    module_name, _, type_name = error_name.rpartition(".")
+    error_type = getattr(sys.modules.get(module_name), type_name, None)
+
+    if not isinstance(error_type, type) or not issubclass(error_type, Exception):
+        return ExtractionWorkerError(f"{type_name}: {message}")
+
+    if module_name == exceptions.__name__:
+        # The constructors of the app's errors build the message themselves from different
+        # arguments, so they're skipped and the message is set as is
+        error = error_type.__new__(error_type)
+        error.args = (message,)
+        error.message = message  # pyright: ignore[reportAttributeAccessIssue]
+        return error
+
+    try:
+        return error_type(message)
+    except TypeError:
+        return ExtractionWorkerError(f"{type_name}: {message}")
+
+
+def run_worker(worker_index: int, options: WorkerOptions, tasks: "Queue[Any]", results: "Queue[Any]") -> None:
+    """The entry point of the worker processes."""
+
+    # The parent process is the one that decides when the workers stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    asyncio.run(_run_worker(worker_index, options, tasks, results))
+
+
+async def _run_worker(worker_index: int, options: WorkerOptions, tasks: "Queue[Any]", results: "Queue[Any]") -> None:
+    session = ClientSessionManager(proxy=options.proxy) if options.hybrid_extraction else None
+    hybrid_session = session.client_session if session and isinstance(session.client_session, aiohttp.ClientSession) else None
+
+    extractor = TikWMExtractor(
+        RateLimiter.from_interval(options.extraction_delay),
+        proxy=options.proxy,
+        hybrid_session=hybrid_session,
+        load_all_resources=options.load_all_resources,
+    )
+    extractor.user_data_dir = options.user_data_dir
+
+    try:
+        try:
+            await extractor.initialize()
+        except Exception as e:
+            results.put((WORKER_READY_MESSAGE, worker_index, *describe_error(e)))
+            return
+
+        results.put((WORKER_READY_MESSAGE, worker_index, None, None))
+        await _serve_video_links(worker_index, extractor, tasks, results)
+    finally:
+        await extractor.cleanup()
+        if session is not None:
+            await session.close()
+
+
+async def _serve_video_links(worker_index: int, extractor: TikWMExtractor, tasks: "Queue[Any]", results: "Queue[Any]") -> None:
+    """Takes the video links from the shared queue until a `None` sentinel is received.
+    A link is only taken once the worker has room for it, so that the links are spread
+    over the workers that are free instead of piling up on the first one.
+    """
+
+    slots = asyncio.Semaphore(extractor.concurrency)
+    running: set[asyncio.Task[None]] = set()
+
+    async def get_video_data(request_id: int, video_link: str) -> None:
+        try:
+            data = await extractor.get_video_data(video_link)
+        except Exception as e:
+            results.put((VIDEO_RESULT_MESSAGE, request_id, None, *describe_error(e)))
+        else:
+            results.put((VIDEO_RESULT_MESSAGE, request_id, data, None, None))
+        finally:
+            slots.release()
+
+    while True:
+        await slots.acquire()
+        task = await asyncio.to_thread(tasks.get)
+
+        if task is None:
+            break
+
+        request_id, video_link = task
+        results.put((VIDEO_TAKEN_MESSAGE, worker_index, request_id))
+
+        running_task = asyncio.create_task(get_video_data(request_id, video_link))
+        running.add(running_task)
+        running_task.add_done_callback(running.discard)
+
+    if running:
+        await asyncio.gather(*running)
+
+
+class ShardedTikWMExtractor(TikWMExtractor):
+    # pylint: disable=too-many-instance-attributes
+    """A TikWM extractor that spreads the video links over several worker processes, where
+    each of them runs its own browser with its own clone of the Chrome profile (and
+    optionally its own proxy). The workers take the links from a shared queue and send the
+    TikWM API data back to this process, where the videos are updated as usual.
+
+    Each worker paces its requests with its own rate limiter, as the workers may go through
+    different proxies. The workers that go through the same proxy split its pace between
+    them, so that they don't send more than a single browser would through it.
+
+    Attributes:
+        worker_options (list[WorkerOptions]): The options of each worker.
+        _context (multiprocessing.context.SpawnContext): Where the processes and queues are made.
+        _tasks (Queue[Any]): The `(request_id, video_link)` items that the workers take.
+        _results (Queue[Any]): The messages that the workers send back.
+        _processes (list[BaseProcess]): The worker processes.
+        _pending (dict[int, asyncio.Future[dict[str, Any]]]): The requests that wait for their result.
+        _assigned (dict[int, int]): The worker that has taken each of the pending requests.
+        _request_ids (itertools.count[int]): Gives each request its own ID.
+        _reader (asyncio.Task[None] | None): Reads the results of the workers.
+
+    Args:
+        rate_limiter (RateLimiter): The rate limiter of the TikWM extractor.
+        worker_options (Sequence[WorkerOptions]): The options of each worker.
+
+    """
+
+    def __init__(self, rate_limiter: RateLimiter, worker_options: Sequence[WorkerOptions]) -> None:
+        super().__init__(rate_limiter)
+        self.worker_options = list(worker_options)
+        self.concurrency = len(self.worker_options) * MAX_CONCURRENT_EXTRACTION_TASKS
+        # Spawned processes are used on every platform, as forking a process with a running
+        # event loop isn't safe
+        self._context = multiprocessing.get_context("spawn")
+        self._tasks: Queue[Any] = self._context.Queue()
+        self._results: Queue[Any] = self._context.Queue()
+        self._processes: list[BaseProcess] = []
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._assigned: dict[int, int] = {}
+        self._request_ids = itertools.count()
+        self._reader: asyncio.Task[None] | None = None
+
+    async def initialize(self) -> None:
+        try:
+            for worker_index, options in enumerate(self.worker_options):
+                await asyncio.to_thread(clone_profile, self.user_data_dir, options.user_data_dir)
+
+                process = self._context.Process(
+                    target=run_worker,
+                    args=(worker_index, options, self._tasks, self._results),
+                    daemon=True,
+                )
+                process.start()
+                self._processes.append(process)
+
+            await self._wait_for_workers()
+        except BaseException:
+            await self.cleanup()
+            raise
+
+        self._reader = asyncio.create_task(self._read_results())
+
+    async def get_video_data(self, video_link: str) -> dict[str, Any]:
+        """Sends the video link to the workers and returns the data that one of them got for it."""
+
+        if not any(process.is_alive() for process in self._processes):
+            msg = "no worker is running"
+            raise ExtractionWorkerError(msg)
+
+        request_id = next(self._request_ids)
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._tasks.put((request_id, video_link))
+
+        try:
+            return await future
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def cleanup(self) -> None:
+        # Links that no worker has taken yet are dropped, so that the workers stop right away
+        with suppress(queue.Empty):
+            while True:
+                self._tasks.get_nowait()
+
+        for _ in self._processes:
+            self._tasks.put(None)
+
+        # The results are still read while the workers stop, as a worker can't exit until
+        # the results that it has sent are read
+        await asyncio.gather(*(asyncio.to_thread(process.join, WORKER_STOP_TIMEOUT) for process in self._processes))
+
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+
+        if self._reader is not None:
+            self._reader.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._reader
+
+        for future in self._pending.values():
+            future.cancel()
+
+        self._processes.clear()
+
+    async def _wait_for_workers(self) -> None:
+        """Waits for each worker to start its browser, raising the error of the first one
+        that fails to.
+        """
+
+        for _ in self._processes:
+            try:
+                _, _, error_name, message = await asyncio.to_thread(self._results.get, timeout=WORKER_START_TIMEOUT)
+            except queue.Empty:
+                msg = "the workers took too long to start"
+                raise ExtractionWorkerError(msg) from None
+
+            if error_name is not None:
+                raise rebuild_error(error_name, message)
+
+    async def _read_results(self) -> None:
+        while True:
+            try:
+                message = await asyncio.to_thread(self._results.get, timeout=RESULT_POLL_INTERVAL)
+            except queue.Empty:
+                self._fail_requests_of_stopped_workers()
+                continue
+
+            if message[0] == VIDEO_TAKEN_MESSAGE:
+                _, worker_index, request_id = message
+                self._assigned[request_id] = worker_index
+            elif message[0] == VIDEO_RESULT_MESSAGE:
+                _, request_id, data, error_name, error_message = message
+                self._assigned.pop(request_id, None)
+                self._set_result(request_id, data, rebuild_error(error_name, error_message) if error_name else None)
+
+    def _set_result(self, request_id: int, data: dict[str, Any] | None, error: Exception | None) -> None:
+        future = self._pending.get(request_id)
+
+        # The request may have been cancelled while the worker was still on it
+        if future is None or future.done():
+            return
+
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(data or {})
+
+    def _fail_requests_of_stopped_workers(self) -> None:
+        """Fails the requests of the workers that have exited unexpectedly, as their results
+        would never arrive otherwise. If none of the workers are left, the requests that
+        haven't been taken yet are failed as well.
+        """
+
+        for request_id, worker_index in list(self._assigned.items()):
+            process = self._processes[worker_index]
+
+            if not process.is_alive():
+                del self._assigned[request_id]
+                msg = f"worker {worker_index} exited with code {process.exitcode}"
+                self._set_result(request_id, None, ExtractionWorkerError(msg))
+
+        if not any(process.is_alive() for process in self._processes):
+            msg = "no worker is running"
+
+            for request_id in list(self._pending):
+                self._set_result(request_id, None, ExtractionWorkerError(msg))
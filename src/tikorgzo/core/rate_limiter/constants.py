@@ -0,0 +1,18 @@
+# The bucket holds a single token so that requests never go out in bursts
+BUCKET_CAPACITY = 1.0
+
+# How much the rate is multiplied by when the service signals that it's rate limiting us
+MULTIPLICATIVE_DECREASE = 0.5
+
+# How much of the reference rate (the maximum rate, or the backoff rate if there's no
+# maximum) is added back to the rate after each request that isn't rate limited
+ADDITIVE_INCREASE_RATIO = 0.1
+
+# The rate that unpaced limiters drop from the first time they get rate limited
+BACKOFF_RATE = 4.0
+
+# The rate never drops below this, in requests per second
+MIN_RATE = 0.05
+
+# The longest `Retry-After` that is honored, in seconds
+MAX_RETRY_AFTER = 300.0
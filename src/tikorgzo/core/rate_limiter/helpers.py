@@ -0,0 +1,29 @@
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+from tikorgzo.core.rate_limiter.constants import MAX_RETRY_AFTER
+
+
+def parse_retry_after(value: str | None, now: datetime | None = None) -> float | None:
+    """Parses a `Retry-After` header, which is either a number of seconds or an HTTP date,
+    into the number of seconds to wait. Returns None if the header is missing or invalid.
+    """
+
+    if not value:
+        return None
+
+    value = value.strip()
+
+    if value.isdigit():
+        return min(float(value), MAX_RETRY_AFTER)
+
+    try:
+        retry_date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=UTC)
+
+    seconds = (retry_date - (now or datetime.now(tz=UTC))).total_seconds()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
@@ -0,0 +1,144 @@
+import asyncio
+import math
+import time
+from collections.abc import Callable
+
+from tikorgzo.core.rate_limiter.constants import (
+    ADDITIVE_INCREASE_RATIO,
+    BACKOFF_RATE,
+    BUCKET_CAPACITY,
+    MIN_RATE,
+    MULTIPLICATIVE_DECREASE,
+)
+
+
+class RateLimiter:
+    # pylint: disable=too-many-instance-attributes
+    """Paces the requests sent to a rate-limited service with a token bucket, where the
+    rate adapts to the service's limit signals (AIMD): it's cut by half each time the
+    service rate limits us, and added back bit by bit with each request that goes through.
+    This keeps the requests right at the service's limit without flooding it with retries.
+
+    Attributes:
+        max_rate (float): The highest rate in requests per second, which is infinite if
+            the requests aren't paced until the service rate limits them.
+        min_rate (float): The lowest rate that the limiter backs off to.
+        rate (float): The current rate in requests per second.
+        _tokens (float): How many requests can be sent right away.
+        _last_refill (float): When the tokens were last refilled.
+        _blocked_until (float): When the `Retry-After` given by the service ends.
+        _last_decrease (float): When the rate was last decreased.
+        _lock (asyncio.Lock): Makes the waiting requests take their turns in order.
+        _clock (Callable[[], float]): Returns the current monotonic time in seconds.
+
+    Args:
+        max_rate (float | None): The highest rate in requests per second, or None to not
+            pace the requests until the service rate limits them.
+        min_rate (float): The lowest rate that the limiter backs off to.
+        clock (Callable[[], float]): Returns the current monotonic time in seconds.
+
+    """
+
+    def __init__(
+        self,
+        max_rate: float | None = None,
+        min_rate: float = MIN_RATE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_rate = max_rate if max_rate is not None else math.inf
+        self.min_rate = min(min_rate, self.max_rate)
+        self.rate = self.max_rate
+        self._clock = clock
+        self._tokens = BUCKET_CAPACITY
+        self._last_refill = clock()
+        self._blocked_until = 0.0
+        self._last_decrease = -math.inf
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_interval(cls, interval: float) -> "RateLimiter":
+        """Creates a limiter that sends at most one request per `interval` seconds, or one
+        that isn't paced until the service rate limits it if the interval is zero.
+        """
+
+        return cls(max_rate=1 / interval if interval > 0 else None)
+
+    async def acquire(self) -> None:
+        """Waits until the next request can be sent."""
+
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._refill(now)
+
+                wait = self._blocked_until - now
+
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+
+                # The rate may change while waiting, so the wait is computed again afterwards
+                await asyncio.sleep(wait)
+
+    def on_success(self) -> None:
+        """Slowly raises the rate back after a request that isn't rate limited."""
+
+        if self.rate < self.max_rate:
+            reference_rate = self.max_rate if math.isfinite(self.max_rate) else BACKOFF_RATE
+            self.rate = min(self.rate + reference_rate * ADDITIVE_INCREASE_RATIO, self.max_rate)
+
+    def on_rate_limited(self, retry_after: float | None = None) -> None:
+        """Lowers the rate after the service rate limits a request, and holds off all
+        requests for the `Retry-After` duration if the service gave one.
+        """
+
+        now = self._clock()
+
+        if retry_after is not None:
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+
+        # The requests that were already sent when the limit was hit usually get rate limited
+        # too, so the rate is only cut once for them instead of once for each of them
+        if math.isfinite(self.rate) and now - self._last_decrease < 1 / self.rate:
+            return
+
+        current_rate = self.rate if math.isfinite(self.rate) else BACKOFF_RATE
+        self.rate = max(current_rate * MULTIPLICATIVE_DECREASE, self.min_rate)
+        self._tokens = 0.0
+        self._last_refill = now
+        self._last_decrease = now
+
+    def _refill(self, now: float) -> None:
+        if math.isinf(self.rate):
+            self._tokens = BUCKET_CAPACITY
+        else:
+            self._tokens = min(self._tokens + (now - self._last_refill) * self.rate, BUCKET_CAPACITY)
+        self._last_refill = now
+
+
+class RateLimiterRegistry:
+    """Holds one shared rate limiter for each rate-limited service, so that the extractors
+    and the download strategies that send requests to the same service pace them together.
+
+    Attributes:
+        _rate_limiters (dict[str, RateLimiter]): The rate limiters by their key.
+
+    """
+
+    def __init__(self) -> None:
+        self._rate_limiters: dict[str, RateLimiter] = {}
+
+    def get(self, key: str, interval: float = 0) -> RateLimiter:
+        """Returns the rate limiter of the service, which is usually a host name. It's created
+        on first use with at most one request per `interval` seconds.
+        """
+
+        rate_limiter = self._rate_limiters.get(key)
+
+        if rate_limiter is None:
+            rate_limiter = RateLimiter.from_interval(interval)
+            self._rate_limiters[key] = rate_limiter
+
+        return rate_limiter
@@ -0,0 +1,10 @@
+# Connection pool of the aiohttp session. It's big enough to never be the bottleneck of the
+# extraction and download workers, while the connections are kept alive between requests so
+# that they're reused instead of going through a new TCP and TLS handshake each time.
+CONNECTION_POOL_SIZE = 256
+CONNECTIONS_PER_HOST = 64
+KEEPALIVE_TIMEOUT = 30
+DNS_CACHE_TTL = 300
+
+# Connection pool of the requests session, which is shared by the worker threads
+REQUESTS_POOL_SIZE = 32
@@ -1,29 +1,52 @@
 import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 
-from tikorgzo.constants import TIKWM_EXTRACTOR_NAME
+from tikorgzo.core.rate_limiter.model import RateLimiterRegistry
+from tikorgzo.core.session.constants import (
+    CONNECTION_POOL_SIZE,
+    CONNECTIONS_PER_HOST,
+    DNS_CACHE_TTL,
+    KEEPALIVE_TIMEOUT,
+    REQUESTS_POOL_SIZE,
+)
 
 
 class ClientSessionManager:
-    """Manages the client session used for both extraction and downloading, ensuring proper cleanup."""
+    """Manages the client session used for both extraction and downloading, ensuring proper cleanup.
+    The rate limiters of the services that the session sends requests to are kept here as well,
+    so that the extractor and the downloader share them.
 
-    def __init__(self, extractor: str, proxy: str | None = None) -> None:
-        self.client_session = self._get_session(extractor, proxy)
+    An aiohttp session is used by default. A requests session is only used if asked for, for
+    compatibility, where each request runs in a worker thread instead.
+    """
 
-    async def close(self) -> None:
-        if hasattr(self.client_session, "close"):
-            if isinstance(self.client_session, aiohttp.ClientSession):
-                await self.client_session.close()
-            else:
-                self.client_session.close()
-
-    def _get_session(self, extractor: str, proxy: str | None = None) -> requests.Session | aiohttp.ClientSession:
-        """Get a requests Session or aiohttp ClientSession depending on the chosen link extractor."""
+    def __init__(self, use_requests: bool = False, proxy: str | None = None) -> None:
+        self.client_session = self._get_session(use_requests, proxy)
+        self.rate_limiters = RateLimiterRegistry()
 
-        if extractor == TIKWM_EXTRACTOR_NAME:
-            return aiohttp.ClientSession(proxy="https://" + proxy if proxy else None)
+    async def close(self) -> None:
+        if isinstance(self.client_session, aiohttp.ClientSession):
+            await self.client_session.close()
+        else:
+            self.client_session.close()
+
+    def _get_session(self, use_requests: bool, proxy: str | None = None) -> requests.Session | aiohttp.ClientSession:
+        """Get an aiohttp ClientSession, or a requests Session if asked for."""
+
+        if not use_requests:
+            connector = aiohttp.TCPConnector(
+                limit=CONNECTION_POOL_SIZE,
+                limit_per_host=CONNECTIONS_PER_HOST,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=DNS_CACHE_TTL,
+            )
+            return aiohttp.ClientSession(connector=connector, proxy="https://" + proxy if proxy else None)
 
         session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=REQUESTS_POOL_SIZE, pool_maxsize=REQUESTS_POOL_SIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
         if proxy is not None:
             session.proxies.update({"http": proxy, "https": proxy})
         return session
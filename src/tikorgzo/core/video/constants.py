@@ -1,4 +1,40 @@
+import sys
+
 USERNAME_REGEX = r"\/@([\w\.\-]+)\/video\/\d+"
 NORMAL_TIKTOK_VIDEO_LINK_REGEX = r"(https?://)?(www\.)?tiktok\.com/@[\w\.\-]+/video/\d+(\?.*)?$"
 VT_TIKTOK_VIDEO_LINK_REGEX = r"(https?://)?vt\.tiktok\.com/"
-IDEAL_BINARY_NUM_LEN = 64
+# The upload timestamp is stored in the first 32 bits of the 64-bit video ID
+TIMESTAMP_SHIFT = 32
+# Video IDs are decoded in batches as 64-bit integers, whose upper 32-bit halves are the timestamps
+UINT64_TYPECODE = "Q"
+UINT32_TYPECODE = "I"
+# Where the upper half of each 64-bit integer is among the 32-bit halves in memory
+UPPER_HALF_INDEX = 1 if sys.byteorder == "little" else 0
+DIGIT_RUN_REGEX = r"\d{19,}"
+
+# Upload date filter constants
+RELATIVE_DAYS_REGEX = r"(\d+)d"
+
+# Filename template constants
+VIDEO_ID_PLACEHOLDER = "video_id"
+USERNAME_PLACEHOLDER = "username"
+DATE_PLACEHOLDER = "date"
+# A `{date}` placeholder has no group 2 match, while `{date:}` has an empty one
+FILENAME_PLACEHOLDER_REGEX = r"\{(video_id|username)\}|\{date(?::(.*?))?\}"
+VIDEO_FILE_EXTENSION = ".mp4"
+
+# Short link resolution constants
+MAX_CONCURRENT_RESOLUTION_TASKS = 16
+RESOLUTION_BATCH_SIZE = 64
+MAX_RESOLUTION_REDIRECTS = 5
+RESOLUTION_TIMEOUT = 30
+
+# Short link cache constants
+MAX_SHORT_LINK_CACHE_ENTRIES = 100_000
+SECONDS_PER_DAY = 86400
+
+# Video ID set constants
+ID_SET_INITIAL_CAPACITY = 1024
+ID_SET_MAX_LOAD_FACTOR = 0.5
+FIBONACCI_HASH_MULTIPLIER = 11400714819323198485
+UINT64_MASK = 0xFFFFFFFFFFFFFFFF
@@ -0,0 +1,109 @@
+import math
+import re
+from collections.abc import Sequence
+from datetime import UTC, date, datetime, timedelta
+
+from tikorgzo.core.video.constants import RELATIVE_DAYS_REGEX, TIMESTAMP_SHIFT
+from tikorgzo.core.video.helpers import extract_video_id, get_timestamps
+from tikorgzo.exceptions import VideoIDExtractionError
+
+
+def parse_upload_date_bound(value: str, is_until: bool = False, now: datetime | None = None) -> datetime:
+    """Parses a `--since`/`--until` value, which is either a date (`2025-01-31`), a date
+    and time (`2025-01-31T18:00`), or a number of days ago (`7d`). Values without a timezone
+    are treated as UTC, since that's the timezone of the upload dates of TikTok videos.
+
+    A plain date used as the `--until` value includes that whole day. A `ValueError` is
+    raised if the value is in none of these formats.
+    """
+
+    matched_days = re.fullmatch(RELATIVE_DAYS_REGEX, value)
+
+    if matched_days:
+        return (now or datetime.now(tz=UTC)) - timedelta(days=int(matched_days.group(1)))
+
+    try:
+        parsed_date = date.fromisoformat(value)
+    except ValueError:
+        parsed_datetime = datetime.fromisoformat(value)
+    else:
+        parsed_datetime = datetime(parsed_date.year, parsed_date.month, parsed_date.day, tzinfo=UTC)
+
+        if is_until:
+            parsed_datetime += timedelta(days=1)
+
+    if parsed_datetime.tzinfo is None:
+        parsed_datetime = parsed_datetime.replace(tzinfo=UTC)
+
+    return parsed_datetime
+
+
+class UploadDateFilter:
+    """Filters videos by the upload date encoded in their video ID, so that videos outside
+    of the wanted date range are dropped before anything is done over the network for them.
+
+    Attributes:
+        since (datetime | None): Videos uploaded before this are filtered out.
+        until (datetime | None): Videos uploaded at or after this are filtered out.
+        skipped_count (int): How many video links have been filtered out so far.
+        _min_timestamp (int): `since` as a Unix timestamp, or 0.
+        _max_timestamp (float): `until` as a Unix timestamp, or infinity.
+
+    Args:
+        since (datetime | None): The start of the date range, if any.
+        until (datetime | None): The exclusive end of the date range, if any.
+
+    """
+
+    def __init__(self, since: datetime | None = None, until: datetime | None = None) -> None:
+        self.since = since
+        self.until = until
+        self.skipped_count = 0
+        # Video ID timestamps only have a precision of seconds, so the `since` bound is
+        # rounded up so that a video uploaded a fraction of a second before it isn't kept
+        self._min_timestamp = math.ceil(since.timestamp()) if since is not None else 0
+        self._max_timestamp = until.timestamp() if until is not None else float("inf")
+
+    @classmethod
+    def from_values(cls, since: str | None, until: str | None) -> "UploadDateFilter | None":
+        """Creates the filter from the `--since`/`--until` values, or returns None if
+        neither is set.
+        """
+
+        if since is None and until is None:
+            return None
+
+        return cls(
+            since=parse_upload_date_bound(since) if since is not None else None,
+            until=parse_upload_date_bound(until, is_until=True) if until is not None else None,
+        )
+
+    def contains(self, video_id: int) -> bool:
+        """Checks if the video was uploaded within the date range."""
+
+        return self._min_timestamp <= video_id >> TIMESTAMP_SHIFT < self._max_timestamp
+
+    def filter_video_links(self, video_links: Sequence[str]) -> list[str]:
+        """Drops the links whose video ID shows that they were uploaded outside of the date
+        range, decoding the upload dates of the whole batch at once. Links where the video
+        ID isn't known yet (e.g., shortened links) are kept as they need to be resolved first.
+        """
+
+        video_ids: list[int | None] = []
+
+        for video_link in video_links:
+            try:
+                video_ids.append(extract_video_id(video_link))
+            except VideoIDExtractionError:
+                video_ids.append(None)
+
+        timestamps = iter(get_timestamps(video_id for video_id in video_ids if video_id is not None))
+        kept_links: list[str] = []
+
+        for video_link, video_id in zip(video_links, video_ids, strict=True):
+            if video_id is None or self._min_timestamp <= next(timestamps) < self._max_timestamp:
+                kept_links.append(video_link)
+            else:
+                self.skipped_count += 1
+
+        return kept_links
@@ -0,0 +1,102 @@
+from array import array
+
+from tikorgzo.core.video.constants import FIBONACCI_HASH_MULTIPLIER, ID_SET_INITIAL_CAPACITY, ID_SET_MAX_LOAD_FACTOR, UINT64_MASK
+from tikorgzo.core.video.helpers import extract_video_id
+from tikorgzo.exceptions import VideoIDExtractionError
+
+
+class VideoIDSet:
+    """A compact set of video IDs.
+
+    IDs are stored as unsigned 64-bit integers in a flat open-addressing hash table
+    (with linear probing), which takes 16 to 32 bytes per ID depending on how full the
+    table is, compared to the ~70 bytes per ID that a built-in `set[int]` takes. Since 0
+    marks an empty slot in the table, an ID of 0 (and any ID that doesn't fit in 64 bits)
+    is kept aside separately.
+    """
+
+    def __init__(self, capacity: int = ID_SET_INITIAL_CAPACITY) -> None:
+        # Capacity must be a power of two so that slots can be computed by bit shifting
+        self._bits = max(capacity - 1, 1).bit_length()
+        self._table = array("Q", bytes(8 * (1 << self._bits)))
+        self._size = 0
+        self._others: set[int] = set()
+
+    def __len__(self) -> int:
+        return self._size + len(self._others)
+
+    def __contains__(self, video_id: int) -> bool:
+        if not 0 < video_id <= UINT64_MASK:
+            return video_id in self._others
+        return self._table[self._find_slot(video_id)] == video_id
+
+    def add(self, video_id: int) -> bool:
+        """Adds the video ID to the set, and returns whether it wasn't in the set yet."""
+
+        if not 0 < video_id <= UINT64_MASK:
+            is_new = video_id not in self._others
+            self._others.add(video_id)
+            return is_new
+
+        slot = self._find_slot(video_id)
+
+        if self._table[slot] == video_id:
+            return False
+
+        self._table[slot] = video_id
+        self._size += 1
+
+        if self._size > len(self._table) * ID_SET_MAX_LOAD_FACTOR:
+            self._grow()
+
+        return True
+
+    def _find_slot(self, video_id: int) -> int:
+        """Returns the slot where the video ID is, or the empty slot where it should be put."""
+
+        mask = len(self._table) - 1
+        # Fibonacci hashing spreads the IDs evenly across the table, even though the
+        # lower bits of TikTok video IDs aren't that random
+        slot = ((video_id * FIBONACCI_HASH_MULTIPLIER) & UINT64_MASK) >> (64 - self._bits)
+
+        table = self._table
+
+        while table[slot] and table[slot] != video_id:
+            slot = (slot + 1) & mask
+
+        return slot
+
+    def _grow(self) -> None:
+        old_table = self._table
+        self._bits += 1
+        self._table = array("Q", bytes(8 * (1 << self._bits)))
+
+        for video_id in old_table:
+            if video_id:
+                self._table[self._find_slot(video_id)] = video_id
+
+
+class VideoLinkDeduplicator:
+    """Tracks which videos have been seen so far so that duplicated links are only processed once.
+
+    Links are compared by their video ID, so a full link, a link with extra query parameters,
+    and a bare video ID of the same video are all considered the same. Links where the video ID
+    can't be extracted yet (e.g., shortened vt.tiktok.com links) are compared as strings.
+    """
+
+    def __init__(self) -> None:
+        self._video_ids = VideoIDSet()
+        self._other_links: set[str] = set()
+
+    def is_new(self, video_link: str) -> bool:
+        """Marks the video link as seen, and returns whether it wasn't seen yet."""
+
+        try:
+            video_id = extract_video_id(video_link)
+        except VideoIDExtractionError:
+            key = video_link.rstrip("/")
+            is_new = key not in self._other_links
+            self._other_links.add(key)
+            return is_new
+
+        return self._video_ids.add(video_id)
@@ -0,0 +1,70 @@
+import re
+from datetime import datetime
+from functools import cache
+
+from tikorgzo.constants import DEFAULT_DATE_FORMAT
+from tikorgzo.core.video.constants import DATE_PLACEHOLDER, FILENAME_PLACEHOLDER_REGEX, USERNAME_PLACEHOLDER, VIDEO_ID_PLACEHOLDER
+
+
+class FilenameTemplate:
+    """A filename template that is parsed only once into its literal text and its
+    placeholders, so that rendering a filename is just a join of the pieces instead of
+    searching and substituting the whole template for each video.
+
+    Use `FilenameTemplate.compile()` to get instances, so that the config validator and
+    the videos share the same parsed template.
+
+    Attributes:
+        template (str): The template as given by the user.
+        date_formats (tuple[str | None, ...]): The format of each `{date[:fmt]}` placeholder
+            in order, where `{date}` is None and uses the default date format.
+        _literals (tuple[str, ...]): The literal text around the placeholders, which always has
+            one more item than `_placeholders`.
+        _placeholders (tuple[tuple[str, str | None], ...]): The name and date format of each placeholder.
+
+    Args:
+        template (str): The filename template, e.g. `{username}_{date:%Y%m%d}_{video_id}`.
+
+    """
+
+    def __init__(self, template: str) -> None:
+        self.template = template
+
+        literals: list[str] = []
+        placeholders: list[tuple[str, str | None]] = []
+        last_end = 0
+
+        for match in re.finditer(FILENAME_PLACEHOLDER_REGEX, template):
+            literals.append(template[last_end : match.start()])
+            placeholders.append((match.group(1) or DATE_PLACEHOLDER, match.group(2)))
+            last_end = match.end()
+
+        literals.append(template[last_end:])
+
+        self._literals = tuple(literals)
+        self._placeholders = tuple(placeholders)
+        self.date_formats = tuple(date_fmt for name, date_fmt in placeholders if name == DATE_PLACEHOLDER)
+
+    @staticmethod
+    @cache
+    def compile(template: str) -> "FilenameTemplate":
+        """Returns the parsed template, parsing it only the first time it's seen."""
+        return FilenameTemplate(template)
+
+    def has_placeholder(self, name: str) -> bool:
+        return any(placeholder_name == name for placeholder_name, _ in self._placeholders)
+
+    def render(self, video_id: int, username: str, date: datetime) -> str:
+        """Returns the filename (without the extension) for the given video details."""
+
+        values = {VIDEO_ID_PLACEHOLDER: str(video_id), USERNAME_PLACEHOLDER: username}
+        parts = [self._literals[0]]
+
+        for (name, date_fmt), literal in zip(self._placeholders, self._literals[1:], strict=True):
+            if name == DATE_PLACEHOLDER:
+                parts.append(date.strftime(date_fmt or DEFAULT_DATE_FORMAT))
+            else:
+                parts.append(values[name])
+            parts.append(literal)
+
+        return "".join(parts)
@@ -1,17 +1,28 @@
-import os
 import pathlib
 import re
+from array import array
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 import requests
 
-from tikorgzo.config.model import ConfigKey
-from tikorgzo.constants import DEFAULT_DATE_FORMAT, DOWNLOAD_PATH, TIKTOK_ID_LENGTH
-from tikorgzo.core.video.constants import IDEAL_BINARY_NUM_LEN, NORMAL_TIKTOK_VIDEO_LINK_REGEX, USERNAME_REGEX, VT_TIKTOK_VIDEO_LINK_REGEX
-from tikorgzo.exceptions import InvalidDateFormatError, InvalidVideoLinkError, VideoFileAlreadyExistsError, VideoIDExtractionError
+from tikorgzo.constants import DOWNLOAD_PATH, MAX_VIDEO_ID, TIKTOK_ID_LENGTH
+from tikorgzo.core.video.constants import (
+    NORMAL_TIKTOK_VIDEO_LINK_REGEX,
+    TIMESTAMP_SHIFT,
+    UINT32_TYPECODE,
+    UINT64_TYPECODE,
+    UPPER_HALF_INDEX,
+    USERNAME_REGEX,
+    VIDEO_FILE_EXTENSION,
+    VT_TIKTOK_VIDEO_LINK_REGEX,
+)
+from tikorgzo.exceptions import InvalidVideoLinkError, VideoFileAlreadyExistsError, VideoIDExtractionError
 
 if TYPE_CHECKING:
+    from tikorgzo.core.video.filename_template import FilenameTemplate
+    from tikorgzo.core.video.index import DownloadIndex
     from tikorgzo.core.video.model import Video
 
 
@@ -21,7 +32,7 @@ def normalize_video_link(video_link: str, proxy: str | None = None) -> str:
     if re.search(NORMAL_TIKTOK_VIDEO_LINK_REGEX, video_link):
         return video_link
 
-    if re.search(VT_TIKTOK_VIDEO_LINK_REGEX, video_link):
+    if is_short_link(video_link):
         return _get_normalized_url(video_link, proxy=proxy)
 
     if len(video_link) == TIKTOK_ID_LENGTH and video_link.isdigit():
@@ -30,30 +41,50 @@ def normalize_video_link(video_link: str, proxy: str | None = None) -> str:
     raise InvalidVideoLinkError(video_link)
 
 
-def extract_video_id(video_link: str) -> int:
-    """Extracts the video ID which is a 19-digit long that uniquely identifies a TikTok video."""
-    match = re.search(r"/video/(\d+)", video_link)
-    if match:
-        return int(match.group(1))
+def is_short_link(video_link: str) -> bool:
+    """Checks if the video link is a shortened link (e.g., https://vt.tiktok.com/AbCdEfGhI)."""
 
-    if len(video_link) == TIKTOK_ID_LENGTH and video_link.isdigit():
-        return int(video_link)
+    return re.search(VT_TIKTOK_VIDEO_LINK_REGEX, video_link) is not None
 
-    match = re.search(r"/(\d+)_original\.mp4", video_link)
-    if match:
-        return int(match.group(1))
 
-    raise VideoIDExtractionError
+def add_url_scheme(video_link: str) -> str:
+    """Prepends `https://` to the video link if it doesn't have a URL scheme yet."""
+
+    if not video_link.startswith(r"https://") and not video_link.startswith(r"http://"):
+        return "https://" + video_link
+    return video_link
+
+
+def is_valid_video_id(video_id: int) -> bool:
+    """Checks if the number can be a TikTok video ID, i.e., it's 19 digits long and fits in
+    the catalogs.
+    """
+
+    return 10 ** (TIKTOK_ID_LENGTH - 1) <= video_id <= MAX_VIDEO_ID
+
+
+def extract_video_id(video_link: str) -> int:
+    """Extracts the video ID which is a 19-digit long that uniquely identifies a TikTok video.
+    A number that can't be a video ID (e.g., a mistyped 40-digit one) isn't extracted, so
+    that the link is skipped on its own instead of failing the batch it's in.
+    """
+    video_id = _find_video_id(video_link)
+
+    if video_id is None or not is_valid_video_id(video_id):
+        raise VideoIDExtractionError
+
+    return video_id
 
 
 def check_if_already_downloaded(
     video_id: int,
     lazy_duplicate_check: bool,
-    custom_download_dir: str | None = None,
+    download_index: "DownloadIndex",
 ) -> None:
-    """Recursively checks the output folder, which is the default
-    DOWNLOAD_PATH, to see if a file already exists whether the filename
-    contains the video ID or not. If true, this will raise an error.
+    """Checks the download index, which is built from a single scan of the output
+    folder (the default DOWNLOAD_PATH or the custom download directory), to see if
+    a file already exists whether the filename contains the video ID or not. If
+    true, this will raise an error.
 
     This whole function only runs when `--lazy-duplicate-check` is not enabled.
     """
@@ -61,15 +92,11 @@ def check_if_already_downloaded(
     if lazy_duplicate_check is True:
         return
 
-    download_dir = _get_download_dir(custom_download_dir)
-    if not os.path.exists(download_dir):
-        pathlib.Path(download_dir).mkdir(exist_ok=True, parents=True)
+    existing_file = download_index.find(video_id)
 
-    for root, _, filenames in os.walk(download_dir):
-        for f in filenames:
-            if str(video_id) in f:
-                username = pathlib.Path(root).name
-                raise VideoFileAlreadyExistsError(f, username)
+    if existing_file is not None:
+        username = existing_file.parent.name
+        raise VideoFileAlreadyExistsError(existing_file.name, username)
 
 
 def process_username(video_link: str) -> str | None:
@@ -92,22 +119,31 @@ def get_date(video_id: int) -> datetime:
     (https://dfir.blog/tinkering-with-tiktok-timestamps/) that TikTok video
     ID actually contains the upload date.
 
-    All we need to do is convert the video ID to binary number that must
-    be 64-digits long (prepend enough zeros to make it that long, if necessary).
-    After that, we convert the first 32 digits to a decimal number again.
-    The resulting number is now an Unix timestamp which is now the upload date
-    of video in UTC time.
+    The first 32 bits of the 64-bit video ID are a Unix timestamp, which is
+    the upload date of the video in UTC time, so all we need to do is shift
+    away the last 32 bits.
     """
 
-    binary_num = _convert_decimal_to_binary(video_id)
+    return datetime.fromtimestamp(video_id >> TIMESTAMP_SHIFT, tz=UTC)
+
+
+def get_timestamps(video_ids: Iterable[int]) -> "array[int]":
+    """Gets the Unix timestamps of the upload dates of many video IDs at once.
+
+    The video IDs are packed into an array of 64-bit integers, and the same 32-bit shift as
+    `get_date()` is done on the whole batch at once by reading that memory as 32-bit halves
+    and slicing out the upper halves, instead of shifting each video ID in Python.
+    """
+
+    packed_ids = array(UINT64_TYPECODE, video_ids)
+    return array(UINT32_TYPECODE, packed_ids.tobytes())[UPPER_HALF_INDEX::2]
+
 
-    # Get the first 32 digits of binary num and then convert it to
-    # a decimal number, which results into a Unix timestamp
-    unix_timestamp = int(binary_num[:32], 2)
+def get_dates(video_ids: Iterable[int]) -> list[datetime]:
+    """Same as `get_date()`, but for many video IDs at once."""
 
-    # Convert the Unix timestamp into a datetime object. Take note that the
-    # upload date of all TikTok video IDs are in UTC time
-    return datetime.fromtimestamp(unix_timestamp, tz=UTC)
+    fromtimestamp = datetime.fromtimestamp
+    return [fromtimestamp(timestamp, tz=UTC) for timestamp in get_timestamps(video_ids)]
 
 
 def assign_output_paths(video: "Video") -> None:
@@ -119,9 +155,8 @@ def assign_output_paths(video: "Video") -> None:
     video_id = video.video_id
     filename_template = video.filename_template
     date = video.date
-    download_dir = _get_download_dir(
-        custom_downloads_dir=video.config.get_value(ConfigKey.DOWNLOAD_DIR),
-    )
+    download_index = video.download_index
+    download_dir = download_index.download_dir
 
     assert isinstance(video_id, int)
 
@@ -131,13 +166,33 @@ def assign_output_paths(video: "Video") -> None:
         pathlib.Path(output_path).mkdir(exist_ok=True, parents=True)
         video_file = pathlib.Path(output_path, video_filename)
 
-        if os.path.exists(video_file):
+        if download_index.contains(video_file):
             raise VideoFileAlreadyExistsError(video_filename, username)
 
-        video.output_file_dir = output_path
         video.output_file_path = video_file
 
 
+def get_download_dir(custom_downloads_dir: str | None) -> pathlib.Path:
+    if custom_downloads_dir:
+        return pathlib.Path(custom_downloads_dir)
+    return DOWNLOAD_PATH
+
+
+def _find_video_id(video_link: str) -> int | None:
+    match = re.search(r"/video/(\d+)", video_link)
+    if match:
+        return int(match.group(1))
+
+    if len(video_link) == TIKTOK_ID_LENGTH and video_link.isdigit():
+        return int(video_link)
+
+    match = re.search(r"/(\d+)_original\.mp4", video_link)
+    if match:
+        return int(match.group(1))
+
+    return None
+
+
 def _get_normalized_url(video_link: str, proxy: str | None = None) -> str:
     """Returns a normalized URL whenever the inputted video link doesn't contain the username and the video ID
     (e.g., https://vt.tiktok.com/AbCdEfGhI).
@@ -146,8 +201,7 @@ def _get_normalized_url(video_link: str, proxy: str | None = None) -> str:
     program after we have downloaded the video so that we can assign the output file path and name for the video.
     """
 
-    if not video_link.startswith(r"https://") and not video_link.startswith(r"http://"):
-        video_link = "https://" + video_link
+    video_link = add_url_scheme(video_link)
 
     if proxy is not None:
         proxies = {"http": proxy, "https": proxy}
@@ -158,69 +212,8 @@ def _get_normalized_url(video_link: str, proxy: str | None = None) -> str:
     return response.url
 
 
-def _get_download_dir(custom_downloads_dir: str | None) -> pathlib.Path:
-    if custom_downloads_dir:
-        return pathlib.Path(custom_downloads_dir)
-    return DOWNLOAD_PATH
-
-
-def _convert_decimal_to_binary(number: int) -> str:
-    # Gets the binary num excluding the '0b' prefix returned by bin()
-    binary_num = f"{number:b}"
-    binary_num_len = len(binary_num)
-
-    if binary_num_len == IDEAL_BINARY_NUM_LEN:
-        return binary_num
-
-    # If the length of the binary number is less than 64, prepend
-    # enough zeros to ensure it is 64 digits long
-
-    zeros_to_prepend = IDEAL_BINARY_NUM_LEN - binary_num_len
-    zeros_string = ""
-
-    for _ in range(zeros_to_prepend):
-        zeros_string += "0"
-
-    return zeros_string + binary_num
-
-
-def _get_video_filename(video_id: int, username: str, date: datetime, filename_template: str | None) -> str:
+def _get_video_filename(video_id: int, username: str, date: datetime, filename_template: "FilenameTemplate | None") -> str:
     if filename_template is None:
-        return str(video_id) + ".mp4"
-
-    formatted_filename = _format_date(date, filename_template)
-    formatted_filename = formatted_filename.replace("{username}", username)
-    formatted_filename = formatted_filename.replace("{video_id}", str(video_id))  # noqa: RUF027
-    formatted_filename += ".mp4"
-
-    return formatted_filename
-
-
-def _format_date(date: datetime, filename_template: str) -> str:
-    """Returns a filename with formatted date based on the
-    given date format provided via `{date:...}` value from `--filename-template`
-    arg.
-    """
-
-    # Pattern to capture the date placeholder and the date format value
-    pattern = r"({date(:(.+?))?})"
-
-    matched_str = re.search(pattern, filename_template)
-
-    if matched_str is None:
-        raise InvalidDateFormatError
-
-    date_placeholder = matched_str.group(1)  # i.e., `{date:%Y%m%d_%H%M%S}`
-    date_fmt = matched_str.group(3)  # i.e., `%Y%m%d_%H%M%S`
-
-    # User can input `{date}` only from the `--filename-template` arg. If that happens,
-    # date_fmt will become None as this don't match with the date_fmt RegEx.
-    # To handle this, we will just use a DEFAULT_FORMAT for `formatted_date` if
-    # `date_fmt` is None
-
-    if date_fmt is None:
-        formatted_date = date.strftime(DEFAULT_DATE_FORMAT)
-    else:
-        formatted_date = date.strftime(date_fmt)
+        return str(video_id) + VIDEO_FILE_EXTENSION
 
-    return re.sub(date_placeholder, formatted_date, filename_template)
+    return filename_template.render(video_id, username, date) + VIDEO_FILE_EXTENSION
@@ -0,0 +1,174 @@
+import os
+import re
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from tikorgzo.constants import PART_FILE_SUFFIX, RESUME_FILE_SUFFIX, TIKTOK_ID_LENGTH
+from tikorgzo.core.catalog.model import CatalogEntry, DownloadCatalog
+from tikorgzo.core.video.constants import DIGIT_RUN_REGEX
+from tikorgzo.core.video.helpers import get_dates, get_download_dir, is_valid_video_id
+
+if TYPE_CHECKING:
+    from tikorgzo.core.video.model import Video
+
+
+class DownloadIndex:
+    """An index of the files that already exist in the download directory, backed by
+    the persistent download catalog.
+
+    The download directory is only walked the first time a catalog is created for it,
+    where every file found is keyed by the video ID found in its filename and recorded
+    into the catalog. After that, duplicate checks are just indexed catalog lookups, and
+    completed downloads are recorded into the catalog as they finish.
+
+    Files may also be added to the download directory outside of the program (e.g., copied
+    in or downloaded by another tool), so the first lookup of a run that misses the catalog
+    also indexes the files of the user directories that changed since the last scan.
+
+    Attributes:
+        download_dir (Path): The download directory being indexed.
+        catalog (DownloadCatalog): The catalog that stores the downloaded videos.
+        _is_built (bool): Whether the catalog has already been opened and seeded.
+        _is_refreshed (bool): Whether the changed directories have been indexed in this run.
+
+    Args:
+        custom_download_dir (str | None): The download directory set via config or CLI, if any.
+
+    """
+
+    def __init__(self, custom_download_dir: str | None = None) -> None:
+        self.download_dir = get_download_dir(custom_download_dir)
+        self.catalog = DownloadCatalog(self.download_dir)
+        self._is_built = False
+        self._is_refreshed = False
+
+    def build(self) -> None:
+        """Opens the catalog, seeding it from a scan of the download directory if it's new."""
+
+        self.download_dir.mkdir(exist_ok=True, parents=True)
+
+        if not self.catalog.is_seeded():
+            scanned_at = time.time()
+            self.catalog.add_found_entries(self._scan_download_dir())
+            self.catalog.mark_seeded()
+            self.catalog.mark_scanned(scanned_at)
+            self._is_refreshed = True
+
+        self._is_built = True
+
+    def find(self, video_id: int) -> Path | None:
+        """Returns the path of an existing file whose filename contains the video ID, if any."""
+
+        self._ensure_built()
+        existing_file = self._get_existing_file(self.catalog.find_by_video_id(video_id))
+
+        if existing_file is None and not self._is_refreshed:
+            self._refresh()
+            existing_file = self._get_existing_file(self.catalog.find_by_video_id(video_id))
+
+        return existing_file
+
+    def contains(self, file_path: Path) -> bool:
+        """Checks if the exact file path already exists, which is checked on the filesystem
+        itself so that a file the catalog doesn't know about is never overwritten.
+        """
+
+        return file_path.exists()
+
+    def add(self, video: "Video") -> None:
+        """Records a newly downloaded video into the catalog."""
+
+        self._ensure_built()
+
+        width, height = video.resolution or (None, None)
+        output_file_path = video.output_file_path
+
+        self.catalog.add(
+            CatalogEntry(
+                video_id=video.video_id,
+                output_path=output_file_path,
+                username=video.username,
+                upload_date=video.date,
+                file_size=output_file_path.stat().st_size,
+                width=width,
+                height=height,
+                bitrate=video.bitrate,
+                completed_at=datetime.now(tz=UTC),
+            ),
+        )
+
+    def _ensure_built(self) -> None:
+        if not self._is_built:
+            self.build()
+
+    def _get_existing_file(self, entries: list[CatalogEntry]) -> Path | None:
+        for entry in entries:
+            file_path = self.catalog.get_absolute_path(entry)
+
+            if file_path.exists():
+                return file_path
+
+            # The file was deleted outside of the program after it was recorded,
+            # so it shouldn't count as downloaded anymore
+            self.catalog.remove(entry)
+
+        return None
+
+    def _refresh(self) -> None:
+        """Indexes the files of the directories in the download directory's tree that changed
+        since the last scan, going by their modification times, so that the files that are
+        already indexed aren't indexed again. The whole tree is walked like when the catalog
+        is seeded, as a directory doesn't change when only its subdirectories do.
+        """
+
+        scanned_at = time.time()
+        last_scanned_at = self.catalog.get_scanned_at()
+
+        for root, _, filenames in os.walk(self.download_dir):
+            directory = Path(root)
+
+            # The modification time of a directory only changes when a file is added to it,
+            # removed from it, or renamed. It's compared inclusively as it may be coarse.
+            if directory.stat().st_mtime >= last_scanned_at:
+                self.catalog.add_found_entries(self._index_files(directory, filenames))
+
+        self.catalog.mark_scanned(scanned_at)
+        self._is_refreshed = True
+
+    def _scan_download_dir(self) -> Iterator[CatalogEntry]:
+        for root, _, filenames in os.walk(self.download_dir):
+            yield from self._index_files(Path(root), filenames)
+
+    def _index_files(self, directory: Path, filenames: list[str]) -> Iterator[CatalogEntry]:
+        username = directory.name if directory != self.download_dir else None
+        # Unfinished downloads aren't downloaded videos yet
+        found_files = [(video_id, directory / filename) for filename in filenames if not filename.endswith((PART_FILE_SUFFIX, RESUME_FILE_SUFFIX)) for video_id in self._find_video_ids(filename)]
+
+        # The upload dates of a whole directory are decoded in a single batch
+        upload_dates = get_dates(video_id for video_id, _ in found_files)
+
+        for (video_id, file_path), upload_date in zip(found_files, upload_dates, strict=True):
+            yield CatalogEntry(
+                video_id=video_id,
+                output_path=file_path,
+                username=username,
+                upload_date=upload_date,
+                file_size=file_path.stat().st_size,
+            )
+
+    def _find_video_ids(self, filename: str) -> set[int]:
+        video_ids: set[int] = set()
+
+        # Filenames may have the video ID right next to other digits (e.g., a
+        # `{date:%Y%m%d}{video_id}` template), so every ID-long window of a digit run
+        # is indexed to keep the same behavior as a plain substring check. The windows
+        # that can't be video IDs (e.g., of `backup_99999999999999999999.mp4`) are skipped.
+        for match in re.finditer(DIGIT_RUN_REGEX, filename):
+            digits = match.group()
+            windows = (int(digits[start : start + TIKTOK_ID_LENGTH]) for start in range(len(digits) - TIKTOK_ID_LENGTH + 1))
+            video_ids.update(video_id for video_id in windows if is_valid_video_id(video_id))
+
+        return video_ids
@@ -0,0 +1,92 @@
+import sqlite3
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from tikorgzo.constants import SHORT_LINK_CACHE_PATH
+from tikorgzo.core.video.constants import MAX_SHORT_LINK_CACHE_ENTRIES, SECONDS_PER_DAY
+from tikorgzo.core.video.helpers import add_url_scheme
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS short_links (
+    short_link TEXT PRIMARY KEY,
+    canonical_url TEXT NOT NULL,
+    resolved_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_short_links_resolved_at ON short_links (resolved_at);
+"""
+
+
+class ShortLinkCache:
+    """A persistent cache of shortened vt.tiktok.com links to their canonical URL.
+
+    Entries older than the TTL are treated as missing, and once the cache holds more
+    than `max_entries` links, the oldest resolved ones are evicted.
+    """
+
+    def __init__(
+        self,
+        ttl_days: int,
+        cache_path: Path = SHORT_LINK_CACHE_PATH,
+        max_entries: int = MAX_SHORT_LINK_CACHE_ENTRIES,
+    ) -> None:
+        self.cache_path = cache_path
+        self._ttl_seconds = ttl_days * SECONDS_PER_DAY
+        self._max_entries = max_entries
+        self._connection: sqlite3.Connection | None = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.cache_path.parent.mkdir(exist_ok=True, parents=True)
+            self._connection = sqlite3.connect(self.cache_path)
+            self._connection.executescript(CACHE_SCHEMA)
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def get_many(self, short_links: Iterable[str]) -> dict[str, str]:
+        """Returns the canonical URL of every short link that has a fresh cache entry."""
+
+        min_resolved_at = time.time() - self._ttl_seconds
+        cached_links: dict[str, str] = {}
+
+        for short_link in short_links:
+            row = self.connection.execute(
+                "SELECT canonical_url FROM short_links WHERE short_link = ? AND resolved_at >= ?",
+                (self._get_key(short_link), min_resolved_at),
+            ).fetchone()
+
+            if row is not None:
+                cached_links[short_link] = row[0]
+
+        return cached_links
+
+    def put_many(self, resolved_links: dict[str, str]) -> None:
+        """Stores newly resolved links, then evicts expired entries and the oldest
+        entries beyond the size limit.
+        """
+
+        now = time.time()
+
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO short_links (short_link, canonical_url, resolved_at) VALUES (?, ?, ?)",
+            ((self._get_key(short_link), canonical_url, now) for short_link, canonical_url in resolved_links.items()),
+        )
+        self.connection.execute("DELETE FROM short_links WHERE resolved_at < ?", (now - self._ttl_seconds,))
+        self.connection.execute(
+            """
+            DELETE FROM short_links WHERE short_link IN (
+                SELECT short_link FROM short_links ORDER BY resolved_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self._max_entries,),
+        )
+        self.connection.commit()
+
+    def _get_key(self, short_link: str) -> str:
+        # `vt.tiktok.com/AbCdEfGhI` and `https://vt.tiktok.com/AbCdEfGhI/` are the same link
+        return add_url_scheme(short_link.strip()).rstrip("/")
@@ -6,11 +6,15 @@ from tikorgzo.config.model import ConfigKey
 from tikorgzo.config.provider import ConfigProvider
 from tikorgzo.constants import DownloadStatus
 from tikorgzo.core.video import helpers as fn
-from tikorgzo.exceptions import FileSizeNotSetError, FileTooLargeError
+from tikorgzo.core.video.date_filter import UploadDateFilter
+from tikorgzo.core.video.filename_template import FilenameTemplate
+from tikorgzo.exceptions import FileSizeNotSetError, FileTooLargeError, UploadDateOutOfRangeError
 
 if TYPE_CHECKING:
     from datetime import datetime
 
+    from tikorgzo.core.video.index import DownloadIndex
+
 USERNAME_REGEX = r"\/@([\w\.\-]+)\/video\/\d+"
 NORMAL_TIKTOK_VIDEO_LINK_REGEX = r"https?://(www\.)?tiktok\.com/@[\w\.\-]+/video/\d+(\?.*)?$"
 VT_TIKTOK_VIDEO_LINK_REGEX = r"https?://vt\.tiktok\.com/"
@@ -19,63 +23,141 @@ VT_TIKTOK_VIDEO_LINK_REGEX = r"https?://vt\.tiktok\.com/"
 BYTES_PER_KB = 1024.0
 
 
+@dataclass(frozen=True, slots=True)
+class VideoOptions:
+    """The options that are shared by every `Video` of a run, so that each video only
+    needs to keep a single reference to them instead of its own copies.
+
+    Attributes:
+        download_index (DownloadIndex): The index of files already in the download directory.
+        filename_template (FilenameTemplate | None): Custom filename template passed via config or CLI, compiled once.
+        lazy_duplicate_check (bool): Whether the duplicate check by video ID is skipped.
+        proxy (str | None): The proxy used when resolving shortened links.
+        date_filter (UploadDateFilter | None): The upload date range set via `--since`/`--until`, if any.
+
+    """
+
+    download_index: "DownloadIndex"
+    filename_template: FilenameTemplate | None = None
+    lazy_duplicate_check: bool = False
+    proxy: str | None = None
+    date_filter: UploadDateFilter | None = None
+
+    @classmethod
+    def from_config(cls, config: ConfigProvider, download_index: "DownloadIndex") -> "VideoOptions":
+        filename_template: str | None = config.get_value(ConfigKey.FILENAME_TEMPLATE)
+
+        return cls(
+            download_index=download_index,
+            filename_template=FilenameTemplate.compile(filename_template) if filename_template else None,
+            lazy_duplicate_check=bool(config.get_value(ConfigKey.LAZY_DUPLICATE_CHECK)),
+            proxy=config.get_value(ConfigKey.PROXY),
+            date_filter=UploadDateFilter.from_values(config.get_value(ConfigKey.SINCE), config.get_value(ConfigKey.UNTIL)),
+        )
+
+
 class Video:
     # pylint: disable=too-many-instance-attributes
     """Represents a TikTok video and its associated metadata.
 
-    On construction, the provided link is normalized (full links are kept as-is,
-    shortened vt.tiktok.com links are resolved to their full form, and bare 19-digit
-    video IDs are accepted directly). The video ID, username, and upload date are then
-    extracted from the normalized link, duplicate-download checks are performed, and
-    output paths are assigned.
+    Videos are kept compact (no `__dict__`, no per-video copies of the options, and
+    the upload date and file size are derived on demand) as a run may queue a lot of
+    them at once. Construction is cheap: full links and bare 19-digit video IDs are
+    parsed right away and checked against the download index by video ID, while
+    shortened vt.tiktok.com links that weren't resolved beforehand are only resolved
+    over the network by `prepare()`, which also assigns the output paths once the
+    video reaches extraction.
 
     Attributes:
-        config (ConfigProvider): The configuration provider instance.
-        _video_link (str): The normalized TikTok video link (or bare video ID).
-        _video_id (int): The 19-digit unique identifier for the video.
+        _options (VideoOptions): The options shared by every video of the run.
+        _video_link (str): The normalized TikTok video link (or bare video ID), or the
+            shortened link as given until it is resolved.
+        _video_id (int | None): The 19-digit unique identifier for the video, if known yet.
         _username (str | None): The creator's username, if present in the link.
-        _date (datetime): The upload date derived from the video ID.
         _download_link (str | None): The resolved direct download URL, set by an extractor.
-        _file_size (FileSize): The size of the video file, set after the download link is resolved.
+        _file_size (float | None): The size of the video file in bytes, set after the download link is resolved.
+        _resolution (tuple[int, int] | None): The width and height of the video, if known by the extractor.
+        _bitrate (int | None): The bitrate of the video, if known by the extractor.
+        _extractor (str | None): The name of the extractor that got the download link.
         _download_status (DownloadStatus): The current download status of the video.
-        _filename_template (str | None): Custom filename template passed via config or CLI.
-        _output_file_dir (Path | None): Directory where the video will be saved.
         _output_file_path (Path | None): Full path to the output video file.
 
     Args:
         video_link (str): A full TikTok video URL, a shortened vt.tiktok.com URL, or a bare 19-digit video ID.
-        config (ConfigProvider): The configuration provider instance.
+        options (VideoOptions): The options shared by every video of the run.
 
     Raises:
         InvalidVideoLinkError: If the provided video link cannot be normalized.
+        UploadDateOutOfRangeError: If the video was uploaded outside of the set date range.
         VideoFileAlreadyExistsError: If the video has already been downloaded.
 
     """
 
-    def __init__(
-        self,
-        video_link: str,
-        config: ConfigProvider,
-    ) -> None:
-        self.config = config
-        self._video_link = fn.normalize_video_link(video_link, config.get_value(ConfigKey.PROXY))
-        self._video_id: int = fn.extract_video_id(self._video_link)
+    __slots__ = (
+        "_bitrate",
+        "_download_link",
+        "_download_status",
+        "_extractor",
+        "_file_size",
+        "_options",
+        "_output_file_path",
+        "_resolution",
+        "_username",
+        "_video_id",
+        "_video_link",
+    )
+
+    def __init__(self, video_link: str, options: VideoOptions) -> None:
+        self._options = options
+        self._video_link = video_link
+        self._video_id: int | None = None
+        self._username: str | None = None
+        self._download_link: str | None = None
+        self._file_size: float | None = None
+        self._resolution: tuple[int, int] | None = None
+        self._bitrate: int | None = None
+        self._extractor: str | None = None
+        self._download_status = DownloadStatus.UNSTARTED
+        self._output_file_path: Path | None = None
+
+        if not fn.is_short_link(video_link):
+            self._set_video_link(fn.normalize_video_link(video_link))
+
+    def prepare(self) -> None:
+        """Does the remaining work needed before the video can be extracted and downloaded,
+        which is resolving the link if it's still a shortened one and assigning the output
+        paths. Raises the same errors as the constructor if the video turns out to be
+        invalid or already downloaded.
+        """
+
+        if not self.is_resolved:
+            self._set_video_link(fn.normalize_video_link(self._video_link, self._options.proxy))
+
+        fn.assign_output_paths(self)
+
+    def _set_video_link(self, video_link: str) -> None:
+        self._video_link = video_link
+        self._video_id = fn.extract_video_id(video_link)
+        self._username = fn.process_username(video_link)
+
+        date_filter = self._options.date_filter
+        if date_filter is not None and not date_filter.contains(self._video_id):
+            raise UploadDateOutOfRangeError(self._video_id)
 
         fn.check_if_already_downloaded(
             video_id=self._video_id,
-            lazy_duplicate_check=config.get_value(ConfigKey.LAZY_DUPLICATE_CHECK),
-            custom_download_dir=config.get_value(ConfigKey.DOWNLOAD_DIR),
+            lazy_duplicate_check=self._options.lazy_duplicate_check,
+            download_index=self._options.download_index,
         )
 
-        self._username: str | None = fn.process_username(self._video_link)
-        self._date: datetime = fn.get_date(self._video_id)
-        self._download_link: str | None = None
-        self._file_size = FileSize()
-        self._download_status = DownloadStatus.UNSTARTED
-        self._filename_template: str | None = config.get_value(ConfigKey.FILENAME_TEMPLATE)
-        self._output_file_dir: Path | None = None
-        self._output_file_path: Path | None = None
-        fn.assign_output_paths(self)
+    @property
+    def is_resolved(self) -> bool:
+        """Whether the video ID is already known, i.e., the link isn't an unresolved shortened link."""
+        return self._video_id is not None
+
+    @property
+    def download_index(self) -> "DownloadIndex":
+        return self._options.download_index
 
     @property
     def username(self) -> str | None:
@@ -90,7 +172,7 @@ class Video:
 
     @property
     def date(self) -> "datetime":
-        return self._date
+        return fn.get_date(self.video_id)
 
     @property
     def video_link(self) -> str:
@@ -107,6 +189,7 @@ class Video:
 
     @property
     def video_id(self) -> int:
+        assert self._video_id is not None
         return self._video_id
 
     @video_id.setter
@@ -115,11 +198,35 @@ class Video:
 
     @property
     def file_size(self) -> "FileSize":
-        return self._file_size
+        return FileSize(self._file_size)
 
     @file_size.setter
     def file_size(self, file_size: float) -> None:
-        self._file_size.update(file_size)
+        self._file_size = file_size
+
+    @property
+    def resolution(self) -> tuple[int, int] | None:
+        return self._resolution
+
+    @resolution.setter
+    def resolution(self, resolution: tuple[int, int]) -> None:
+        self._resolution = resolution
+
+    @property
+    def bitrate(self) -> int | None:
+        return self._bitrate
+
+    @bitrate.setter
+    def bitrate(self, bitrate: int) -> None:
+        self._bitrate = bitrate
+
+    @property
+    def extractor(self) -> str | None:
+        return self._extractor
+
+    @extractor.setter
+    def extractor(self, extractor: str) -> None:
+        self._extractor = extractor
 
     @property
     def download_status(self) -> DownloadStatus:
@@ -130,16 +237,14 @@ class Video:
         self._download_status = download_status
 
     @property
-    def filename_template(self) -> str | None:
-        return self._filename_template
+    def filename_template(self) -> FilenameTemplate | None:
+        return self._options.filename_template
 
     @property
     def output_file_dir(self) -> Path | None:
-        return self._output_file_dir
-
-    @output_file_dir.setter
-    def output_file_dir(self, output_file_dir: Path) -> None:
-        self._output_file_dir = output_file_dir
+        if self._output_file_path is None:
+            return None
+        return self._output_file_path.parent
 
     @property
     def output_file_path(self) -> Path:
@@ -151,7 +256,7 @@ class Video:
         self._output_file_path = output_file_path
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FileSize:
     size_in_bytes: float | None = None
 
@@ -173,6 +278,3 @@ class FileSize:
             size /= BYTES_PER_KB
 
         raise FileTooLargeError
-
-    def update(self, value: float) -> None:
-        self.size_in_bytes = value
@@ -0,0 +1,84 @@
+import asyncio
+import re
+from collections.abc import Iterable
+from urllib.parse import urljoin
+
+import aiohttp
+
+from tikorgzo.core.video.constants import MAX_CONCURRENT_RESOLUTION_TASKS, MAX_RESOLUTION_REDIRECTS, NORMAL_TIKTOK_VIDEO_LINK_REGEX, RESOLUTION_TIMEOUT
+from tikorgzo.core.video.helpers import add_url_scheme, is_short_link
+from tikorgzo.core.video.link_cache import ShortLinkCache
+
+
+class ShortLinkResolver:
+    """Resolves shortened vt.tiktok.com links into their canonical
+    `tiktok.com/@username/video/<id>` form.
+
+    All links are resolved concurrently (bounded by a semaphore) over a single keep-alive
+    session. Redirects are followed by hand with HEAD requests, and only until the canonical
+    video URL is reached, so the body of the video page is never fetched.
+
+    If a cache is given, it is consulted before any network call, and links newly resolved
+    to their canonical URL are stored into it.
+    """
+
+    def __init__(
+        self,
+        proxy: str | None = None,
+        cache: ShortLinkCache | None = None,
+        max_concurrent_tasks: int = MAX_CONCURRENT_RESOLUTION_TASKS,
+    ) -> None:
+        self._proxy = proxy
+        self._cache = cache
+        self._max_concurrent_tasks = max_concurrent_tasks
+        self.semaphore = asyncio.Semaphore(max_concurrent_tasks)
+
+    async def resolve_all(self, video_links: Iterable[str]) -> dict[str, str]:
+        """Resolves every short link found in `video_links` and returns a mapping of short link
+        to canonical URL. Links that fail to resolve are left out of the result.
+        """
+
+        short_links = [video_link for video_link in video_links if is_short_link(video_link)]
+        resolved_links = self._cache.get_many(short_links) if self._cache else {}
+        uncached_links = [short_link for short_link in short_links if short_link not in resolved_links]
+
+        if not uncached_links:
+            return resolved_links
+
+        newly_resolved_links = await self._resolve_all_from_network(uncached_links)
+
+        if self._cache:
+            self._cache.put_many(newly_resolved_links)
+
+        resolved_links.update(newly_resolved_links)
+        return resolved_links
+
+    async def _resolve_all_from_network(self, short_links: list[str]) -> dict[str, str]:
+        connector = aiohttp.TCPConnector(limit=self._max_concurrent_tasks)
+        async with aiohttp.ClientSession(
+            connector=connector,
+            proxy="https://" + self._proxy if self._proxy else None,
+            timeout=aiohttp.ClientTimeout(total=RESOLUTION_TIMEOUT),
+        ) as session:
+            tasks = [self._resolve(session, short_link) for short_link in short_links]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        return {short_link: result for short_link, result in zip(short_links, results, strict=True) if isinstance(result, str) and re.search(NORMAL_TIKTOK_VIDEO_LINK_REGEX, result)}
+
+    async def _resolve(self, session: aiohttp.ClientSession, short_link: str) -> str:
+        async with self.semaphore:
+            url = add_url_scheme(short_link)
+
+            for _ in range(MAX_RESOLUTION_REDIRECTS):
+                async with session.head(url, allow_redirects=False) as response:
+                    location = response.headers.get("Location")
+
+                if location is None:
+                    break
+
+                url = urljoin(url, location)
+
+                if re.search(NORMAL_TIKTOK_VIDEO_LINK_REGEX, url):
+                    break
+
+            return url
@@ -0,0 +1,90 @@
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+
+
+class WorkerPool[T, R]:
+    """Runs items through a coroutine function with a fixed number of workers that pull
+    from a bounded `asyncio.Queue`, emitting each result as soon as it completes.
+
+    Unlike creating one coroutine per item and gathering all of them up front, only
+    `worker_count` tasks ever exist, and only a bounded number of items and results are
+    held at a time. This keeps memory use proportional to the concurrency instead of the
+    size of the batch.
+
+    Exceptions raised for an item are emitted as its result instead of stopping the pool.
+    """
+
+    def __init__(self, func: Callable[[T], Awaitable[R]], worker_count: int) -> None:
+        self._func = func
+        self.worker_count = worker_count
+
+    async def imap(self, items: Iterable[T]) -> AsyncGenerator[tuple[T, R | Exception]]:
+        """Feeds the items into the workers.
+
+        Yields:
+            tuple[T, R | Exception]: Each item and its result, in order of completion.
+
+        """
+
+        queue: asyncio.Queue[T | None] = asyncio.Queue(maxsize=self.worker_count)
+
+        async def feed() -> None:
+            for item in items:
+                await queue.put(item)
+            await queue.put(None)
+
+        feeder = asyncio.create_task(feed())
+
+        entries = self.imap_queue(queue)
+
+        try:
+            async for entry in entries:
+                yield entry
+        finally:
+            # Closing the inner generator right away ensures that its workers are stopped
+            # even if the caller stops consuming the results early
+            await entries.aclose()
+            feeder.cancel()
+            try:
+                await feeder
+            except asyncio.CancelledError:
+                pass
+
+    async def imap_queue(self, queue: "asyncio.Queue[T | None]") -> AsyncGenerator[tuple[T, R | Exception]]:
+        """Processes the items from a queue that is fed by someone else until a `None` sentinel
+        is received.
+
+        Yields:
+            tuple[T, R | Exception]: Each item and its result, in order of completion.
+
+        """
+
+        results: asyncio.Queue[tuple[T, R | Exception] | None] = asyncio.Queue(maxsize=self.worker_count)
+
+        async def worker() -> None:
+            while (item := await queue.get()) is not None:
+                try:
+                    result: R | Exception = await self._func(item)
+                except Exception as e:
+                    result = e
+                await results.put((item, result))
+
+            # Put the sentinel back so that the other workers will stop as well
+            await queue.put(None)
+            await results.put(None)
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.worker_count)]
+        finished_workers = 0
+
+        try:
+            while finished_workers < self.worker_count:
+                entry = await results.get()
+
+                if entry is None:
+                    finished_workers += 1
+                else:
+                    yield entry
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
@@ -65,6 +65,14 @@ class InvalidDateFormatError(Exception):
         super().__init__(self.message)
 
 
+class UploadDateOutOfRangeError(Exception):
+    """Raised when the video was uploaded outside of the date range set via `--since`/`--until`."""
+
+    def __init__(self, video_id: int) -> None:
+        self.message = f"Video '{video_id}' was uploaded outside of the set date range."
+        super().__init__(self.message)
+
+
 class ExtractorCreationError(Exception):
     """Raised when the value provided for extractor, extraction delay, or session is invalid."""
 
@@ -140,6 +148,14 @@ class FileTooLargeError(Exception):
         super().__init__(self.message)
 
 
+class IncompleteDownloadError(Exception):
+    """Raised when the download ends before the whole file has been received."""
+
+    def __init__(self, received_size: int, total_size: int | None) -> None:
+        self.message = f"Download ended after {received_size} of {total_size if total_size is not None else 'unknown'} bytes."
+        super().__init__(self.message)
+
+
 class DownloadError(Exception):
     """Raised when downloading the video goes wrong."""
 
@@ -148,6 +164,49 @@ class DownloadError(Exception):
         super().__init__(self.message)
 
 
+class BrowserDaemonRunningError(Exception):
+    """Raised when the browser daemon is started while it's already running for the same Chrome profile."""
+
+    def __init__(self) -> None:
+        self.message = "The browser daemon is already running."
+        super().__init__(self.message)
+
+
+class ClearanceExpiredError(Exception):
+    """Raised when TikWM's bot check blocks the requests sent outside of the browser."""
+
+    def __init__(self) -> None:
+        self.message = "The clearance from the TikWM website's bot check is missing or has expired."
+        super().__init__(self.message)
+
+
+class TikWMAPIError(Exception):
+    """Raised when the TikWM API responds with an error that has no dedicated exception."""
+
+    def __init__(self, message: str | None) -> None:
+        self.message = f"TikWM API responded with an error: {message or 'unknown error'}"
+        super().__init__(self.message)
+
+
+class RateLimitedError(Exception):
+    """Raised when a request gets rate limited and has to be sent again."""
+
+    def __init__(self, retry_after: float | None = None) -> None:
+        self.retry_after = retry_after
+        self.message = "The request has been rate limited."
+        super().__init__(self.message)
+
+
+class ExtractionWorkerError(Exception):
+    """Raised when an extraction worker process fails in a way that can't be told as one of
+    the other exceptions, e.g., when it exits unexpectedly.
+    """
+
+    def __init__(self, message: str) -> None:
+        self.message = f"Extraction worker failed: {message}"
+        super().__init__(self.message)
+
+
 class ExtractionTimeoutError(Exception):
     """Raised when extracting the download link takes too long."""
 
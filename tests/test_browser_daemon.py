@@ -0,0 +1,143 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from tikorgzo.core.extractors.tikwm.browser import ScrapeBrowser, get_daemon_endpoint, get_daemon_proxy
+from tikorgzo.core.extractors.tikwm.constants import DAEMON_PROXY_FILE, DEVTOOLS_ACTIVE_PORT_FILE
+from tikorgzo.core.extractors.tikwm.daemon import BrowserDaemon
+from tikorgzo.core.extractors.tikwm.request_filter import RequestFilter
+
+
+class FakePage:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self) -> None:
+        self.closed = False
+        self.unrouted: list[tuple[str, object]] = []
+
+    async def close(self) -> None:
+        self.closed = True
+
+    async def unroute(self, url: str, handler: object) -> None:
+        self.unrouted.append((url, handler))
+
+
+class FakeBrowser:
+    def __init__(self) -> None:
+        self.disconnected = False
+
+    async def close(self) -> None:
+        self.disconnected = True
+
+
+class TestDaemonEndpoint:
+    """Tests for finding the browser daemon of a Chrome profile."""
+
+    def test_endpoint_is_read_from_port_file(self, tmp_path: Path) -> None:
+        (tmp_path / DEVTOOLS_ACTIVE_PORT_FILE).write_text("40123\n/devtools/browser/abc\n", encoding="utf-8")
+
+        assert get_daemon_endpoint(tmp_path) == "http://127.0.0.1:40123"
+
+    def test_no_endpoint_without_port_file(self, tmp_path: Path) -> None:
+        assert get_daemon_endpoint(tmp_path) is None
+
+    def test_no_endpoint_with_invalid_port_file(self, tmp_path: Path) -> None:
+        (tmp_path / DEVTOOLS_ACTIVE_PORT_FILE).write_text("", encoding="utf-8")
+
+        assert get_daemon_endpoint(tmp_path) is None
+
+    def test_proxy_is_read_from_proxy_file(self, tmp_path: Path) -> None:
+        (tmp_path / DAEMON_PROXY_FILE).write_text("127.0.0.1:8080\n", encoding="utf-8")
+
+        assert get_daemon_proxy(tmp_path) == "127.0.0.1:8080"
+
+    def test_no_proxy_without_proxy_file(self, tmp_path: Path) -> None:
+        assert get_daemon_proxy(tmp_path) is None
+
+
+class TestAttach:
+    """Tests for attaching only to a daemon with the proxy of the run."""
+
+    @pytest.fixture
+    def connected(self, monkeypatch: pytest.MonkeyPatch) -> list[bool]:
+        connected: list[bool] = []
+
+        async def connect_to_daemon(_: ScrapeBrowser, __: object) -> FakeContext:
+            connected.append(True)
+            return FakeContext()
+
+        monkeypatch.setattr(ScrapeBrowser, "_connect_to_daemon", connect_to_daemon)
+        return connected
+
+    @pytest.mark.parametrize(("daemon_proxy", "proxy"), [("", None), ("127.0.0.1:8080", "127.0.0.1:8080")])
+    def test_daemon_with_same_proxy_is_attached_to(self, tmp_path: Path, connected: list[bool], daemon_proxy: str, proxy: str | None) -> None:
+        (tmp_path / DAEMON_PROXY_FILE).write_text(daemon_proxy, encoding="utf-8")
+        browser = ScrapeBrowser(proxy=proxy, user_data_dir=tmp_path)
+
+        assert asyncio.run(browser._attach_to_daemon(None)) is not None  # type: ignore[arg-type]  # noqa: SLF001
+        assert connected == [True]
+
+    @pytest.mark.parametrize(("daemon_proxy", "proxy"), [(None, None), ("", "127.0.0.1:8080"), ("127.0.0.1:8080", None)])
+    def test_daemon_with_other_proxy_is_not_attached_to(self, tmp_path: Path, connected: list[bool], daemon_proxy: str | None, proxy: str | None) -> None:
+        if daemon_proxy is not None:
+            (tmp_path / DAEMON_PROXY_FILE).write_text(daemon_proxy, encoding="utf-8")
+        browser = ScrapeBrowser(proxy=proxy, user_data_dir=tmp_path)
+
+        assert asyncio.run(browser._attach_to_daemon(None)) is None  # type: ignore[arg-type]  # noqa: SLF001
+        assert connected == []
+
+
+class TestAttachedCleanup:
+    """Tests for leaving the daemon's browser running after a run that attached to it."""
+
+    def test_only_own_pages_are_closed(self, tmp_path: Path) -> None:
+        browser = ScrapeBrowser(request_filter=RequestFilter(), user_data_dir=tmp_path)
+        context = FakeContext()
+        daemon_browser = FakeBrowser()
+        idle_page = FakePage()
+        page_in_use = FakePage()
+        browser.context = context  # type: ignore[assignment]
+        browser._browser = daemon_browser  # type: ignore[assignment]  # noqa: SLF001
+        browser._opened_pages.extend([idle_page, page_in_use])  # type: ignore[list-item]  # noqa: SLF001
+        browser._idle_pages.put_nowait(idle_page)  # type: ignore[arg-type]  # noqa: SLF001
+
+        asyncio.run(browser.cleanup())
+
+        assert idle_page.closed
+        assert page_in_use.closed
+        assert context.unrouted == [("**/*", browser._route_handler)]  # noqa: SLF001
+        assert daemon_browser.disconnected
+        assert not context.closed
+
+    def test_daemon_removes_its_port_file(self, tmp_path: Path) -> None:
+        (tmp_path / DEVTOOLS_ACTIVE_PORT_FILE).write_text("40123\n", encoding="utf-8")
+        (tmp_path / DAEMON_PROXY_FILE).write_text("", encoding="utf-8")
+        daemon = BrowserDaemon(user_data_dir=tmp_path)
+        context = FakeContext()
+        daemon.context = context  # type: ignore[assignment]
+
+        asyncio.run(daemon.cleanup())
+
+        assert context.closed
+        assert not (tmp_path / DEVTOOLS_ACTIVE_PORT_FILE).exists()
+        assert not (tmp_path / DAEMON_PROXY_FILE).exists()
+
+    def test_daemon_keeps_port_file_of_other_daemon(self, tmp_path: Path) -> None:
+        (tmp_path / DEVTOOLS_ACTIVE_PORT_FILE).write_text("40123\n", encoding="utf-8")
+        daemon = BrowserDaemon(user_data_dir=tmp_path)
+        daemon.context = FakeContext()  # type: ignore[assignment]
+        daemon._browser = FakeBrowser()  # type: ignore[assignment]  # noqa: SLF001
+
+        asyncio.run(daemon.cleanup())
+
+        assert (tmp_path / DEVTOOLS_ACTIVE_PORT_FILE).exists()
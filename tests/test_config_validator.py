@@ -8,7 +8,9 @@ from tikorgzo.config.validator import (
     is_invalid_extractor,
     is_invalid_filename_string,
     is_invalid_max_concurrent_downloads,
+    is_invalid_short_link_cache_ttl,
     is_invalid_type,
+    is_invalid_upload_date_bound,
     validate_config,
 )
 from tikorgzo.constants import DIRECT_EXTRACTOR_NAME, TIKWM_EXTRACTOR_NAME
@@ -188,6 +190,49 @@ class TestIsInvalidMaxConcurrentDownloads:
         assert result is not None
 
 
+# ---------------------------------------------------------------------------
+# is_invalid_short_link_cache_ttl
+# ---------------------------------------------------------------------------
+class TestIsInvalidShortLinkCacheTtl:
+    """Tests for is_invalid_short_link_cache_ttl()."""
+
+    min_val: int = CONFIG_VARIABLES["short_link_cache_ttl"]["constraints"]["min"]
+    max_val: int = CONFIG_VARIABLES["short_link_cache_ttl"]["constraints"]["max"]
+
+    def test_boundaries_pass(self) -> None:
+        assert is_invalid_short_link_cache_ttl(self.min_val) is None
+        assert is_invalid_short_link_cache_ttl(self.max_val) is None
+
+    def test_below_minimum_returns_error(self) -> None:
+        assert is_invalid_short_link_cache_ttl(self.min_val - 1) is not None
+
+    def test_above_maximum_returns_error(self) -> None:
+        assert is_invalid_short_link_cache_ttl(self.max_val + 1) is not None
+
+    def test_dispatched_from_validate_config(self) -> None:
+        with pytest.raises(InvalidConfigDataError):
+            validate_config(ConfigKey.SHORT_LINK_CACHE_TTL, 0, MapSource.CONFIG_FILE)
+
+
+# ---------------------------------------------------------------------------
+# is_invalid_upload_date_bound
+# ---------------------------------------------------------------------------
+class TestIsInvalidUploadDateBound:
+    """Tests for is_invalid_upload_date_bound()."""
+
+    @pytest.mark.parametrize("value", ["2025-01-31", "2025-01-31T18:00", "2025-01-31T18:00+08:00", "7d"])
+    def test_valid_values(self, value: str) -> None:
+        assert is_invalid_upload_date_bound(ConfigKey.SINCE, value) is None
+
+    @pytest.mark.parametrize("value", ["last week", "7", "2025-13-01", "-7d"])
+    def test_invalid_values(self, value: str) -> None:
+        assert is_invalid_upload_date_bound(ConfigKey.UNTIL, value) is not None
+
+    def test_invalid_value_raises_via_dispatcher(self) -> None:
+        with pytest.raises(InvalidConfigDataError):
+            validate_config(ConfigKey.SINCE, "yesterday", MapSource.CLI)
+
+
 # ---------------------------------------------------------------------------
 # is_invalid_filename_string
 # ---------------------------------------------------------------------------
@@ -254,3 +299,11 @@ class TestIsInvalidFilenameString:
         # regex only matches first {date:...}; second one is ignored
         result = is_invalid_filename_string("{video_id}_{date:%Y}_{date:%m}")
         assert result is None
+
+    def test_plain_date_placeholder_uses_default_format(self) -> None:
+        assert is_invalid_filename_string("{video_id}_{date}") is None
+
+    def test_every_date_placeholder_is_checked(self) -> None:
+        result = is_invalid_filename_string("{video_id}_{date:%Y}_{date:%m/%d}")
+        assert result is not None
+        assert "illegal characters" in result
@@ -0,0 +1,114 @@
+import asyncio
+import json
+from typing import Any
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from tikorgzo.core.extractors.direct.extractor import DirectExtractor
+from tikorgzo.core.extractors.direct.helpers import find_item_struct, parse_source_data
+from tikorgzo.core.rate_limiter.model import RateLimiter
+from tikorgzo.exceptions import MissingSourceDataError
+
+ITEM_STRUCT = {
+    "author": {"uniqueId": "username"},
+    "desc": 'a description with </b> and "quotes" and {braces}',
+    "video": {"bitrateInfo": [{"Bitrate": 1000, "PlayAddr": {"UrlList": ["a", "b"], "DataSize": 1024}}]},
+}
+
+
+def _build_page(data: dict[str, Any]) -> bytes:
+    return (
+        '<html><head><script>var x = {"itemInfo":{"itemStruct":{}}};</script>'
+        '<script id="__UNIVERSAL_DATA_FOR_REHYDRATION__" type="application/json">'
+        f"{json.dumps(data, separators=(',', ':'))}"
+        "</script></head><body></body></html>"
+    ).encode()
+
+
+class TestFindItemStruct:
+    """Tests for the byte scanning fast path of the direct extractor."""
+
+    def test_parses_only_the_item_struct(self) -> None:
+        data = {
+            "__DEFAULT_SCOPE__": {
+                "webapp.app-context": {"language": "en"},
+                "webapp.video-detail": {"itemInfo": {"itemStruct": ITEM_STRUCT}, "shareMeta": {"title": "t"}},
+                "seo.abtest": {"itemInfo": {"itemStruct": "not this one"}},
+            },
+        }
+
+        assert find_item_struct(_build_page(data)) == {
+            "__DEFAULT_SCOPE__": {"webapp.video-detail": {"itemInfo": {"itemStruct": ITEM_STRUCT}}},
+        }
+
+    def test_missing_script_returns_none(self) -> None:
+        assert find_item_struct(b"<html><body>Access denied</body></html>") is None
+
+    def test_missing_video_detail_returns_none(self) -> None:
+        assert find_item_struct(_build_page({"__DEFAULT_SCOPE__": {"webapp.app-context": {}}})) is None
+
+    def test_truncated_json_returns_none(self) -> None:
+        page = _build_page({"__DEFAULT_SCOPE__": {"webapp.video-detail": {"itemInfo": {"itemStruct": ITEM_STRUCT}}}})
+
+        assert find_item_struct(page[: page.index(b"bitrateInfo")] + b"</script>") is None
+
+
+class TestParseSourceData:
+    """Tests for parse_source_data(), which falls back to parsing the whole page."""
+
+    def test_falls_back_to_whole_page(self) -> None:
+        # Pretty-printed JSON isn't picked up by the fast path
+        data = {"__DEFAULT_SCOPE__": {"webapp.video-detail": {"itemInfo": {"itemStruct": ITEM_STRUCT}}}}
+        page = f'<script id="__UNIVERSAL_DATA_FOR_REHYDRATION__">{json.dumps(data, indent=2)}</script>'.encode()
+
+        assert find_item_struct(page) is None
+        assert parse_source_data(page) == data
+
+    def test_missing_script_raises(self) -> None:
+        with pytest.raises(MissingSourceDataError):
+            parse_source_data(b"<html><body>Access denied</body></html>")
+
+
+async def _get_source_data(responses: list[web.Response]) -> tuple[dict[str, Any], int]:
+    """Gets the source data with the aiohttp session from a local server that answers with
+    `responses` in order, returning it with the number of requests that the server got.
+    """
+
+    request_count = 0
+
+    async def handle(_: web.Request) -> web.Response:
+        nonlocal request_count
+        request_count += 1
+        return responses[request_count - 1]
+
+    app = web.Application()
+    app.router.add_get("/video", handle)
+
+    async with TestServer(app) as server, aiohttp.ClientSession() as session:
+        extractor = DirectExtractor(RateLimiter(), session)
+        source_data = await extractor._get_rate_limited_source_data(str(server.make_url("/video")))  # noqa: SLF001
+
+    return source_data, request_count
+
+
+class TestDirectExtractor:
+    """Tests for fetching the source data with the aiohttp session."""
+
+    def test_gets_source_data(self) -> None:
+        page = _build_page({"__DEFAULT_SCOPE__": {"webapp.video-detail": {"itemInfo": {"itemStruct": ITEM_STRUCT}}}})
+
+        source_data, request_count = asyncio.run(_get_source_data([web.Response(body=page, content_type="text/html")]))
+
+        assert source_data["__DEFAULT_SCOPE__"]["webapp.video-detail"]["itemInfo"]["itemStruct"] == ITEM_STRUCT
+        assert request_count == 1
+
+    def test_rate_limited_request_is_sent_again(self) -> None:
+        page = _build_page({"__DEFAULT_SCOPE__": {"webapp.video-detail": {"itemInfo": {"itemStruct": ITEM_STRUCT}}}})
+        responses = [web.Response(status=429, headers={"Retry-After": "0"}), web.Response(body=page, content_type="text/html")]
+
+        _, request_count = asyncio.run(_get_source_data(responses))
+
+        assert request_count == 2
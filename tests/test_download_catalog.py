@@ -0,0 +1,87 @@
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from tikorgzo.core.catalog.constants import CATALOG_FILE_NAME
+from tikorgzo.core.catalog.model import CatalogEntry, DownloadCatalog
+
+
+# Fixtures
+@pytest.fixture
+def catalog(tmp_path: Path) -> DownloadCatalog:
+    return DownloadCatalog(tmp_path)
+
+
+@pytest.fixture
+def sample_entry(tmp_path: Path) -> CatalogEntry:
+    """Sample catalog entry with all metadata provided."""
+    return CatalogEntry(
+        video_id=7123456789109876543,
+        output_path=tmp_path / "username" / "7123456789109876543.mp4",
+        username="username",
+        upload_date=datetime(2022, 7, 1, 12, 30, tzinfo=UTC),
+        file_size=1024,
+        width=1080,
+        height=1920,
+        bitrate=2_000_000,
+        completed_at=datetime(2024, 12, 30, 23, 59, tzinfo=UTC),
+    )
+
+
+class TestDownloadCatalog:
+    """Tests for DownloadCatalog."""
+
+    def test_creates_catalog_inside_download_dir(self, catalog: DownloadCatalog, tmp_path: Path) -> None:
+        assert not catalog.is_seeded()
+        assert (tmp_path / CATALOG_FILE_NAME).exists()
+
+    def test_mark_seeded(self, catalog: DownloadCatalog) -> None:
+        catalog.mark_seeded()
+        assert catalog.is_seeded()
+
+    def test_mark_scanned(self, catalog: DownloadCatalog) -> None:
+        assert catalog.get_scanned_at() == 0.0
+
+        catalog.mark_scanned(1735603140.5)
+
+        assert catalog.get_scanned_at() == 1735603140.5
+
+    def test_found_entry_keeps_recorded_metadata(self, catalog: DownloadCatalog, sample_entry: CatalogEntry) -> None:
+        """A scan finding an already downloaded file shouldn't drop what the download recorded about it."""
+        catalog.add(sample_entry)
+
+        catalog.add_found_entries([CatalogEntry(video_id=sample_entry.video_id, output_path=sample_entry.output_path)])
+
+        assert catalog.find_by_video_id(sample_entry.video_id)[0].bitrate == 2_000_000
+
+    def test_roundtrip_by_video_id(self, catalog: DownloadCatalog, sample_entry: CatalogEntry) -> None:
+        catalog.add(sample_entry)
+
+        entries = catalog.find_by_video_id(sample_entry.video_id)
+
+        assert len(entries) == 1
+        assert entries[0].username == "username"
+        assert entries[0].upload_date == sample_entry.upload_date
+        assert entries[0].completed_at == sample_entry.completed_at
+        assert (entries[0].width, entries[0].height, entries[0].bitrate) == (1080, 1920, 2_000_000)
+
+    def test_paths_are_stored_relative_to_download_dir(self, catalog: DownloadCatalog, sample_entry: CatalogEntry, tmp_path: Path) -> None:
+        catalog.add(sample_entry)
+
+        entry = catalog.find_by_output_path(sample_entry.output_path)[0]
+
+        assert entry.output_path == Path("username/7123456789109876543.mp4")
+        assert catalog.get_absolute_path(entry) == tmp_path / "username" / "7123456789109876543.mp4"
+
+    def test_remove(self, catalog: DownloadCatalog, sample_entry: CatalogEntry) -> None:
+        catalog.add(sample_entry)
+        catalog.remove(catalog.find_by_video_id(sample_entry.video_id)[0])
+
+        assert catalog.find_by_video_id(sample_entry.video_id) == []
+
+    def test_persists_across_connections(self, catalog: DownloadCatalog, sample_entry: CatalogEntry, tmp_path: Path) -> None:
+        catalog.add(sample_entry)
+        catalog.close()
+
+        assert len(DownloadCatalog(tmp_path).find_by_video_id(sample_entry.video_id)) == 1
@@ -0,0 +1,131 @@
+from datetime import UTC, datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from tikorgzo.core.video.helpers import check_if_already_downloaded
+from tikorgzo.core.video.index import DownloadIndex
+from tikorgzo.exceptions import VideoFileAlreadyExistsError
+
+VIDEO_ID = 7123456789109876543
+
+
+# Fixtures
+@pytest.fixture
+def download_dir(tmp_path: Path) -> Path:
+    """Download directory with a few already downloaded videos."""
+    user_dir = tmp_path / "username"
+    user_dir.mkdir()
+    (user_dir / f"username-{VIDEO_ID}.mp4").touch()
+    (user_dir / "20241230_7023456789109876544.mp4").touch()
+    (user_dir / "notes.txt").touch()
+    (user_dir / "7234567891098765432.mp4.part").touch()
+    return tmp_path
+
+
+@pytest.fixture
+def download_index(download_dir: Path) -> DownloadIndex:
+    index = DownloadIndex(str(download_dir))
+    index.build()
+    return index
+
+
+class TestDownloadIndex:
+    """Tests for DownloadIndex."""
+
+    def test_finds_video_id_in_filename(self, download_index: DownloadIndex, download_dir: Path) -> None:
+        assert download_index.find(VIDEO_ID) == download_dir / "username" / f"username-{VIDEO_ID}.mp4"
+
+    def test_finds_video_id_next_to_other_digits(self, download_index: DownloadIndex) -> None:
+        """A video ID glued to other digits should still be found, like a substring check would."""
+        assert download_index.find(7023456789109876544) is not None
+
+    def test_unknown_video_id_returns_none(self, download_index: DownloadIndex) -> None:
+        assert download_index.find(7999999999999999999) is None
+
+    def test_unfinished_download_is_not_indexed(self, download_index: DownloadIndex) -> None:
+        assert download_index.find(7234567891098765432) is None
+
+    def test_contains_exact_path(self, download_index: DownloadIndex, download_dir: Path) -> None:
+        assert download_index.contains(download_dir / "username" / f"username-{VIDEO_ID}.mp4")
+        assert not download_index.contains(download_dir / "username" / "other.mp4")
+
+    def test_add_updates_index(self, download_index: DownloadIndex, download_dir: Path) -> None:
+        new_file = download_dir / "other" / "7888888888888888888.mp4"
+        new_file.parent.mkdir()
+        new_file.write_bytes(b"video")
+        video = SimpleNamespace(
+            video_id=7888888888888888888,
+            output_file_path=new_file,
+            username="other",
+            date=datetime(2024, 12, 30, tzinfo=UTC),
+            resolution=(1080, 1920),
+            bitrate=1000,
+        )
+
+        download_index.add(video)  # type: ignore[arg-type]
+
+        assert download_index.find(7888888888888888888) == new_file
+        assert download_index.contains(new_file)
+
+    def test_file_added_after_seeding_is_found(self, download_index: DownloadIndex, download_dir: Path) -> None:
+        """A file copied into the download directory after the catalog was seeded should still be found by the next run."""
+        download_index.catalog.close()
+        (download_dir / "username" / "7777777777777777777.mp4").touch()
+
+        index = DownloadIndex(str(download_dir))
+
+        assert index.find(VIDEO_ID) is not None
+        assert index.find(7777777777777777777) == download_dir / "username" / "7777777777777777777.mp4"
+
+    def test_file_added_deep_after_seeding_is_found(self, download_dir: Path) -> None:
+        nested_dir = download_dir / "username" / "archive" / "2024"
+        nested_dir.mkdir(parents=True)
+        DownloadIndex(str(download_dir)).build()
+        (nested_dir / "7777777777777777777.mp4").touch()
+
+        index = DownloadIndex(str(download_dir))
+
+        assert index.find(7777777777777777777) == nested_dir / "7777777777777777777.mp4"
+
+    def test_contains_file_unknown_to_catalog(self, download_index: DownloadIndex, download_dir: Path) -> None:
+        new_file = download_dir / "username" / "copied.mp4"
+        new_file.touch()
+
+        assert download_index.contains(new_file)
+
+    def test_oversized_digit_run_is_skipped(self, download_dir: Path) -> None:
+        """A digit run that can't be a video ID shouldn't stop the index from being built."""
+        (download_dir / "backup_99999999999999999999.mp4").touch()
+
+        index = DownloadIndex(str(download_dir))
+        index.build()
+
+        assert index.find(VIDEO_ID) is not None
+
+    def test_deleted_file_is_no_longer_found(self, download_index: DownloadIndex, download_dir: Path) -> None:
+        (download_dir / "username" / f"username-{VIDEO_ID}.mp4").unlink()
+
+        assert download_index.find(VIDEO_ID) is None
+
+    def test_builds_lazily_and_creates_missing_dir(self, tmp_path: Path) -> None:
+        missing_dir = tmp_path / "missing"
+        index = DownloadIndex(str(missing_dir))
+
+        assert index.find(VIDEO_ID) is None
+        assert missing_dir.exists()
+
+
+class TestCheckIfAlreadyDownloaded:
+    """Tests for check_if_already_downloaded() using the download index."""
+
+    def test_existing_video_raises(self, download_index: DownloadIndex) -> None:
+        with pytest.raises(VideoFileAlreadyExistsError):
+            check_if_already_downloaded(VIDEO_ID, False, download_index)
+
+    def test_new_video_passes(self, download_index: DownloadIndex) -> None:
+        check_if_already_downloaded(7999999999999999999, False, download_index)
+
+    def test_lazy_duplicate_check_skips_lookup(self, download_index: DownloadIndex) -> None:
+        check_if_already_downloaded(VIDEO_ID, True, download_index)
@@ -0,0 +1,265 @@
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from rich.progress import Progress
+
+from tikorgzo.constants import DownloadStatus
+from tikorgzo.core.download_manager.partial import PartialDownload, get_segment_bounds
+from tikorgzo.core.download_manager.strategies.aiohttp import AioHTTPDownloadStrategy
+from tikorgzo.core.rate_limiter.model import RateLimiterRegistry
+from tikorgzo.core.video.index import DownloadIndex
+from tikorgzo.core.video.model import Video, VideoOptions
+
+VIDEO_ID = 7123456789109876543
+VIDEO_LINK = f"https://www.tiktok.com/@username/video/{VIDEO_ID}"
+VIDEO_CONTENT = b"video" * 1000
+
+
+async def _download(video: Video, rate_limited_count: int = 0) -> list[str]:
+    """Downloads the video from a local server, which rate limits the first `rate_limited_count`
+    requests, and returns the methods of the requests it got.
+    """
+
+    request_methods: list[str] = []
+
+    async def handle(request: web.Request) -> web.Response:
+        request_methods.append(request.method)
+        if len(request_methods) <= rate_limited_count:
+            return web.Response(status=429, headers={"Retry-After": "0"})
+        return web.Response(body=VIDEO_CONTENT)
+
+    app = web.Application()
+    app.router.add_route("*", "/video.mp4", handle)
+
+    async with TestServer(app) as server, aiohttp.ClientSession() as session:
+        video.download_link = str(server.make_url("/video.mp4"))
+        with Progress(disable=True) as progress:
+            await AioHTTPDownloadStrategy(session, RateLimiterRegistry()).download(video, progress)
+
+    return request_methods
+
+
+async def _download_from(video: Video, handle: Callable[[web.Request], Awaitable[web.StreamResponse]], segments: int = 1) -> None:
+    """Downloads the video from a local server that answers with `handle`, without waiting
+    between the attempts.
+    """
+
+    app = web.Application()
+    app.router.add_get("/video.mp4", handle)
+
+    async with TestServer(app) as server, aiohttp.ClientSession() as session:
+        video.download_link = str(server.make_url("/video.mp4"))
+        strategy = AioHTTPDownloadStrategy(session, RateLimiterRegistry(), segments)
+        strategy.retry_delay = 0
+        with Progress(disable=True) as progress:
+            await strategy.download(video, progress)
+
+
+async def _handle_range(request: web.Request) -> web.Response:
+    """Serves the video, or the part of it asked for by the `Range` header."""
+
+    if request.http_range.start is None:
+        return web.Response(body=VIDEO_CONTENT)
+
+    start = request.http_range.start
+    stop = len(VIDEO_CONTENT) if request.http_range.stop is None else request.http_range.stop
+    content_range = f"bytes {start}-{stop - 1}/{len(VIDEO_CONTENT)}"
+    return web.Response(status=206, body=VIDEO_CONTENT[start:stop], headers={"Content-Range": content_range})
+
+
+def _create_part_file(video: Video, size: int) -> PartialDownload:
+    partial_download = PartialDownload(video.output_file_path)
+    partial_download.part_file_path.write_bytes(VIDEO_CONTENT[:size])
+    partial_download.resume_file_path.write_text(json.dumps({"total_size": len(VIDEO_CONTENT), "validator": None}), encoding="utf-8")
+    return partial_download
+
+
+def _create_prepared_video(tmp_path: Path) -> Video:
+    download_index = DownloadIndex(str(tmp_path))
+    download_index.build()
+    video = Video(VIDEO_LINK, VideoOptions(download_index=download_index))
+    video.prepare()
+    return video
+
+
+class TestAioHTTPDownloadStrategy:
+    """Tests for AioHTTPDownloadStrategy."""
+
+    def test_unknown_file_size_is_taken_from_download_response(self, tmp_path: Path) -> None:
+        video = _create_prepared_video(tmp_path)
+
+        request_methods = asyncio.run(_download(video))
+
+        assert request_methods == ["GET"]
+        assert video.file_size.size_in_bytes == len(VIDEO_CONTENT)
+        assert video.download_status == DownloadStatus.COMPLETED
+        assert video.output_file_path.read_bytes() == VIDEO_CONTENT
+
+    def test_known_file_size_is_kept(self, tmp_path: Path) -> None:
+        video = _create_prepared_video(tmp_path)
+        video.file_size = 1234.0
+
+        asyncio.run(_download(video))
+
+        assert video.file_size.size_in_bytes == 1234.0
+
+    def test_rate_limited_download_is_sent_again(self, tmp_path: Path) -> None:
+        video = _create_prepared_video(tmp_path)
+
+        request_methods = asyncio.run(_download(video, rate_limited_count=1))
+
+        assert request_methods == ["GET", "GET"]
+        assert video.download_status == DownloadStatus.COMPLETED
+        assert video.output_file_path.read_bytes() == VIDEO_CONTENT
+
+
+class TestResumableDownload:
+    """Tests for continuing downloads from their part files."""
+
+    def test_part_file_is_continued(self, tmp_path: Path) -> None:
+        video = _create_prepared_video(tmp_path)
+        partial_download = _create_part_file(video, 1000)
+        ranges: list[str | None] = []
+
+        async def handle(request: web.Request) -> web.Response:
+            ranges.append(request.headers.get("Range"))
+            return await _handle_range(request)
+
+        asyncio.run(_download_from(video, handle))
+
+        assert ranges == ["bytes=1000-"]
+        assert video.download_status == DownloadStatus.COMPLETED
+        assert video.output_file_path.read_bytes() == VIDEO_CONTENT
+        assert not partial_download.part_file_path.exists()
+        assert not partial_download.resume_file_path.exists()
+
+    def test_part_file_starts_over_if_range_is_ignored(self, tmp_path: Path) -> None:
+        video = _create_prepared_video(tmp_path)
+        _create_part_file(video, 1000)
+
+        async def handle(_: web.Request) -> web.Response:
+            return web.Response(body=VIDEO_CONTENT)
+
+        asyncio.run(_download_from(video, handle))
+
+        assert video.output_file_path.read_bytes() == VIDEO_CONTENT
+
+    def test_part_file_of_other_file_size_is_dropped(self, tmp_path: Path) -> None:
+        video = _create_prepared_video(tmp_path)
+        video.file_size = float(len(VIDEO_CONTENT) + 1)
+        _create_part_file(video, 1000)
+        ranges: list[str | None] = []
+
+        async def handle(request: web.Request) -> web.Response:
+            ranges.append(request.headers.get("Range"))
+            return await _handle_range(request)
+
+        asyncio.run(_download_from(video, handle))
+
+        assert ranges == [None]
+        assert video.output_file_path.read_bytes() == VIDEO_CONTENT
+
+    def test_dropped_connection_is_continued(self, tmp_path: Path) -> None:
+        video = _create_prepared_video(tmp_path)
+        ranges: list[str | None] = []
+
+        async def handle(request: web.Request) -> web.StreamResponse:
+            ranges.append(request.headers.get("Range"))
+
+            if len(ranges) > 1:
+                return await _handle_range(request)
+
+            # The connection drops after sending only some of the video
+            response = web.StreamResponse(headers={"Content-Length": str(len(VIDEO_CONTENT))})
+            await response.prepare(request)
+            await response.write(VIDEO_CONTENT[:2000])
+            await asyncio.sleep(0.1)
+            assert request.transport is not None
+            request.transport.close()
+            return response
+
+        asyncio.run(_download_from(video, handle))
+
+        assert ranges == [None, "bytes=2000-"]
+        assert video.download_status == DownloadStatus.COMPLETED
+        assert video.output_file_path.read_bytes() == VIDEO_CONTENT
+
+
+class TestSegmentedDownload:
+    """Tests for downloading large videos over several connections at once."""
+
+    @pytest.fixture(autouse=True)
+    def segment_small_videos(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("tikorgzo.core.download_manager.strategies.aiohttp.SEGMENTED_DOWNLOAD_MIN_SIZE", 0)
+
+    def test_segments_are_assembled(self, tmp_path: Path) -> None:
+        video = _create_prepared_video(tmp_path)
+        video.file_size = float(len(VIDEO_CONTENT))
+        ranges: list[str | None] = []
+
+        async def handle(request: web.Request) -> web.Response:
+            ranges.append(request.headers.get("Range"))
+            return await _handle_range(request)
+
+        asyncio.run(_download_from(video, handle, segments=4))
+
+        assert sorted(ranges) == sorted(f"bytes={start}-{end - 1}" for start, end in get_segment_bounds(len(VIDEO_CONTENT), 4))
+        assert video.download_status == DownloadStatus.COMPLETED
+        assert video.output_file_path.read_bytes() == VIDEO_CONTENT
+        assert not PartialDownload(video.output_file_path).resume_file_path.exists()
+
+    def test_ignored_range_is_downloaded_over_one_connection(self, tmp_path: Path) -> None:
+        video = _create_prepared_video(tmp_path)
+        video.file_size = float(len(VIDEO_CONTENT))
+        ranges: list[str | None] = []
+
+        async def handle(request: web.Request) -> web.Response:
+            ranges.append(request.headers.get("Range"))
+            return web.Response(body=VIDEO_CONTENT)
+
+        asyncio.run(_download_from(video, handle, segments=4))
+
+        assert len(ranges) == 1
+        assert video.download_status == DownloadStatus.COMPLETED
+        assert video.output_file_path.read_bytes() == VIDEO_CONTENT
+
+    @pytest.mark.parametrize("advertised_size", [len(VIDEO_CONTENT) - 1000, len(VIDEO_CONTENT) + 1000])
+    def test_wrong_advertised_size_is_corrected(self, tmp_path: Path, advertised_size: int) -> None:
+        video = _create_prepared_video(tmp_path)
+        video.file_size = float(advertised_size)
+
+        asyncio.run(_download_from(video, _handle_range, segments=4))
+
+        assert video.download_status == DownloadStatus.COMPLETED
+        assert video.file_size.size_in_bytes == len(VIDEO_CONTENT)
+        assert video.output_file_path.read_bytes() == VIDEO_CONTENT
+
+    def test_unfinished_segments_are_continued(self, tmp_path: Path) -> None:
+        video = _create_prepared_video(tmp_path)
+        video.file_size = float(len(VIDEO_CONTENT))
+        partial_download = PartialDownload(video.output_file_path)
+        segments = partial_download.start_segments(len(VIDEO_CONTENT), 2)
+
+        # The first segment is done, and the second one stopped 100 bytes in
+        middle = segments[1][0]
+        with Path.open(partial_download.part_file_path, "r+b") as part_file:
+            part_file.write(VIDEO_CONTENT[: middle + 100])
+        segments[0][2] = middle
+        segments[1][2] = middle + 100
+        partial_download.save_state()
+        ranges: list[str | None] = []
+
+        async def handle(request: web.Request) -> web.Response:
+            ranges.append(request.headers.get("Range"))
+            return await _handle_range(request)
+
+        asyncio.run(_download_from(video, handle, segments=2))
+
+        assert ranges == [f"bytes={middle + 100}-{len(VIDEO_CONTENT) - 1}"]
+        assert video.output_file_path.read_bytes() == VIDEO_CONTENT
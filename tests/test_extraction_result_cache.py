@@ -0,0 +1,310 @@
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from tikorgzo.constants import STATUS_FORBIDDEN, STATUS_OK, DownloadStatus
+from tikorgzo.core.extractors.base import BaseExtractor
+from tikorgzo.core.extractors.constants import DEFAULT_EXTRACTION_RESULT_TTL, MIN_EXTRACTION_RESULT_TTL
+from tikorgzo.core.extractors.context_manager import ExtractorHandler
+from tikorgzo.core.extractors.result_cache import ExtractionResultCache, get_link_expiry
+from tikorgzo.core.rate_limiter.model import RateLimiter
+from tikorgzo.core.video.index import DownloadIndex
+from tikorgzo.core.video.model import Video, VideoOptions
+
+VIDEO_ID = 7123456789109876543
+VIDEO_LINK = f"https://www.tiktok.com/@username/video/{VIDEO_ID}"
+DOWNLOAD_LINK = "https://example.com/video.mp4"
+
+
+class FakeClock:
+    """Stands in for `time.time()` so that the age of the cached results can be controlled."""
+
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeExtractor(BaseExtractor):
+    """Extractor that gives every video the same download link."""
+
+    name = "direct"
+
+    def __init__(self) -> None:
+        super().__init__(RateLimiter())
+        self.is_initialized = False
+        self.extracted: list[int] = []
+
+    async def initialize(self) -> None:
+        self.is_initialized = True
+
+    async def _extract(self, video: Video) -> Video:
+        self.extracted.append(video.video_id)
+        video.download_link = DOWNLOAD_LINK
+        video.file_size = 1024.0
+        return video
+
+    async def cleanup(self) -> None:
+        pass
+
+
+# Fixtures
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ExtractionResultCache:
+    return ExtractionResultCache("direct", cache_path=tmp_path / "extraction_result_cache.db")
+
+
+@pytest.fixture
+def options(tmp_path: Path) -> VideoOptions:
+    download_index = DownloadIndex(str(tmp_path / "downloads"))
+    download_index.build()
+    return VideoOptions(download_index=download_index)
+
+
+def _create_extracted_video(options: VideoOptions, download_link: str = DOWNLOAD_LINK) -> Video:
+    video = Video(VIDEO_LINK, options)
+    video.prepare()
+    video.download_link = download_link
+    video.file_size = 1024.0
+    video.resolution = (1080, 1920)
+    return video
+
+
+def _report_download(cache: ExtractionResultCache, video: Video, status_code: int) -> None:
+    video.download_status = DownloadStatus.COMPLETED if status_code == STATUS_OK else DownloadStatus.INTERRUPTED
+    cache.report_download(video, status_code)
+
+
+class TestExtractionResultCache:
+    """Tests for ExtractionResultCache."""
+
+    def test_miss_on_empty_cache(self, cache: ExtractionResultCache) -> None:
+        assert cache.get(VIDEO_ID) is None
+
+    def test_hit_after_put(self, cache: ExtractionResultCache, options: VideoOptions) -> None:
+        cache.put(_create_extracted_video(options))
+
+        result = cache.get(VIDEO_ID)
+
+        assert result is not None
+        assert result.download_link == DOWNLOAD_LINK
+        assert result.username == "username"
+        assert result.file_size == 1024.0
+        assert result.resolution == (1080, 1920)
+
+    def test_results_are_kept_per_extractor(self, cache: ExtractionResultCache, options: VideoOptions, tmp_path: Path) -> None:
+        cache.put(_create_extracted_video(options))
+
+        other_cache = ExtractionResultCache("tikwm", cache_path=tmp_path / "extraction_result_cache.db")
+
+        assert other_cache.get(VIDEO_ID) is None
+
+    def test_result_is_kept_under_its_own_extractor(self, cache: ExtractionResultCache, options: VideoOptions, tmp_path: Path) -> None:
+        video = _create_extracted_video(options)
+        video.extractor = "tikwm"
+        cache.put(video)
+
+        tikwm_cache = ExtractionResultCache("tikwm", cache_path=tmp_path / "extraction_result_cache.db")
+        result = tikwm_cache.get(VIDEO_ID)
+
+        assert result is not None
+        assert result.extractor == "tikwm"
+
+    def test_fallback_extractor_results_are_looked_up(self, options: VideoOptions, tmp_path: Path) -> None:
+        cache = ExtractionResultCache("direct", "tikwm", cache_path=tmp_path / "extraction_result_cache.db")
+        video = _create_extracted_video(options)
+        video.extractor = "tikwm"
+        cache.put(video)
+
+        result = cache.get(VIDEO_ID)
+
+        assert result is not None
+        assert result.extractor == "tikwm"
+
+    def test_dead_cached_link_lowers_ttl_of_its_own_extractor(self, options: VideoOptions, clock: FakeClock, tmp_path: Path) -> None:
+        cache = ExtractionResultCache("direct", "tikwm", cache_path=tmp_path / "extraction_result_cache.db")
+        video = _create_extracted_video(options)
+        video.extractor = "tikwm"
+        cache.put(video)
+        clock.now += 1800
+        assert cache.get(VIDEO_ID) is not None
+
+        _report_download(cache, video, STATUS_FORBIDDEN)
+
+        assert cache.get_ttl("tikwm") == 900
+        assert cache.get_ttl() == DEFAULT_EXTRACTION_RESULT_TTL
+
+    def test_expires_after_ttl(self, cache: ExtractionResultCache, options: VideoOptions, clock: FakeClock) -> None:
+        cache.put(_create_extracted_video(options))
+        clock.now += DEFAULT_EXTRACTION_RESULT_TTL + 1
+
+        assert cache.get(VIDEO_ID) is None
+
+    def test_never_outlives_link_expiry(self, cache: ExtractionResultCache, options: VideoOptions, clock: FakeClock) -> None:
+        cache.put(_create_extracted_video(options, f"{DOWNLOAD_LINK}?x-expires={int(clock.now) + 600}"))
+
+        assert cache.get(VIDEO_ID) is not None
+
+        clock.now += 400
+
+        assert cache.get(VIDEO_ID) is None
+
+    def test_download_removes_result(self, cache: ExtractionResultCache, options: VideoOptions) -> None:
+        video = _create_extracted_video(options)
+        cache.put(video)
+
+        _report_download(cache, video, STATUS_OK)
+
+        assert cache.get(VIDEO_ID) is None
+
+    def test_dead_cached_link_lowers_ttl(self, cache: ExtractionResultCache, options: VideoOptions, clock: FakeClock) -> None:
+        video = _create_extracted_video(options)
+        cache.put(video)
+        clock.now += 1800
+        assert cache.get(VIDEO_ID) is not None
+
+        _report_download(cache, video, STATUS_FORBIDDEN)
+
+        assert cache.get_ttl() == 900
+        assert cache.take_dead_link_videos() == [video]
+        assert cache.take_dead_link_videos() == []
+
+    @pytest.mark.parametrize("status_code", [429, 500, 503])
+    def test_other_failed_statuses_are_not_dead_links(self, cache: ExtractionResultCache, options: VideoOptions, clock: FakeClock, status_code: int) -> None:
+        video = _create_extracted_video(options)
+        cache.put(video)
+        clock.now += 1800
+        assert cache.get(VIDEO_ID) is not None
+
+        _report_download(cache, video, status_code)
+
+        assert cache.get_ttl() == DEFAULT_EXTRACTION_RESULT_TTL
+        assert cache.take_dead_link_videos() == []
+        assert cache.get(VIDEO_ID) is not None
+
+    def test_ttl_never_drops_below_minimum(self, cache: ExtractionResultCache, options: VideoOptions, clock: FakeClock) -> None:
+        video = _create_extracted_video(options)
+        cache.put(video)
+        clock.now += 10
+        assert cache.get(VIDEO_ID) is not None
+
+        _report_download(cache, video, STATUS_FORBIDDEN)
+
+        assert cache.get_ttl() == MIN_EXTRACTION_RESULT_TTL
+
+    def test_old_working_cached_link_raises_ttl(self, cache: ExtractionResultCache, options: VideoOptions, clock: FakeClock) -> None:
+        video = _create_extracted_video(options)
+        cache.put(video)
+        clock.now += DEFAULT_EXTRACTION_RESULT_TTL - 1
+        assert cache.get(VIDEO_ID) is not None
+
+        _report_download(cache, video, STATUS_OK)
+
+        assert cache.get_ttl() > DEFAULT_EXTRACTION_RESULT_TTL
+
+    def test_freshly_extracted_download_does_not_learn(self, cache: ExtractionResultCache, options: VideoOptions) -> None:
+        video = _create_extracted_video(options)
+        cache.put(video)
+
+        _report_download(cache, video, STATUS_FORBIDDEN)
+
+        assert cache.get_ttl() == DEFAULT_EXTRACTION_RESULT_TTL
+        assert cache.take_dead_link_videos() == []
+
+    def test_persists_across_runs(self, cache: ExtractionResultCache, options: VideoOptions, tmp_path: Path) -> None:
+        cache.put(_create_extracted_video(options))
+        cache.close()
+
+        new_cache = ExtractionResultCache("direct", cache_path=tmp_path / "extraction_result_cache.db")
+
+        assert new_cache.get(VIDEO_ID) is not None
+
+
+class TestGetLinkExpiry:
+    """Tests for get_link_expiry()."""
+
+    def test_link_with_expiry(self) -> None:
+        assert get_link_expiry(f"{DOWNLOAD_LINK}?a=1&x-expires=1700000000") == 1_700_000_000.0
+
+    def test_link_without_expiry(self) -> None:
+        assert get_link_expiry(DOWNLOAD_LINK) is None
+
+
+async def _process_video_links(extractor: FakeExtractor, cache: ExtractionResultCache, videos: list[Video]) -> list[Video]:
+    results: list[Video] = []
+
+    async with ExtractorHandler(extractor, result_cache=cache) as eh:
+        async for _, result in eh.process_video_links(videos):
+            assert not isinstance(result, Exception)
+            results.append(result)
+
+    return results
+
+
+class TestExtractorHandlerWithCache:
+    """Tests for ExtractorHandler consulting the result cache first."""
+
+    def test_cached_videos_skip_extraction(self, cache: ExtractionResultCache, options: VideoOptions) -> None:
+        cache.put(_create_extracted_video(options))
+        extractor = FakeExtractor()
+
+        results = asyncio.run(_process_video_links(extractor, cache, [Video(VIDEO_LINK, options)]))
+
+        assert results[0].download_link == DOWNLOAD_LINK
+        assert results[0].file_size.size_in_bytes == 1024.0
+        assert not extractor.is_initialized
+        assert extractor.extracted == []
+
+    def test_uncached_videos_are_extracted_and_cached(self, cache: ExtractionResultCache, options: VideoOptions) -> None:
+        extractor = FakeExtractor()
+
+        results = asyncio.run(_process_video_links(extractor, cache, [Video(VIDEO_LINK, options)]))
+
+        assert results[0].download_link == DOWNLOAD_LINK
+        assert extractor.is_initialized
+        assert extractor.extracted == [VIDEO_ID]
+        assert cache.get(VIDEO_ID) is not None
+
+    def test_dead_cached_link_is_extracted_again(self, cache: ExtractionResultCache, options: VideoOptions) -> None:
+        cache.put(_create_extracted_video(options, f"{DOWNLOAD_LINK}?dead=1"))
+        extractor = FakeExtractor()
+        video = asyncio.run(_process_video_links(extractor, cache, [Video(VIDEO_LINK, options)]))[0]
+        _report_download(cache, video, STATUS_FORBIDDEN)
+
+        results = asyncio.run(_process_video_links(extractor, cache, cache.take_dead_link_videos()))
+
+        assert results[0].download_link == DOWNLOAD_LINK
+        assert results[0].extractor == "direct"
+        assert extractor.extracted == [VIDEO_ID]
+
+    def test_queue_of_cached_videos_skips_initialization(self, cache: ExtractionResultCache, options: VideoOptions) -> None:
+        cache.put(_create_extracted_video(options))
+        extractor = FakeExtractor()
+
+        async def process_queue() -> list[Video | None]:
+            input_queue: asyncio.Queue[Video | None] = asyncio.Queue()
+            output_queue: asyncio.Queue[Video | None] = asyncio.Queue()
+            input_queue.put_nowait(Video(VIDEO_LINK, options))
+            input_queue.put_nowait(None)
+
+            async with ExtractorHandler(extractor, result_cache=cache) as eh:
+                await eh.process_queue(input_queue, output_queue)
+
+            return [output_queue.get_nowait() for _ in range(output_queue.qsize())]
+
+        results = asyncio.run(process_queue())
+
+        assert results[0] is not None
+        assert results[0].download_link == DOWNLOAD_LINK
+        assert results[1] is None
+        assert not extractor.is_initialized
@@ -0,0 +1,163 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from tikorgzo.core.extractors.base import BaseExtractor
+from tikorgzo.core.extractors.chain import ExtractorChain, LatencyTracker
+from tikorgzo.core.rate_limiter.model import RateLimiter
+from tikorgzo.core.video.index import DownloadIndex
+from tikorgzo.core.video.model import Video, VideoOptions
+from tikorgzo.exceptions import URLParsingError
+
+VIDEO_LINK = "https://www.tiktok.com/@username/video/7123456789109876543"
+
+
+class FakeExtractor(BaseExtractor):
+    """Extractor that sets its own name as the download link after a delay, or raises an error."""
+
+    def __init__(self, name: str, delay: float = 0, error: Exception | None = None) -> None:
+        super().__init__(RateLimiter())
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.is_initialized = False
+        self.extract_count = 0
+
+    async def initialize(self) -> None:
+        self.is_initialized = True
+
+    async def _extract(self, video: Video) -> Video:
+        self.extract_count += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        video.download_link = self.name
+        return video
+
+    async def cleanup(self) -> None:
+        pass
+
+
+class MetadataFirstExtractor(FakeExtractor):
+    """Extractor that sets the bitrate of the video before it gets the download link."""
+
+    async def _extract(self, video: Video) -> Video:
+        video.bitrate = 1000
+        return await super()._extract(video)
+
+
+# Fixtures
+@pytest.fixture
+def options(tmp_path: Path) -> VideoOptions:
+    download_index = DownloadIndex(str(tmp_path))
+    download_index.build()
+    return VideoOptions(download_index=download_index)
+
+
+class TestExtractorChain:
+    """Tests for falling back to and hedging with another extractor."""
+
+    def test_preferred_extractor_is_used_first(self, options: VideoOptions) -> None:
+        fallback = FakeExtractor("fallback")
+        chain = ExtractorChain(FakeExtractor("preferred"), fallback)
+
+        video = asyncio.run(chain.extract(Video(VIDEO_LINK, options)))
+
+        assert video.download_link == "preferred"
+        assert not fallback.is_initialized
+
+    def test_falls_back_on_specific_errors(self, options: VideoOptions) -> None:
+        fallback = FakeExtractor("fallback")
+        chain = ExtractorChain(FakeExtractor("preferred", error=URLParsingError()), fallback)
+
+        video = asyncio.run(chain.extract(Video(VIDEO_LINK, options)))
+
+        assert video.download_link == "fallback"
+        assert fallback.is_initialized
+
+    def test_other_errors_are_not_retried(self, options: VideoOptions) -> None:
+        fallback = FakeExtractor("fallback")
+        chain = ExtractorChain(FakeExtractor("preferred", error=ValueError("unexpected")), fallback)
+
+        with pytest.raises(ValueError, match="unexpected"):
+            asyncio.run(chain.extract(Video(VIDEO_LINK, options)))
+
+        assert fallback.extract_count == 0
+
+    def test_hedges_slow_extraction(self, options: VideoOptions) -> None:
+        preferred = FakeExtractor("preferred")
+        fallback = FakeExtractor("fallback")
+        chain = ExtractorChain(preferred, fallback, hedge=True)
+
+        async def extract_with_slow_last() -> Video:
+            # The extraction times are learned first before the preferred extractor slows down
+            for _ in range(30):
+                await chain.extract(Video(VIDEO_LINK, options))
+            preferred.delay = 5
+            return await chain.extract(Video(VIDEO_LINK, options))
+
+        video = asyncio.run(asyncio.wait_for(extract_with_slow_last(), timeout=2))
+
+        assert video.download_link == "fallback"
+        assert fallback.extract_count == 1
+
+    def test_losing_attempt_is_timed_until_cancelled(self, options: VideoOptions) -> None:
+        preferred = FakeExtractor("preferred")
+        chain = ExtractorChain(preferred, FakeExtractor("fallback"), hedge=True)
+
+        async def extract_with_slow_last() -> None:
+            for _ in range(30):
+                await chain.extract(Video(VIDEO_LINK, options))
+            preferred.delay = 5
+            await chain.extract(Video(VIDEO_LINK, options))
+
+        asyncio.run(asyncio.wait_for(extract_with_slow_last(), timeout=2))
+
+        assert len(chain._latencies._latencies) == 31  # noqa: SLF001
+        assert chain._latencies._latencies[-1] > chain._latencies._latencies[0]  # noqa: SLF001
+
+    def test_losing_attempt_does_not_change_the_result(self, options: VideoOptions) -> None:
+        preferred = MetadataFirstExtractor("preferred")
+        fallback = FakeExtractor("fallback")
+        chain = ExtractorChain(preferred, fallback, hedge=True)
+
+        async def extract_with_slow_last() -> Video:
+            for _ in range(30):
+                await chain.extract(Video(VIDEO_LINK, options))
+            preferred.delay = 5
+            return await chain.extract(Video(VIDEO_LINK, options))
+
+        video = asyncio.run(asyncio.wait_for(extract_with_slow_last(), timeout=2))
+
+        assert video.download_link == "fallback"
+        assert video.bitrate is None
+
+    def test_no_hedging_without_enough_samples(self, options: VideoOptions) -> None:
+        fallback = FakeExtractor("fallback")
+        chain = ExtractorChain(FakeExtractor("preferred", delay=0.05), fallback, hedge=True)
+
+        video = asyncio.run(chain.extract(Video(VIDEO_LINK, options)))
+
+        assert video.download_link == "preferred"
+        assert fallback.extract_count == 0
+
+
+class TestLatencyTracker:
+    """Tests for LatencyTracker."""
+
+    def test_needs_enough_samples(self) -> None:
+        latencies = LatencyTracker()
+        latencies.add(1.0)
+
+        assert latencies.get_percentile() is None
+
+    def test_percentile(self) -> None:
+        latencies = LatencyTracker()
+        for latency in range(1, 101):
+            latencies.add(float(latency))
+
+        percentile = latencies.get_percentile(95)
+
+        assert percentile is not None
+        assert 94 <= percentile <= 96
@@ -0,0 +1,54 @@
+import asyncio
+
+from tikorgzo.core.extractors.base import BaseExtractor
+from tikorgzo.core.extractors.context_manager import ExtractorHandler
+from tikorgzo.core.rate_limiter.model import RateLimiter
+from tikorgzo.exceptions import URLParsingError
+
+
+class FakeExtractor(BaseExtractor):
+    """Extractor that fails for odd "videos" and succeeds for even ones."""
+
+    def __init__(self) -> None:
+        super().__init__(RateLimiter())
+        self.cleaned_up = False
+
+    async def extract(self, video: int) -> int:  # type: ignore[override]
+        await asyncio.sleep(0)
+        if video % 2:
+            raise URLParsingError
+        return video
+
+    async def cleanup(self) -> None:
+        self.cleaned_up = True
+
+
+async def _run_queue(videos: list[int]) -> list[int | None]:
+    input_queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+    output_queue: asyncio.Queue = asyncio.Queue()
+
+    async def produce() -> None:
+        for video in videos:
+            await input_queue.put(video)
+        await input_queue.put(None)
+
+    async with ExtractorHandler(FakeExtractor()) as eh:
+        await asyncio.gather(produce(), eh.process_queue(input_queue, output_queue))
+
+    results = []
+    while not output_queue.empty():
+        results.append(output_queue.get_nowait())
+    return results
+
+
+class TestProcessQueue:
+    """Tests for ExtractorHandler.process_queue()."""
+
+    def test_successful_videos_are_passed_on_followed_by_sentinel(self) -> None:
+        results = asyncio.run(_run_queue(list(range(20))))
+
+        assert results[-1] is None
+        assert sorted(results[:-1]) == list(range(0, 20, 2))  # type: ignore[type-var]
+
+    def test_empty_input_only_passes_sentinel(self) -> None:
+        assert asyncio.run(_run_queue([])) == [None]
@@ -0,0 +1,47 @@
+from datetime import UTC, datetime
+
+from tikorgzo.core.video.filename_template import FilenameTemplate
+
+VIDEO_ID = 7123456789109876543
+DATE = datetime(2022, 7, 1, 12, 30, 45, tzinfo=UTC)
+
+
+class TestFilenameTemplate:
+    """Tests for FilenameTemplate."""
+
+    def test_renders_all_placeholders(self) -> None:
+        template = FilenameTemplate("{username}_{date:%Y-%m-%d}_{video_id}")
+
+        assert template.render(VIDEO_ID, "user", DATE) == f"user_2022-07-01_{VIDEO_ID}"
+
+    def test_plain_date_uses_default_format(self) -> None:
+        template = FilenameTemplate("{date}_{video_id}")
+
+        assert template.render(VIDEO_ID, "user", DATE) == f"20220701_123045_{VIDEO_ID}"
+
+    def test_each_date_placeholder_has_its_own_format(self) -> None:
+        template = FilenameTemplate("{date:%Y}/{date:%m}-{video_id}")
+
+        assert template.date_formats == ("%Y", "%m")
+        assert template.render(VIDEO_ID, "user", DATE) == f"2022/07-{VIDEO_ID}"
+
+    def test_regex_characters_are_kept_literally(self) -> None:
+        """Date formats and literal text shouldn't be treated as regex patterns."""
+        template = FilenameTemplate("[{username}] ({date:%Y.%m+}) {video_id}")
+
+        assert template.render(VIDEO_ID, "user", DATE) == f"[user] (2022.07+) {VIDEO_ID}"
+
+    def test_template_without_date(self) -> None:
+        template = FilenameTemplate("{username}-{video_id}")
+
+        assert template.date_formats == ()
+        assert template.render(VIDEO_ID, "user", DATE) == f"user-{VIDEO_ID}"
+
+    def test_unknown_placeholders_are_kept(self) -> None:
+        template = FilenameTemplate("{title}_{video_id}")
+
+        assert not template.has_placeholder("title")
+        assert template.render(VIDEO_ID, "user", DATE) == f"{{title}}_{VIDEO_ID}"
+
+    def test_compile_reuses_parsed_template(self) -> None:
+        assert FilenameTemplate.compile("{video_id}") is FilenameTemplate.compile("{video_id}")
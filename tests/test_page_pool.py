@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from tikorgzo.core.extractors.tikwm.browser import ScrapeBrowser
+
+
+class FakePage:
+    def __init__(self) -> None:
+        self.load_count = 0
+        self.closed = False
+
+    async def goto(self, url: str, timeout: float, wait_until: str) -> None:
+        self.load_count += 1
+
+    async def wait_for_selector(self, selector: str, state: str, timeout: float) -> None:
+        pass
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+
+class FakeContext:
+    def __init__(self) -> None:
+        self.pages: list[FakePage] = []
+
+    async def new_page(self) -> FakePage:
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+
+def _create_browser(page_pool_size: int) -> tuple[ScrapeBrowser, FakeContext]:
+    browser = ScrapeBrowser(page_pool_size=page_pool_size)
+    context = FakeContext()
+    browser.context = context  # type: ignore[assignment]
+    return browser, context
+
+
+class TestPagePool:
+    """Tests for the page pool of ScrapeBrowser."""
+
+    def test_pages_are_reused_without_reloading(self) -> None:
+        async def run() -> FakeContext:
+            browser, context = _create_browser(page_pool_size=2)
+            await browser.fill_page_pool()
+
+            for _ in range(5):
+                async with browser.pooled_page():
+                    pass
+
+            return context
+
+        context = asyncio.run(run())
+
+        assert len(context.pages) == 2
+        assert all(page.load_count == 1 for page in context.pages)
+
+    def test_failed_pages_are_recycled(self) -> None:
+        async def run() -> FakeContext:
+            browser, context = _create_browser(page_pool_size=1)
+
+            with pytest.raises(RuntimeError):
+                async with browser.pooled_page():
+                    raise RuntimeError
+
+            async with browser.pooled_page():
+                pass
+
+            return context
+
+        context = asyncio.run(run())
+
+        assert len(context.pages) == 2
+        assert context.pages[0].closed
+        assert not context.pages[1].closed
+
+    def test_pool_size_limits_pages_in_use(self) -> None:
+        async def run() -> tuple[int, FakeContext]:
+            browser, context = _create_browser(page_pool_size=2)
+            in_use = 0
+            max_in_use = 0
+
+            async def use_page() -> None:
+                nonlocal in_use, max_in_use
+                async with browser.pooled_page():
+                    in_use += 1
+                    max_in_use = max(max_in_use, in_use)
+                    await asyncio.sleep(0)
+                    in_use -= 1
+
+            await asyncio.gather(*(use_page() for _ in range(6)))
+            return max_in_use, context
+
+        max_in_use, context = asyncio.run(run())
+
+        assert max_in_use == 2
+        assert len(context.pages) == 2
@@ -0,0 +1,130 @@
+import asyncio
+import time
+from datetime import UTC, datetime
+
+import pytest
+
+from tikorgzo.core.rate_limiter.helpers import parse_retry_after
+from tikorgzo.core.rate_limiter.model import RateLimiter, RateLimiterRegistry
+
+
+class FakeClock:
+    """A monotonic clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRateLimiter:
+    """Tests for the AIMD adjustment of RateLimiter."""
+
+    def test_rate_limited_halves_rate(self) -> None:
+        rate_limiter = RateLimiter(max_rate=1.0, clock=FakeClock())
+
+        rate_limiter.on_rate_limited()
+
+        assert rate_limiter.rate == 0.5
+
+    def test_rate_limited_in_flight_requests_only_decrease_once(self) -> None:
+        clock = FakeClock()
+        rate_limiter = RateLimiter(max_rate=1.0, clock=clock)
+
+        rate_limiter.on_rate_limited()
+        rate_limiter.on_rate_limited()
+        rate_limiter.on_rate_limited()
+
+        assert rate_limiter.rate == 0.5
+
+        clock.now += 2
+        rate_limiter.on_rate_limited()
+
+        assert rate_limiter.rate == 0.25
+
+    def test_success_raises_rate_back_to_max(self) -> None:
+        rate_limiter = RateLimiter(max_rate=1.0, clock=FakeClock())
+        rate_limiter.on_rate_limited()
+
+        rate_limiter.on_success()
+        assert rate_limiter.rate == pytest.approx(0.6)
+
+        for _ in range(10):
+            rate_limiter.on_success()
+        assert rate_limiter.rate == 1.0
+
+    def test_rate_never_drops_below_min_rate(self) -> None:
+        clock = FakeClock()
+        rate_limiter = RateLimiter(max_rate=1.0, min_rate=0.3, clock=clock)
+
+        for _ in range(5):
+            rate_limiter.on_rate_limited()
+            clock.now += 10
+
+        assert rate_limiter.rate == 0.3
+
+    def test_unpaced_limiter_starts_pacing_once_rate_limited(self) -> None:
+        rate_limiter = RateLimiter.from_interval(0)
+
+        assert rate_limiter.rate == float("inf")
+
+        rate_limiter.on_rate_limited()
+
+        assert rate_limiter.rate == 2.0
+
+    def test_acquire_paces_requests(self) -> None:
+        async def acquire_many() -> float:
+            rate_limiter = RateLimiter(max_rate=50.0)
+            start = time.monotonic()
+            for _ in range(3):
+                await rate_limiter.acquire()
+            return time.monotonic() - start
+
+        # The first request goes right away and the next two wait 1/50 seconds each
+        assert asyncio.run(acquire_many()) >= 0.04
+
+    def test_acquire_waits_for_retry_after(self) -> None:
+        async def acquire_after_retry_after() -> float:
+            rate_limiter = RateLimiter()
+            rate_limiter.on_rate_limited(retry_after=0.05)
+            start = time.monotonic()
+            await rate_limiter.acquire()
+            return time.monotonic() - start
+
+        assert asyncio.run(acquire_after_retry_after()) >= 0.05
+
+
+class TestRateLimiterRegistry:
+    """Tests for RateLimiterRegistry."""
+
+    def test_same_key_shares_limiter(self) -> None:
+        rate_limiters = RateLimiterRegistry()
+
+        rate_limiter = rate_limiters.get("tikwm", interval=1)
+
+        assert rate_limiters.get("tikwm") is rate_limiter
+        assert rate_limiter.max_rate == 1.0
+        assert rate_limiters.get("example.com") is not rate_limiter
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after()."""
+
+    def test_seconds(self) -> None:
+        assert parse_retry_after("3") == 3.0
+
+    def test_http_date(self) -> None:
+        now = datetime(2025, 1, 1, 0, 0, 0, tzinfo=UTC)
+        assert parse_retry_after("Wed, 01 Jan 2025 00:00:10 GMT", now=now) == 10.0
+
+    def test_date_in_the_past(self) -> None:
+        now = datetime(2025, 1, 1, 0, 0, 0, tzinfo=UTC)
+        assert parse_retry_after("Tue, 31 Dec 2024 23:00:00 GMT", now=now) == 0.0
+
+    def test_capped(self) -> None:
+        assert parse_retry_after("86400") == 300.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_missing_or_invalid(self, value: str | None) -> None:
+        assert parse_retry_after(value) is None
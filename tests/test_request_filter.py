@@ -0,0 +1,37 @@
+import pytest
+
+from tikorgzo.core.extractors.tikwm.request_filter import RequestFilter
+
+
+class TestRequestFilter:
+    """Tests for RequestFilter."""
+
+    @pytest.mark.parametrize(
+        ("url", "resource_type"),
+        [
+            ("https://www.tikwm.com/originalDownloader.html", "document"),
+            ("https://www.tikwm.com/api/", "xhr"),
+            ("https://challenges.cloudflare.com/turnstile/v0/api.js", "script"),
+        ],
+    )
+    def test_allows_needed_requests(self, url: str, resource_type: str) -> None:
+        assert RequestFilter().is_allowed(url, resource_type)
+
+    @pytest.mark.parametrize(
+        ("url", "resource_type"),
+        [
+            ("https://www.tikwm.com/logo.png", "image"),
+            ("https://www.tikwm.com/font.woff2", "font"),
+            ("https://www.googletagmanager.com/gtag/js", "script"),
+            ("https://pagead2.googlesyndication.com/pagead/js/adsbygoogle.js", "script"),
+            ("https://eviltikwm.com/script.js", "script"),
+        ],
+    )
+    def test_blocks_unneeded_requests(self, url: str, resource_type: str) -> None:
+        assert not RequestFilter().is_allowed(url, resource_type)
+
+    def test_custom_filter(self) -> None:
+        request_filter = RequestFilter(blocked_resource_types=[], allowed_hosts=["example.com"])
+
+        assert request_filter.is_allowed("https://cdn.example.com/image.png", "image")
+        assert not request_filter.is_allowed("https://www.tikwm.com/", "document")
@@ -0,0 +1,163 @@
+import asyncio
+import queue
+from pathlib import Path
+from typing import Any
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from tikorgzo.core.extractors.tikwm.constants import MAX_CONCURRENT_EXTRACTION_TASKS, VIDEO_RESULT_MESSAGE, VIDEO_TAKEN_MESSAGE
+from tikorgzo.core.extractors.tikwm.sharded import ShardedTikWMExtractor, WorkerOptions, clone_profile, describe_error, rebuild_error, split_extraction_delay
+from tikorgzo.core.rate_limiter.model import RateLimiter
+from tikorgzo.exceptions import ExtractionWorkerError, URLParsingError
+
+VIDEO_LINK = "https://www.tiktok.com/@username/video/7123456789109876543"
+
+
+class FakeProcess:
+    """Stands in for a worker process, without starting one."""
+
+    def __init__(self) -> None:
+        self.exitcode: int | None = None
+
+    def is_alive(self) -> bool:
+        return self.exitcode is None
+
+    def join(self, timeout: float | None = None) -> None:
+        del timeout
+        self.exitcode = 0
+
+    def terminate(self) -> None:
+        self.exitcode = -15
+
+
+def create_extractor(tmp_path: Path, workers: int = 2) -> tuple[ShardedTikWMExtractor, list[FakeProcess]]:
+    """Creates the extractor with fake workers and queues, where the test plays the workers."""
+
+    extractor = ShardedTikWMExtractor(
+        RateLimiter(),
+        [WorkerOptions(user_data_dir=tmp_path / str(worker_index)) for worker_index in range(workers)],
+    )
+    processes = [FakeProcess() for _ in range(workers)]
+    extractor._processes = processes  # type: ignore[assignment]  # noqa: SLF001
+    extractor._tasks = queue.Queue()  # type: ignore[assignment]  # noqa: SLF001
+    extractor._results = queue.Queue()  # type: ignore[assignment]  # noqa: SLF001
+    return extractor, processes
+
+
+class TestProfileCloning:
+    """Tests for cloning the Chrome profile of each worker."""
+
+    def test_lock_files_are_left_out(self, tmp_path: Path) -> None:
+        source = tmp_path / "chrome_user_data"
+        (source / "Default").mkdir(parents=True)
+        (source / "Default" / "Cookies").write_text("cookies")
+        (source / "SingletonLock").write_text("lock")
+
+        clone_profile(source, tmp_path / "worker")
+
+        assert (tmp_path / "worker" / "Default" / "Cookies").read_text() == "cookies"
+        assert not (tmp_path / "worker" / "SingletonLock").exists()
+
+    def test_existing_clone_is_kept(self, tmp_path: Path) -> None:
+        source = tmp_path / "chrome_user_data"
+        source.mkdir()
+        (source / "Cookies").write_text("new")
+        (tmp_path / "worker").mkdir()
+        (tmp_path / "worker" / "Cookies").write_text("old")
+
+        clone_profile(source, tmp_path / "worker")
+
+        assert (tmp_path / "worker" / "Cookies").read_text() == "old"
+
+    def test_missing_source_creates_empty_profile(self, tmp_path: Path) -> None:
+        clone_profile(tmp_path / "missing", tmp_path / "worker")
+
+        assert (tmp_path / "worker").is_dir()
+
+
+class TestSplitExtractionDelay:
+    """Tests for splitting the pace of a proxy between the workers that share it."""
+
+    def test_workers_sharing_a_proxy_split_its_pace(self) -> None:
+        assert split_extraction_delay([None, None, None], 1.5) == [4.5, 4.5, 4.5]
+
+    def test_workers_with_own_proxies_keep_full_pace(self) -> None:
+        assert split_extraction_delay(["a:1", "b:2", "a:1"], 2) == [4, 2, 4]
+
+    def test_unpaced_workers_stay_unpaced(self) -> None:
+        assert split_extraction_delay([None, None], 0) == [0, 0]
+
+
+class TestErrorRebuilding:
+    """Tests for sending the errors of the workers back to the parent process."""
+
+    def test_known_error_keeps_type(self) -> None:
+        error = rebuild_error(*describe_error(URLParsingError()))
+
+        assert isinstance(error, URLParsingError)
+        assert str(error) == str(URLParsingError())
+
+    def test_third_party_error_keeps_type(self) -> None:
+        error = rebuild_error(*describe_error(PlaywrightTimeoutError("Timeout 30000ms exceeded.")))
+
+        assert isinstance(error, PlaywrightTimeoutError)
+        assert "Timeout 30000ms exceeded." in str(error)
+
+    def test_unknown_error_becomes_worker_error(self) -> None:
+        error = rebuild_error("somewhere.unknown.SomeError", "something failed")
+
+        assert isinstance(error, ExtractionWorkerError)
+        assert "SomeError: something failed" in str(error)
+
+
+class TestShardedTikWMExtractor:
+    """Tests for passing the video links to the workers and their results back."""
+
+    def test_concurrency_grows_with_workers(self, tmp_path: Path) -> None:
+        extractor, _ = create_extractor(tmp_path, workers=3)
+
+        assert extractor.concurrency == 3 * MAX_CONCURRENT_EXTRACTION_TASKS
+
+    def test_results_reach_their_requests(self, tmp_path: Path) -> None:
+        extractor, _ = create_extractor(tmp_path)
+        data = {"play": "/video/media/play/1.mp4", "author": {"unique_id": "username"}}
+
+        async def run() -> tuple[dict[str, Any], BaseException | None]:
+            extractor._reader = asyncio.create_task(extractor._read_results())  # noqa: SLF001
+            first = asyncio.create_task(extractor.get_video_data(VIDEO_LINK))
+            second = asyncio.create_task(extractor.get_video_data(VIDEO_LINK))
+            await asyncio.sleep(0)
+
+            (first_id, _), (second_id, _) = extractor._tasks.get(), extractor._tasks.get()  # noqa: SLF001
+            extractor._results.put((VIDEO_RESULT_MESSAGE, second_id, None, *describe_error(URLParsingError())))  # noqa: SLF001
+            extractor._results.put((VIDEO_RESULT_MESSAGE, first_id, data, None, None))  # noqa: SLF001
+
+            results = await asyncio.gather(first, second, return_exceptions=True)
+            await extractor.cleanup()
+            return results[0], results[1]  # type: ignore[return-value]
+
+        first_result, second_result = asyncio.run(run())
+
+        assert first_result == data
+        assert isinstance(second_result, URLParsingError)
+
+    def test_requests_of_exited_worker_fail(self, tmp_path: Path) -> None:
+        extractor, processes = create_extractor(tmp_path)
+
+        async def run() -> None:
+            extractor._reader = asyncio.create_task(extractor._read_results())  # noqa: SLF001
+            request = asyncio.create_task(extractor.get_video_data(VIDEO_LINK))
+            await asyncio.sleep(0)
+
+            request_id, _ = extractor._tasks.get()  # noqa: SLF001
+            extractor._results.put((VIDEO_TAKEN_MESSAGE, 1, request_id))  # noqa: SLF001
+            processes[1].exitcode = 1
+
+            try:
+                with pytest.raises(ExtractionWorkerError, match="worker 1 exited"):
+                    await request
+            finally:
+                await extractor.cleanup()
+
+        asyncio.run(run())
@@ -0,0 +1,55 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from tikorgzo.core.video.link_cache import ShortLinkCache
+
+SHORT_LINK = "https://vt.tiktok.com/AbCdEfGhI/"
+CANONICAL_URL = "https://www.tiktok.com/@username/video/7123456789109876543"
+
+
+# Fixtures
+@pytest.fixture
+def cache(tmp_path: Path) -> ShortLinkCache:
+    return ShortLinkCache(ttl_days=30, cache_path=tmp_path / "short_link_cache.db")
+
+
+class TestShortLinkCache:
+    """Tests for ShortLinkCache."""
+
+    def test_miss_on_empty_cache(self, cache: ShortLinkCache) -> None:
+        assert cache.get_many([SHORT_LINK]) == {}
+
+    def test_hit_after_put(self, cache: ShortLinkCache) -> None:
+        cache.put_many({SHORT_LINK: CANONICAL_URL})
+        assert cache.get_many([SHORT_LINK]) == {SHORT_LINK: CANONICAL_URL}
+
+    def test_equivalent_links_share_an_entry(self, cache: ShortLinkCache) -> None:
+        """Links that only differ in scheme or trailing slash should hit the same entry."""
+        cache.put_many({SHORT_LINK: CANONICAL_URL})
+        assert cache.get_many(["vt.tiktok.com/AbCdEfGhI"]) == {"vt.tiktok.com/AbCdEfGhI": CANONICAL_URL}
+
+    def test_persists_across_runs(self, cache: ShortLinkCache, tmp_path: Path) -> None:
+        cache.put_many({SHORT_LINK: CANONICAL_URL})
+        cache.close()
+
+        new_cache = ShortLinkCache(ttl_days=30, cache_path=tmp_path / "short_link_cache.db")
+
+        assert new_cache.get_many([SHORT_LINK]) == {SHORT_LINK: CANONICAL_URL}
+
+    def test_expired_entries_are_ignored(self, cache: ShortLinkCache) -> None:
+        cache.put_many({SHORT_LINK: CANONICAL_URL})
+        cache.connection.execute("UPDATE short_links SET resolved_at = ?", (time.time() - 31 * 86400,))
+
+        assert cache.get_many([SHORT_LINK]) == {}
+
+    def test_oldest_entries_are_evicted_beyond_max_entries(self, tmp_path: Path) -> None:
+        cache = ShortLinkCache(ttl_days=30, cache_path=tmp_path / "short_link_cache.db", max_entries=2)
+
+        cache.put_many({"https://vt.tiktok.com/first": CANONICAL_URL})
+        cache.connection.execute("UPDATE short_links SET resolved_at = resolved_at - 10")
+        cache.put_many({"https://vt.tiktok.com/second": CANONICAL_URL, "https://vt.tiktok.com/third": CANONICAL_URL})
+
+        links = ["https://vt.tiktok.com/first", "https://vt.tiktok.com/second", "https://vt.tiktok.com/third"]
+        assert set(cache.get_many(links)) == {"https://vt.tiktok.com/second", "https://vt.tiktok.com/third"}
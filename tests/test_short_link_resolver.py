@@ -0,0 +1,71 @@
+import asyncio
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from tikorgzo.core.video.link_cache import ShortLinkCache
+from tikorgzo.core.video.resolver import ShortLinkResolver
+
+CANONICAL_URL = "https://www.tiktok.com/@username/video/7123456789109876543?_r=1"
+
+
+async def _resolve_with_server(path: str) -> tuple[str, list[str]]:
+    """Resolves `path` from a local server and returns the result together with the requests it received."""
+    received: list[str] = []
+
+    async def short_link(request: web.Request) -> web.Response:
+        received.append(f"{request.method} {request.path}")
+        raise web.HTTPMovedPermanently("/intermediate")
+
+    async def intermediate(request: web.Request) -> web.Response:
+        received.append(f"{request.method} {request.path}")
+        raise web.HTTPFound(CANONICAL_URL)
+
+    async def not_a_redirect(request: web.Request) -> web.Response:
+        received.append(f"{request.method} {request.path}")
+        return web.Response(text="body")
+
+    app = web.Application()
+    app.router.add_route("*", "/AbCdEfGhI", short_link)
+    app.router.add_route("*", "/intermediate", intermediate)
+    app.router.add_route("*", "/plain", not_a_redirect)
+
+    async with TestServer(app) as server, aiohttp.ClientSession() as session:
+        resolver = ShortLinkResolver()
+        result = await resolver._resolve(session, str(server.make_url(path)))
+
+    return result, received
+
+
+class TestShortLinkResolver:
+    """Tests for ShortLinkResolver."""
+
+    def test_follows_redirects_until_canonical_url(self) -> None:
+        result, received = asyncio.run(_resolve_with_server("/AbCdEfGhI"))
+
+        assert result == CANONICAL_URL
+        # The canonical video page itself should never be requested, and only HEAD is used
+        assert received == ["HEAD /AbCdEfGhI", "HEAD /intermediate"]
+
+    def test_returns_last_url_when_not_redirected(self) -> None:
+        result, received = asyncio.run(_resolve_with_server("/plain"))
+
+        assert result.endswith("/plain")
+        assert received == ["HEAD /plain"]
+
+    def test_non_short_links_are_skipped(self) -> None:
+        links = ["7123456789109876543", "https://www.tiktok.com/@username/video/7123456789109876543"]
+
+        assert asyncio.run(ShortLinkResolver().resolve_all(links)) == {}
+
+    def test_cached_links_skip_the_network(self, tmp_path: Path) -> None:
+        # The short link below doesn't exist, so resolving it would fail if the network were used
+        short_link = "https://vt.tiktok.com/AbCdEfGhI"
+        cache = ShortLinkCache(ttl_days=30, cache_path=tmp_path / "short_link_cache.db")
+        cache.put_many({short_link: CANONICAL_URL})
+
+        resolver = ShortLinkResolver(proxy="127.0.0.1:9", cache=cache)
+
+        assert asyncio.run(resolver.resolve_all([short_link])) == {short_link: CANONICAL_URL}
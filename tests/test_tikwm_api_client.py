@@ -0,0 +1,138 @@
+import asyncio
+from typing import Any
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from tikorgzo.core.extractors.tikwm.api import TikWMAPIClient, get_download_source, get_response_data
+from tikorgzo.core.extractors.tikwm.browser import TikWMClearance
+from tikorgzo.core.rate_limiter.model import RateLimiter
+from tikorgzo.exceptions import ClearanceExpiredError, TikWMAPIError, URLParsingError
+
+VIDEO_LINK = "https://www.tiktok.com/@username/video/7123456789109876543"
+VIDEO_DATA = {"hdplay": "/video/media/hdplay/7123456789109876543.mp4", "hd_size": 1024, "author": {"unique_id": "username"}}
+
+
+class FakeBrowser:
+    """Hands out a new clearance cookie every time the bot check is passed."""
+
+    def __init__(self) -> None:
+        self.clearance_count = 0
+
+    async def get_clearance(self) -> TikWMClearance:
+        self.clearance_count += 1
+        return TikWMClearance(user_agent="test-agent", cookies={"cf_clearance": str(self.clearance_count)})
+
+
+async def _get_video_data(responses: list[web.Response]) -> tuple[dict[str, Any] | Exception, FakeBrowser, list[dict[str, str]]]:
+    """Requests the video data from a local server that answers with `responses` in order."""
+    received: list[dict[str, str]] = []
+
+    async def api(request: web.Request) -> web.Response:
+        form = await request.post()
+        received.append({
+            "url": str(form["url"]),
+            "cookie": request.cookies.get("cf_clearance", ""),
+            "user_agent": request.headers.get("User-Agent", ""),
+        })
+        return responses[len(received) - 1]
+
+    app = web.Application()
+    app.router.add_post("/api/", api)
+    browser = FakeBrowser()
+
+    async with TestServer(app) as server, aiohttp.ClientSession() as session:
+        client = TikWMAPIClient(session, browser, RateLimiter(), api_url=str(server.make_url("/api/")))
+
+        try:
+            result: dict[str, Any] | Exception = await client.get_video_data(VIDEO_LINK)
+        except Exception as e:  # noqa: BLE001
+            result = e
+
+    return result, browser, received
+
+
+class TestTikWMAPIClient:
+    """Tests for TikWMAPIClient."""
+
+    def test_returns_video_data_using_clearance(self) -> None:
+        result, browser, received = asyncio.run(_get_video_data([web.json_response({"code": 0, "data": VIDEO_DATA})]))
+
+        assert result == VIDEO_DATA
+        assert browser.clearance_count == 1
+        assert received == [{"url": VIDEO_LINK, "cookie": "1", "user_agent": "test-agent"}]
+
+    def test_refreshes_clearance_once_when_blocked(self) -> None:
+        responses = [
+            web.Response(status=403, text="<html>challenge</html>"),
+            web.json_response({"code": 0, "data": VIDEO_DATA}),
+        ]
+        result, browser, received = asyncio.run(_get_video_data(responses))
+
+        assert result == VIDEO_DATA
+        assert browser.clearance_count == 2
+        assert [request["cookie"] for request in received] == ["1", "2"]
+
+    def test_challenge_page_counts_as_expired_clearance(self) -> None:
+        responses = [
+            web.Response(text="<html>challenge</html>", content_type="text/html"),
+            web.Response(text="<html>challenge</html>", content_type="text/html"),
+        ]
+        result, browser, _ = asyncio.run(_get_video_data(responses))
+
+        assert isinstance(result, ClearanceExpiredError)
+        assert browser.clearance_count == 2
+
+    def test_retries_when_rate_limited(self) -> None:
+        responses = [
+            web.json_response({"code": -1, "msg": "Free Api Limit: 1 request/second."}),
+            web.json_response({"code": 0, "data": VIDEO_DATA}),
+        ]
+        result, browser, received = asyncio.run(_get_video_data(responses))
+
+        assert result == VIDEO_DATA
+        assert browser.clearance_count == 1
+        assert len(received) == 2
+
+    @pytest.mark.parametrize(
+        ("msg", "expected_error"),
+        [("Url parsing is failed! Please check url.", URLParsingError), ("Something else", TikWMAPIError)],
+    )
+    def test_api_errors(self, msg: str, expected_error: type[Exception]) -> None:
+        result, _, _ = asyncio.run(_get_video_data([web.json_response({"code": -1, "msg": msg})]))
+
+        assert isinstance(result, expected_error)
+
+
+class TestGetResponseData:
+    """Tests for get_response_data(), which is shared with the responses captured from the browser."""
+
+    def test_returns_data(self) -> None:
+        assert get_response_data({"code": 0, "msg": "success", "data": VIDEO_DATA}) == VIDEO_DATA
+
+    def test_rate_limited_returns_none(self) -> None:
+        assert get_response_data({"code": -1, "msg": "Free Api Limit: 1 request/second."}) is None
+
+    def test_url_parsing_failed(self) -> None:
+        with pytest.raises(URLParsingError):
+            get_response_data({"code": -1, "msg": "Url parsing is failed! Please check url."})
+
+    def test_missing_data_is_an_error(self) -> None:
+        with pytest.raises(TikWMAPIError):
+            get_response_data({"code": 0, "msg": "success"})
+
+
+class TestGetDownloadSource:
+    """Tests for get_download_source()."""
+
+    def test_original_quality_with_its_size(self) -> None:
+        assert get_download_source({"hdplay": "/hd.mp4", "hd_size": 2048, "play": "/sd.mp4", "size": 1024}) == ("/hd.mp4", 2048.0)
+
+    def test_original_quality_never_takes_other_size(self) -> None:
+        """Without `hd_size`, the size of the other quality would be wrong for the original quality link."""
+        assert get_download_source({"hdplay": "/hd.mp4", "play": "/sd.mp4", "size": 1024}) == ("/hd.mp4", None)
+
+    def test_falls_back_to_other_quality_with_its_size(self) -> None:
+        assert get_download_source({"hdplay": "", "hd_size": 2048, "play": "/sd.mp4", "size": 1024}) == ("/sd.mp4", 1024.0)
@@ -0,0 +1,81 @@
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from tikorgzo.core.video.date_filter import UploadDateFilter, parse_upload_date_bound
+from tikorgzo.core.video.index import DownloadIndex
+from tikorgzo.core.video.model import Video, VideoOptions
+from tikorgzo.exceptions import UploadDateOutOfRangeError, VideoIDExtractionError
+
+# Uploaded on 2022-07-23 06:50:29 UTC
+VIDEO_ID = 7123456789109876543
+VIDEO_LINK = f"https://www.tiktok.com/@username/video/{VIDEO_ID}"
+# Uploaded on 2021-09-16 UTC
+OLDER_VIDEO_ID = 7008394767466467329
+SHORT_LINK = "https://vt.tiktok.com/ZSabcdef/"
+
+
+class TestParseUploadDateBound:
+    """Tests for parse_upload_date_bound()."""
+
+    def test_plain_date_is_utc_midnight(self) -> None:
+        assert parse_upload_date_bound("2022-07-23") == datetime(2022, 7, 23, tzinfo=UTC)
+
+    def test_plain_until_date_includes_whole_day(self) -> None:
+        assert parse_upload_date_bound("2022-07-23", is_until=True) == datetime(2022, 7, 24, tzinfo=UTC)
+
+    def test_datetime_without_timezone_is_utc(self) -> None:
+        assert parse_upload_date_bound("2022-07-23T06:00") == datetime(2022, 7, 23, 6, tzinfo=UTC)
+
+    def test_relative_days(self) -> None:
+        now = datetime(2022, 7, 30, tzinfo=UTC)
+        assert parse_upload_date_bound("7d", now=now) == now - timedelta(days=7)
+
+    def test_invalid_value_raises(self) -> None:
+        with pytest.raises(ValueError, match="Invalid isoformat"):
+            parse_upload_date_bound("last week")
+
+
+class TestUploadDateFilter:
+    """Tests for UploadDateFilter."""
+
+    def test_no_values_means_no_filter(self) -> None:
+        assert UploadDateFilter.from_values(None, None) is None
+
+    def test_contains(self) -> None:
+        date_filter = UploadDateFilter.from_values("2022-07-23", "2022-07-23")
+        assert date_filter is not None
+
+        assert date_filter.contains(VIDEO_ID)
+        assert not date_filter.contains(OLDER_VIDEO_ID)
+
+    def test_open_ended_ranges(self) -> None:
+        assert UploadDateFilter(since=datetime(2022, 1, 1, tzinfo=UTC)).contains(VIDEO_ID)
+        assert not UploadDateFilter(until=datetime(2022, 1, 1, tzinfo=UTC)).contains(VIDEO_ID)
+
+    def test_filter_video_links_keeps_unknown_ids(self) -> None:
+        date_filter = UploadDateFilter(since=datetime(2022, 1, 1, tzinfo=UTC))
+        video_links = [VIDEO_LINK, str(OLDER_VIDEO_ID), SHORT_LINK]
+
+        assert date_filter.filter_video_links(video_links) == [VIDEO_LINK, SHORT_LINK]
+        assert date_filter.skipped_count == 1
+
+    def test_oversized_video_id_is_skipped_on_its_own(self, tmp_path: Path) -> None:
+        """A link with a number too large to be a video ID shouldn't fail the batch it's in."""
+        date_filter = UploadDateFilter(since=datetime(2022, 1, 1, tzinfo=UTC))
+        oversized_link = "https://www.tiktok.com/@username/video/" + "9" * 40
+
+        assert date_filter.filter_video_links([VIDEO_LINK, oversized_link]) == [VIDEO_LINK, oversized_link]
+
+        with pytest.raises(VideoIDExtractionError):
+            Video(oversized_link, VideoOptions(download_index=DownloadIndex(str(tmp_path)), date_filter=date_filter))
+
+    def test_video_outside_range_is_rejected(self, tmp_path: Path) -> None:
+        options = VideoOptions(
+            download_index=DownloadIndex(str(tmp_path)),
+            date_filter=UploadDateFilter(until=datetime(2022, 1, 1, tzinfo=UTC)),
+        )
+
+        with pytest.raises(UploadDateOutOfRangeError):
+            Video(VIDEO_LINK, options)
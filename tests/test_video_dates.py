@@ -0,0 +1,25 @@
+from datetime import UTC, datetime
+
+from tikorgzo.core.video.helpers import get_date, get_dates, get_timestamps
+
+VIDEO_ID = 7123456789109876543
+
+
+class TestVideoDates:
+    """Tests for decoding the upload dates from video IDs."""
+
+    def test_get_date(self) -> None:
+        assert get_date(VIDEO_ID) == datetime.fromtimestamp(1658559029, tz=UTC)
+
+    def test_get_date_of_small_video_id(self) -> None:
+        """IDs with leading zero bits should decode the same as if they were zero-padded."""
+        assert get_date(1 << 32) == datetime.fromtimestamp(1, tz=UTC)
+
+    def test_batch_matches_single(self) -> None:
+        video_ids = [VIDEO_ID, 7023456789109876544, 6900000000000000000, 1 << 32]
+
+        assert get_dates(video_ids) == [get_date(video_id) for video_id in video_ids]
+        assert list(get_timestamps(video_ids)) == [int(get_date(video_id).timestamp()) for video_id in video_ids]
+
+    def test_empty_batch(self) -> None:
+        assert get_dates([]) == []
@@ -0,0 +1,83 @@
+import gzip
+from pathlib import Path
+
+from tikorgzo.app_functions import deduplicate_video_links, extract_video_links
+from tikorgzo.core.video.dedup import VideoIDSet, VideoLinkDeduplicator
+
+VIDEO_ID = 7123456789109876543
+VIDEO_LINK = f"https://www.tiktok.com/@username/video/{VIDEO_ID}"
+
+
+class TestVideoIDSet:
+    """Tests for VideoIDSet."""
+
+    def test_add_and_contains(self) -> None:
+        video_ids = VideoIDSet()
+
+        assert video_ids.add(VIDEO_ID)
+        assert not video_ids.add(VIDEO_ID)
+        assert VIDEO_ID in video_ids
+        assert 7999999999999999999 not in video_ids
+        assert len(video_ids) == 1
+
+    def test_grows_past_initial_capacity(self) -> None:
+        video_ids = VideoIDSet(capacity=4)
+        added = [VIDEO_ID + i * 4096 for i in range(1000)]
+
+        assert all(video_ids.add(video_id) for video_id in added)
+        assert all(video_id in video_ids for video_id in added)
+        assert len(video_ids) == len(added)
+
+    def test_ids_outside_table_range(self) -> None:
+        """Zero marks an empty slot, so it (and IDs beyond 64 bits) should be kept separately."""
+        video_ids = VideoIDSet()
+
+        assert video_ids.add(0)
+        assert video_ids.add(1 << 64)
+        assert not video_ids.add(0)
+        assert 0 in video_ids
+        assert 1 << 64 in video_ids
+        assert len(video_ids) == 2
+
+
+class TestVideoLinkDeduplicator:
+    """Tests for VideoLinkDeduplicator."""
+
+    def test_same_video_in_different_forms(self) -> None:
+        deduplicator = VideoLinkDeduplicator()
+
+        assert deduplicator.is_new(VIDEO_LINK)
+        assert not deduplicator.is_new(f"{VIDEO_LINK}?is_from_webapp=1")
+        assert not deduplicator.is_new(str(VIDEO_ID))
+
+    def test_short_links_compared_as_strings(self) -> None:
+        deduplicator = VideoLinkDeduplicator()
+
+        assert deduplicator.is_new("https://vt.tiktok.com/ZSabcdef/")
+        assert not deduplicator.is_new("https://vt.tiktok.com/ZSabcdef")
+        assert deduplicator.is_new("https://vt.tiktok.com/ZSghijkl/")
+
+    def test_deduplicate_video_links_keeps_order(self) -> None:
+        video_links = [VIDEO_LINK, "7023456789109876544", str(VIDEO_ID)]
+
+        assert list(deduplicate_video_links(video_links, VideoLinkDeduplicator())) == [VIDEO_LINK, "7023456789109876544"]
+
+
+class TestExtractVideoLinks:
+    """Tests for reading the video links from a file."""
+
+    def test_reads_plain_file(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "links.txt"
+        file_path.write_text(f"{VIDEO_LINK}\n\n  7023456789109876544  \n", encoding="utf-8")
+
+        assert list(extract_video_links(str(file_path), [])) == [VIDEO_LINK, "7023456789109876544"]
+
+    def test_reads_gzipped_file(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "links.txt.gz"
+        with gzip.open(file_path, "wt", encoding="utf-8") as f:
+            f.write(f"{VIDEO_LINK}\n7023456789109876544\n")
+
+        assert list(extract_video_links(str(file_path), [])) == [VIDEO_LINK, "7023456789109876544"]
+
+    def test_links_from_args(self) -> None:
+        assert list(extract_video_links(None, [VIDEO_LINK])) == [VIDEO_LINK]
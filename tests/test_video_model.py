@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+
+from tikorgzo.core.video.index import DownloadIndex
+from tikorgzo.core.video.model import Video, VideoOptions
+from tikorgzo.exceptions import InvalidVideoLinkError, VideoFileAlreadyExistsError
+
+VIDEO_ID = 7123456789109876543
+VIDEO_LINK = f"https://www.tiktok.com/@username/video/{VIDEO_ID}"
+
+
+# Fixtures
+@pytest.fixture
+def options(tmp_path: Path) -> VideoOptions:
+    download_index = DownloadIndex(str(tmp_path))
+    download_index.build()
+    return VideoOptions(download_index=download_index)
+
+
+class TestVideo:
+    """Tests for the compact, lazily prepared Video."""
+
+    def test_has_no_instance_dict(self, options: VideoOptions) -> None:
+        assert not hasattr(Video(VIDEO_LINK, options), "__dict__")
+
+    def test_parses_full_link_on_construction(self, options: VideoOptions) -> None:
+        video = Video(VIDEO_LINK, options)
+
+        assert video.is_resolved
+        assert video.video_id == VIDEO_ID
+        assert video.username == "username"
+        assert video.date.year == 2022
+
+    def test_output_paths_are_deferred_until_prepared(self, options: VideoOptions, tmp_path: Path) -> None:
+        video = Video(VIDEO_LINK, options)
+
+        assert video.output_file_dir is None
+        assert not (tmp_path / "username").exists()
+
+        video.prepare()
+
+        assert video.output_file_path == tmp_path / "username" / f"{VIDEO_ID}.mp4"
+        assert video.output_file_dir == tmp_path / "username"
+        assert video.output_file_dir.is_dir()
+
+    def test_short_link_is_not_resolved_on_construction(self, options: VideoOptions) -> None:
+        video = Video("https://vt.tiktok.com/ZSabcdef/", options)
+
+        assert not video.is_resolved
+        assert video.video_link == "https://vt.tiktok.com/ZSabcdef/"
+
+    def test_already_downloaded_video_is_rejected(self, tmp_path: Path) -> None:
+        (tmp_path / "username").mkdir()
+        (tmp_path / "username" / f"{VIDEO_ID}.mp4").touch()
+        download_index = DownloadIndex(str(tmp_path))
+
+        with pytest.raises(VideoFileAlreadyExistsError):
+            Video(VIDEO_LINK, VideoOptions(download_index=download_index))
+
+    def test_invalid_link_is_rejected(self, options: VideoOptions) -> None:
+        with pytest.raises(InvalidVideoLinkError):
+            Video("not a link", options)
+
+    def test_file_size(self, options: VideoOptions) -> None:
+        video = Video(VIDEO_LINK, options)
+        video.file_size = 2048.0
+
+        assert video.file_size.get() == 2048.0
+        assert video.file_size.get(formatted=True) == "2.00 KB"
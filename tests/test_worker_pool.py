@@ -0,0 +1,71 @@
+import asyncio
+from contextlib import aclosing
+
+from tikorgzo.core.worker_pool.model import WorkerPool
+
+
+class ConcurrencyTracker:
+    """Coroutine function that records how many calls are running at the same time."""
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, item: int) -> int:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.001)
+        self.running -= 1
+
+        if item == 3:
+            raise ValueError(item)
+        return item * 2
+
+
+async def _collect(pool: WorkerPool, items: list[int]) -> list[tuple[int, int | Exception]]:
+    return [entry async for entry in pool.imap(items)]
+
+
+class TestWorkerPool:
+    """Tests for WorkerPool."""
+
+    def test_all_items_are_processed(self) -> None:
+        results = asyncio.run(_collect(WorkerPool(ConcurrencyTracker(), 4), list(range(50))))
+
+        successful = {item: result for item, result in results if not isinstance(result, Exception)}
+        assert len(results) == 50
+        assert successful == {item: item * 2 for item in range(50) if item != 3}
+
+    def test_exceptions_are_emitted_as_results(self) -> None:
+        results = asyncio.run(_collect(WorkerPool(ConcurrencyTracker(), 4), [3]))
+
+        assert len(results) == 1
+        assert isinstance(results[0][1], ValueError)
+
+    def test_concurrency_is_bounded_by_worker_count(self) -> None:
+        tracker = ConcurrencyTracker()
+        asyncio.run(_collect(WorkerPool(tracker, 3), list(range(30))))
+
+        assert tracker.max_running == 3
+
+    def test_empty_items(self) -> None:
+        assert asyncio.run(_collect(WorkerPool(ConcurrencyTracker(), 3), [])) == []
+
+    def test_imap_queue_stops_at_sentinel(self) -> None:
+        async def run() -> list[tuple[int, int | Exception]]:
+            queue: asyncio.Queue[int | None] = asyncio.Queue()
+            for item in [1, 2, None]:
+                queue.put_nowait(item)
+            return [entry async for entry in WorkerPool(ConcurrencyTracker(), 2).imap_queue(queue)]
+
+        assert sorted(asyncio.run(run())) == [(1, 2), (2, 4)]
+
+    def test_breaking_early_cancels_workers(self) -> None:
+        async def run() -> set[asyncio.Task]:
+            async with aclosing(WorkerPool(ConcurrencyTracker(), 2).imap(range(1000))) as results:
+                async for _ in results:
+                    break
+            await asyncio.sleep(0)
+            return {task for task in asyncio.all_tasks() if task is not asyncio.current_task()}
+
+        assert asyncio.run(run()) == set()